@@ -0,0 +1,59 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from sims4communitylib.enums.enumtypes.int_enum import CommonEnumIntBase
+from sims4communitylib.enums.enumtypes.string_enum import CommonEnumStringBase
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_benchmark_service import CommonBenchmarkService
+
+
+# noinspection PyMissingOrEmptyDocstring
+class BenchmarkIntEnum(CommonEnumIntBase):
+    VALUE_ONE = 1
+    VALUE_TWO = 2
+    VALUE_THREE = 3
+    VALUE_FOUR = 4
+    VALUE_FIVE = 5
+    VALUE_SIX = 6
+    VALUE_SEVEN = 7
+    VALUE_EIGHT = 8
+
+
+# noinspection PyMissingOrEmptyDocstring
+class BenchmarkStringEnum(CommonEnumStringBase):
+    VALUE_ONE = 'one'
+    VALUE_TWO = 'two'
+    VALUE_THREE = 'three'
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonBenchmarkService.benchmark_class(ModInfo.get_identity().name)
+class CommonEnumBenchmarks:
+    @staticmethod
+    @CommonBenchmarkService.benchmark(1)
+    @CommonBenchmarkService.benchmark(8)
+    @CommonBenchmarkService.benchmark('VALUE_EIGHT')
+    def int_enum_lookup(value):
+        BenchmarkIntEnum(value)
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark('three')
+    def string_enum_lookup(value):
+        BenchmarkStringEnum(value)
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark()
+    def int_enum_items():
+        BenchmarkIntEnum.items()
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark()
+    def enum_class_creation():
+        class _CreatedEnum(CommonEnumIntBase):
+            VALUE_ONE = 1
+            VALUE_TWO = 2
+            VALUE_THREE = 3
@@ -0,0 +1,29 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_benchmark_service import CommonBenchmarkService
+from sims4communitylib.utils.common_collection_utils import CommonCollectionUtils
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonBenchmarkService.benchmark_class(ModInfo.get_identity().name)
+class CommonCollectionUtilsBenchmarks:
+    @staticmethod
+    @CommonBenchmarkService.benchmark(tuple(range(100)), (1000, 2000), (99,))
+    def intersects(list_one, *list_items):
+        CommonCollectionUtils.intersects(list_one, *list_items)
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark([1, 2, 3, 4, 5, 6], 3)
+    def create_possible_combinations(items, combination_length: int):
+        CommonCollectionUtils.create_possible_combinations(items, combination_length)
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark([[1, [2, 3]], (4, [5, [6, 7]]), 8])
+    def flatten(to_flatten):
+        CommonCollectionUtils.flatten(to_flatten)
@@ -0,0 +1,42 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_benchmark_service import CommonBenchmarkService
+from sims4communitylib.utils.common_function_utils import CommonFunctionUtils
+
+
+def _true_predicate(*_, **__) -> bool:
+    return True
+
+
+def _false_predicate(*_, **__) -> bool:
+    return False
+
+
+_ALL_PREDICATES = CommonFunctionUtils.run_predicates_as_one((_true_predicate, _true_predicate, _false_predicate), all_must_pass=True)
+_REVERSED_PREDICATE = CommonFunctionUtils.run_predicate_with_reversed_result(_true_predicate)
+_WITH_ARGUMENTS = CommonFunctionUtils.run_with_arguments(_true_predicate, 1, 2, three=3)
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonBenchmarkService.benchmark_class(ModInfo.get_identity().name)
+class CommonFunctionUtilsBenchmarks:
+    @staticmethod
+    @CommonBenchmarkService.benchmark()
+    def run_predicates_as_one():
+        _ALL_PREDICATES(1, 2)
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark()
+    def run_predicate_with_reversed_result():
+        _REVERSED_PREDICATE(1, 2)
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark()
+    def run_with_arguments():
+        _WITH_ARGUMENTS(4)
@@ -0,0 +1,43 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_benchmark_service import CommonBenchmarkService
+from sims4communitylib.utils.common_log_registry import CommonLog
+
+_DISABLED_LOG = CommonLog(ModInfo.get_identity().name, 's4cl_disabled_log_benchmark')
+_ROWS = tuple(range(25))
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonBenchmarkService.benchmark_class(ModInfo.get_identity().name)
+class CommonLogBenchmarks:
+    @staticmethod
+    @CommonBenchmarkService.benchmark('Household Name')
+    def disabled_debug_formatted_beforehand(household_name: str):
+        _DISABLED_LOG.debug('Checking household \'{}\' for match.'.format(household_name))
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark('Household Name')
+    def disabled_debug_with_arguments(household_name: str):
+        _DISABLED_LOG.debug('Checking household \'{}\' for match.', household_name)
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark(_ROWS)
+    def disabled_format_info_with_message(rows):
+        _DISABLED_LOG.format_info_with_message('Adding rows.', page=1, rows=rows)
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark(_ROWS)
+    def disabled_format_with_expensive_arguments(rows):
+        _DISABLED_LOG.format_with_message('Adding rows.', rows=[str(row) for row in rows])
+
+    @staticmethod
+    @CommonBenchmarkService.benchmark(_ROWS)
+    def disabled_is_enabled_guard(rows):
+        if _DISABLED_LOG.is_enabled():
+            _DISABLED_LOG.format_with_message('Adding rows.', rows=[str(row) for row in rows])
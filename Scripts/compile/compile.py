@@ -5,7 +5,18 @@ https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
+import argparse
 from Utilities.compiler import compile_module
 
-compile_module(root='..\\Release\\Sims4CommunityLib', mod_scripts_folder='.', include_folders=('sims4communitylib',), mod_name='sims4communitylib')
-compile_module(root='..\\Release\\Sims4CommunityLibTests', mod_scripts_folder='.', include_folders=('tests',), mod_name='sims4communitylib_tests')
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compile the Sims 4 Community Library script archives.')
+    build_mode_group = parser.add_mutually_exclusive_group()
+    build_mode_group.add_argument('-i', action='store_true', dest='incremental', help='only recompile modules changed since the previous build')
+    build_mode_group.add_argument('-p', nargs='?', type=int, metavar='N', const=0, default=None, dest='processes', help='byte-compile in N processes (default one per CPU) and build a reproducible archive')
+    args = parser.parse_args()
+    parallel = args.processes is not None
+    # The incremental and parallel builds return False when a module failed to compile.
+    library_built = compile_module(root='..\\Release\\Sims4CommunityLib', mod_scripts_folder='.', include_folders=('sims4communitylib',), mod_name='sims4communitylib', incremental=args.incremental, parallel=parallel, processes=args.processes or None)
+    tests_built = compile_module(root='..\\Release\\Sims4CommunityLibTests', mod_scripts_folder='.', include_folders=('tests',), mod_name='sims4communitylib_tests', incremental=args.incremental, parallel=parallel, processes=args.processes or None)
+    if library_built is False or tests_built is False:
+        exit(1)
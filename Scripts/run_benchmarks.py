@@ -0,0 +1,27 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+# noinspection PyUnresolvedReferences
+import benchmarks.enums.common_enum_benchmarks
+# noinspection PyUnresolvedReferences
+import benchmarks.utils.common_collection_utils_benchmarks
+# noinspection PyUnresolvedReferences
+import benchmarks.utils.common_function_utils_benchmarks
+# noinspection PyUnresolvedReferences
+import benchmarks.utils.common_log_benchmarks
+import argparse
+from sims4communitylib.testing.common_benchmark_service import CommonBenchmarkService
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the Sims 4 Community Library benchmarks.')
+    parser.add_argument('class_names', nargs='*', metavar='CLASS_NAME', help='names of the benchmark classes to run (default all)')
+    parser.add_argument('-b', metavar='FILENAME', default='benchmark_baseline.json', dest='baseline_file', help='baseline JSON file to compare against, created if missing (default benchmark_baseline.json)')
+    parser.add_argument('-u', action='store_true', dest='update_baseline', help='store the results of this run in the baseline file')
+    parser.add_argument('-t', type=float, metavar='PERCENT', default=10.0, dest='threshold', help='flag benchmarks whose median is slower than the baseline by more than PERCENT (default 10)')
+    args = parser.parse_args()
+    no_regressions = CommonBenchmarkService.get().run_benchmarks(*args.class_names, baseline_file_path=args.baseline_file, update_baseline=args.update_baseline, regression_threshold=args.threshold / 100)
+    exit(0 if no_regressions else 1)
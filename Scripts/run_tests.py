@@ -15,6 +15,46 @@ import tests.enums.enumtypes.string_enum_tests
 import tests.enums.enumtypes.general_enum_tests
 # noinspection PyUnresolvedReferences
 import tests.utils.common_collection_utils_tests
+# noinspection PyUnresolvedReferences
+import tests.dialogs.common_dialog_row_pager_tests
+# noinspection PyUnresolvedReferences
+import tests.events.common_event_registry_tests
+# noinspection PyUnresolvedReferences
+import tests.events.common_deferred_event_queue_tests
+# noinspection PyUnresolvedReferences
+import tests.events.common_zone_load_profiler_tests
+# noinspection PyUnresolvedReferences
+import tests.events.common_sims_loaded_event_collector_tests
+# noinspection PyUnresolvedReferences
+import tests.persistence.common_data_store_tests
+# noinspection PyUnresolvedReferences
+import tests.persistence.common_data_store_service_tests
+# noinspection PyUnresolvedReferences
+import tests.utils.common_log_rotation_service_tests
+# noinspection PyUnresolvedReferences
+import tests.utils.common_log_buffer_tests
+# noinspection PyUnresolvedReferences
+import tests.classes.common_spatial_grid_tests
+# noinspection PyUnresolvedReferences
+import tests.classes.common_object_index_tests
+import argparse
 from sims4communitylib.testing.common_test_service import CommonTestService
+from sims4communitylib.testing.common_test_runner import CommonTestRunner
 
-CommonTestService.get().run_tests()
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the Sims 4 Community Library tests.')
+    parser.add_argument('class_names', nargs='*', metavar='CLASS_NAME', help='names of the test classes to run (default all)')
+    parser.add_argument('-p', nargs='?', type=int, const=0, default=None, metavar='N', dest='processes', help='run test classes in parallel across N processes (default number of CPUs)')
+    parser.add_argument('-j', metavar='FILENAME', default=None, dest='json_report', help='parallel only: write a JSON report with timings, also used to run the slowest classes first')
+    parser.add_argument('-x', metavar='FILENAME', default=None, dest='junit_report', help='parallel only: write a JUnit XML report with timings')
+    args = parser.parse_args()
+    class_names = tuple([class_name.lower() for class_name in args.class_names])
+    unknown_class_names = [class_name for (class_name, lowered_class_name) in zip(args.class_names, class_names) if lowered_class_name not in CommonTestService.get().all_tests]
+    if unknown_class_names:
+        print('Unknown test classes: {} (known test classes: {})'.format(', '.join(unknown_class_names), ', '.join(sorted(CommonTestService.get().all_tests.keys()))))
+        exit(1)
+    if args.processes is None:
+        CommonTestService.get().run_tests(*class_names)
+    else:
+        all_succeeded = CommonTestRunner(max_processes=args.processes or None).run(*class_names, json_report_file_path=args.json_report, junit_report_file_path=args.junit_report)
+        exit(0 if all_succeeded else 1)
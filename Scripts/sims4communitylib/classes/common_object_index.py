@@ -0,0 +1,141 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Dict, Iterable, List, Set, Tuple, Type, Union
+
+
+class CommonObjectIndex:
+    """
+        An index of object identifiers by the definition, the tags and the type of each object.
+
+        Each lookup goes straight to the set of objects with the definition, tag or type, so it takes time proportional to the objects found rather than to all objects.
+        A lookup by type includes the objects of its subclasses, the matching types are worked out once and remembered until an object of a new type is added.
+
+        Example:
+
+        object_index = CommonObjectIndex()
+        object_index.add(object_id, definition_id, tags, type(game_object))
+        bed_ids = object_index.get_object_ids_by_tag(CommonGameTag.FUNC_BED)
+    """
+    def __init__(self):
+        self._object_ids_by_definition_id: Dict[int, Set[int]] = dict()
+        self._object_ids_by_tag: Dict[int, Set[int]] = dict()
+        self._object_ids_by_type: Dict[type, Set[int]] = dict()
+        self._matching_types: Dict[type, Tuple[type, ...]] = dict()
+        self._keys_by_object_id: Dict[int, Tuple[int, Tuple[int, ...], type]] = dict()
+
+    def add(self, object_id: int, definition_id: int, tags: Iterable[int], object_type: type):
+        """
+            Add an object, replacing it if it was already added.
+        :param object_id: The identifier of the object.
+        :param definition_id: The identifier of the definition of the object.
+        :param tags: The tags of the object.
+        :param object_type: The type of the object.
+        """
+        if object_id in self._keys_by_object_id:
+            self.remove(object_id)
+        tags = tuple(set([int(tag) for tag in tags]))
+        self._object_ids_by_definition_id.setdefault(definition_id, set()).add(object_id)
+        for tag in tags:
+            self._object_ids_by_tag.setdefault(tag, set()).add(object_id)
+        if object_type not in self._object_ids_by_type:
+            self._object_ids_by_type[object_type] = set()
+            self._matching_types.clear()
+        self._object_ids_by_type[object_type].add(object_id)
+        self._keys_by_object_id[object_id] = (definition_id, tags, object_type)
+
+    def remove(self, object_id: int) -> bool:
+        """
+            Remove an object.
+        :param object_id: The identifier of the object.
+        :return: True if the object was removed, False if it was not in the index.
+        """
+        keys = self._keys_by_object_id.pop(object_id, None)
+        if keys is None:
+            return False
+        (definition_id, tags, object_type) = keys
+        CommonObjectIndex._discard(self._object_ids_by_definition_id, definition_id, object_id)
+        for tag in tags:
+            CommonObjectIndex._discard(self._object_ids_by_tag, tag, object_id)
+        # The type is kept even when it has no objects left, so the remembered matching types stay valid.
+        self._object_ids_by_type[object_type].discard(object_id)
+        return True
+
+    def clear(self):
+        """
+            Remove every object.
+        """
+        self._object_ids_by_definition_id.clear()
+        self._object_ids_by_tag.clear()
+        self._object_ids_by_type.clear()
+        self._matching_types.clear()
+        self._keys_by_object_id.clear()
+
+    def get_object_ids_by_definition_id(self, definition_id: int) -> Set[int]:
+        """
+            Retrieve the objects with a definition.
+        :param definition_id: The identifier of the definition.
+        :return: A collection of object identifiers.
+        """
+        return set(self._object_ids_by_definition_id.get(definition_id, ()))
+
+    def get_object_ids_by_tag(self, tag: int) -> Set[int]:
+        """
+            Retrieve the objects with a tag.
+        :param tag: The tag, such as a CommonGameTag.
+        :return: A collection of object identifiers.
+        """
+        return set(self._object_ids_by_tag.get(int(tag), ()))
+
+    def get_object_ids_by_tags(self, tags: Iterable[int], match_all: bool=False) -> Set[int]:
+        """
+            Retrieve the objects with any or all of a collection of tags.
+        :param tags: The tags, such as CommonGameTag values.
+        :param match_all: If True, objects must have all of the tags. If False, objects must have at least one of the tags.
+        :return: A collection of object identifiers.
+        """
+        tagged_object_ids: List[Set[int]] = [self._object_ids_by_tag.get(int(tag), set()) for tag in tags]
+        if not tagged_object_ids:
+            return set()
+        if match_all:
+            # Start from the smallest set, so the work done is bounded by it.
+            tagged_object_ids.sort(key=len)
+            return tagged_object_ids[0].intersection(*tagged_object_ids[1:])
+        return set().union(*tagged_object_ids)
+
+    def get_object_ids_by_type(self, object_type: Union[type, Type], include_subclasses: bool=True) -> Set[int]:
+        """
+            Retrieve the objects of a type.
+        :param object_type: The type.
+        :param include_subclasses: If True, objects of a subclass of the type are included.
+        :return: A collection of object identifiers.
+        """
+        if not include_subclasses:
+            return set(self._object_ids_by_type.get(object_type, ()))
+        matching_types = self._matching_types.get(object_type, None)
+        if matching_types is None:
+            matching_types = tuple([indexed_type for indexed_type in self._object_ids_by_type.keys() if issubclass(indexed_type, object_type)])
+            self._matching_types[object_type] = matching_types
+        return set().union(*[self._object_ids_by_type[matching_type] for matching_type in matching_types])
+
+    @staticmethod
+    def _discard(object_ids_by_key: Dict[int, Set[int]], key: int, object_id: int):
+        object_ids = object_ids_by_key.get(key, None)
+        if object_ids is None:
+            return
+        object_ids.discard(object_id)
+        if not object_ids:
+            del object_ids_by_key[key]
+
+    def __len__(self) -> int:
+        return len(self._keys_by_object_id)
+
+    def __contains__(self, object_id: int) -> bool:
+        return object_id in self._keys_by_object_id
+
+    def __str__(self):
+        return 'CommonObjectIndex Objects: {} Definitions: {} Tags: {} Types: {}'.format(len(self._keys_by_object_id), len(self._object_ids_by_definition_id), len(self._object_ids_by_tag), len(self._object_ids_by_type))
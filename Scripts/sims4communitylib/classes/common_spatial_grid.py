@@ -0,0 +1,210 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import heapq
+import math
+from typing import Dict, Iterator, List, Set, Tuple, Union
+
+
+class CommonSpatialGrid:
+    """
+        A uniform grid of square cells that indexes items by their position on the ground (The x and z coordinates), for finding the items near a position without checking every item.
+
+        Moving an item only touches the cells it moved between, so the grid can be kept up to date by updating the items that moved.
+        A query only looks at the cells that overlap the area being searched, so it takes time proportional to the items near the position rather than all items.
+        The cell size should be around the radius that is usually searched, much smaller cells means more cells to look at and much bigger cells means more items to check.
+
+        Example:
+
+        grid = CommonSpatialGrid(cell_size=8.0)
+        grid.update(sim_id, position.x, position.z)
+        nearby_sim_ids = [sim_id for (sim_id, distance) in grid.get_in_radius(position.x, position.z, 10.0)]
+    """
+    def __init__(self, cell_size: float=8.0):
+        """
+            Create an empty spatial grid.
+        :param cell_size: The width and depth of each cell.
+        """
+        if cell_size <= 0:
+            raise ValueError('cell_size must be greater than zero, but was {}'.format(cell_size))
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[int]] = dict()
+        self._positions: Dict[int, Tuple[float, float, Tuple[int, int]]] = dict()
+
+    @property
+    def cell_size(self) -> float:
+        """ The width and depth of each cell. """
+        return self._cell_size
+
+    def update(self, item_id: int, x: float, z: float):
+        """
+            Add an item or move it to a new position.
+        :param item_id: The identifier of the item.
+        :param x: The x coordinate of the item.
+        :param z: The z coordinate of the item.
+        """
+        cell = self._get_cell(x, z)
+        old_position = self._positions.get(item_id, None)
+        if old_position is not None and old_position[2] != cell:
+            self._remove_from_cell(item_id, old_position[2])
+        if old_position is None or old_position[2] != cell:
+            self._cells.setdefault(cell, set()).add(item_id)
+        self._positions[item_id] = (x, z, cell)
+
+    def remove(self, item_id: int) -> bool:
+        """
+            Remove an item.
+        :param item_id: The identifier of the item.
+        :return: True if the item was removed, False if it was not in the grid.
+        """
+        old_position = self._positions.pop(item_id, None)
+        if old_position is None:
+            return False
+        self._remove_from_cell(item_id, old_position[2])
+        return True
+
+    def clear(self):
+        """
+            Remove every item.
+        """
+        self._cells.clear()
+        self._positions.clear()
+
+    def get_position(self, item_id: int) -> Union[Tuple[float, float], None]:
+        """
+            Retrieve the position of an item.
+        :param item_id: The identifier of the item.
+        :return: The x and z coordinates of the item or None if it is not in the grid.
+        """
+        position = self._positions.get(item_id, None)
+        if position is None:
+            return None
+        return position[0], position[1]
+
+    def get_item_ids(self) -> Iterator[int]:
+        """
+            Retrieve the identifiers of every item.
+        :return: An iterator of item identifiers.
+        """
+        yield from tuple(self._positions.keys())
+
+    def get_in_radius(self, x: float, z: float, radius: float) -> List[Tuple[int, float]]:
+        """
+            Retrieve the items within a distance of a position.
+        :param x: The x coordinate of the position.
+        :param z: The z coordinate of the position.
+        :param radius: The maximum distance of an item from the position.
+        :return: A collection of item identifiers with their distance from the position, nearest first.
+        """
+        if radius < 0 or not self._positions:
+            return list()
+        radius_squared = radius * radius
+        found_items: List[Tuple[int, float]] = list()
+        for item_id in self._get_item_ids_in_rect(x - radius, z - radius, x + radius, z + radius):
+            (item_x, item_z, _) = self._positions[item_id]
+            distance_squared = (item_x - x) ** 2 + (item_z - z) ** 2
+            if distance_squared <= radius_squared:
+                found_items.append((item_id, math.sqrt(distance_squared)))
+        found_items.sort(key=lambda found_item: found_item[1])
+        return found_items
+
+    def get_in_rect(self, min_x: float, min_z: float, max_x: float, max_z: float) -> List[int]:
+        """
+            Retrieve the items within a rectangle.
+        :param min_x: The lowest x coordinate of the rectangle.
+        :param min_z: The lowest z coordinate of the rectangle.
+        :param max_x: The highest x coordinate of the rectangle.
+        :param max_z: The highest z coordinate of the rectangle.
+        :return: A collection of item identifiers.
+        """
+        found_item_ids: List[int] = list()
+        for item_id in self._get_item_ids_in_rect(min_x, min_z, max_x, max_z):
+            (item_x, item_z, _) = self._positions[item_id]
+            if min_x <= item_x <= max_x and min_z <= item_z <= max_z:
+                found_item_ids.append(item_id)
+        return found_item_ids
+
+    def get_nearest(self, x: float, z: float, count: int, max_radius: float=None) -> List[Tuple[int, float]]:
+        """
+            Retrieve the items nearest to a position.
+        :param x: The x coordinate of the position.
+        :param z: The z coordinate of the position.
+        :param count: The maximum number of items to retrieve.
+        :param max_radius: The maximum distance of an item from the position. Default is no limit.
+        :return: A collection of at most count item identifiers with their distance from the position, nearest first.
+        """
+        if count <= 0 or not self._positions:
+            return list()
+        (center_cell_x, center_cell_z) = self._get_cell(x, z)
+        (min_cell_x, min_cell_z, max_cell_x, max_cell_z) = self._get_occupied_cell_bounds()
+        # Once a ring of cells is past every occupied cell, there is nothing left to find.
+        max_ring = max(center_cell_x - min_cell_x, max_cell_x - center_cell_x, center_cell_z - min_cell_z, max_cell_z - center_cell_z)
+        if max_radius is not None:
+            max_ring = min(max_ring, int(math.ceil(max_radius / self._cell_size)))
+        candidates: List[Tuple[float, int]] = list()
+        for ring in range(max_ring + 1):
+            for cell in self._get_ring_cells(center_cell_x, center_cell_z, ring):
+                for item_id in self._cells.get(cell, ()):
+                    (item_x, item_z, _) = self._positions[item_id]
+                    distance = math.sqrt((item_x - x) ** 2 + (item_z - z) ** 2)
+                    if max_radius is None or distance <= max_radius:
+                        candidates.append((distance, item_id))
+            # Any item in the next ring is at least this far away, so the nearest items cannot change after this point.
+            if len(candidates) >= count and heapq.nsmallest(count, candidates)[-1][0] <= ring * self._cell_size:
+                break
+        return [(item_id, distance) for (distance, item_id) in heapq.nsmallest(count, candidates)]
+
+    def _get_item_ids_in_rect(self, min_x: float, min_z: float, max_x: float, max_z: float) -> Iterator[int]:
+        (min_cell_x, min_cell_z) = self._get_cell(min_x, min_z)
+        (max_cell_x, max_cell_z) = self._get_cell(max_x, max_z)
+        cell_count = (max_cell_x - min_cell_x + 1) * (max_cell_z - min_cell_z + 1)
+        if cell_count > len(self._cells):
+            # The area covers more cells than are occupied, so checking the occupied cells is quicker.
+            for ((cell_x, cell_z), item_ids) in self._cells.items():
+                if min_cell_x <= cell_x <= max_cell_x and min_cell_z <= cell_z <= max_cell_z:
+                    yield from item_ids
+            return
+        for cell_x in range(min_cell_x, max_cell_x + 1):
+            for cell_z in range(min_cell_z, max_cell_z + 1):
+                yield from self._cells.get((cell_x, cell_z), ())
+
+    @staticmethod
+    def _get_ring_cells(center_cell_x: int, center_cell_z: int, ring: int) -> Iterator[Tuple[int, int]]:
+        if ring == 0:
+            yield center_cell_x, center_cell_z
+            return
+        for cell_x in range(center_cell_x - ring, center_cell_x + ring + 1):
+            yield cell_x, center_cell_z - ring
+            yield cell_x, center_cell_z + ring
+        for cell_z in range(center_cell_z - ring + 1, center_cell_z + ring):
+            yield center_cell_x - ring, cell_z
+            yield center_cell_x + ring, cell_z
+
+    def _get_occupied_cell_bounds(self) -> Tuple[int, int, int, int]:
+        cell_xs = [cell_x for (cell_x, _) in self._cells.keys()]
+        cell_zs = [cell_z for (_, cell_z) in self._cells.keys()]
+        return min(cell_xs), min(cell_zs), max(cell_xs), max(cell_zs)
+
+    def _get_cell(self, x: float, z: float) -> Tuple[int, int]:
+        return int(math.floor(x / self._cell_size)), int(math.floor(z / self._cell_size))
+
+    def _remove_from_cell(self, item_id: int, cell: Tuple[int, int]):
+        item_ids = self._cells.get(cell, None)
+        if item_ids is None:
+            return
+        item_ids.discard(item_id)
+        if not item_ids:
+            del self._cells[cell]
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._positions
+
+    def __str__(self):
+        return 'CommonSpatialGrid Cell Size: {} Items: {} Occupied Cells: {}'.format(self._cell_size, len(self._positions), len(self._cells))
@@ -24,10 +24,10 @@ class CommonConditionalAction(HasLog):
     def try_apply(self, *_, **__) -> bool:
         """ Attempt to apply the action. """
         if self._should_apply(*_, **__):
-            self.log.debug('Applying action \'{}\'.'.format(self.__class__.__name__))
+            self.log.debug('Applying action \'{}\'.', self.__class__.__name__)
             return self._apply(*_, **__)
         else:
-            self.log.debug('Skipping action \'{}\'.'.format(self.__class__.__name__))
+            self.log.debug('Skipping action \'{}\'.', self.__class__.__name__)
         return False
 
     def _apply(self, *_, **__) -> bool:
@@ -5,14 +5,13 @@ https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-import math
-
 import sims4.commands
 from typing import Tuple, Any, Callable, Union
 
 from pprint import pformat
 from protocolbuffers.Localization_pb2 import LocalizedString
 from sims4communitylib.dialogs.common_choice_outcome import CommonChoiceOutcome
+from sims4communitylib.dialogs.utils.common_dialog_row_pager import CommonDialogRowPager
 from sims4communitylib.dialogs.utils.common_dialog_utils import CommonDialogUtils
 from sims4communitylib.enums.strings_enum import CommonStringId
 from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
@@ -86,7 +85,8 @@ class CommonChooseObjectDialog:
         if on_chosen is None:
             raise ValueError('on_chosen was None.')
 
-        if len(self._choices) == 0:
+        row_pager = self._get_row_pager()
+        if row_pager.is_empty():
             raise AssertionError('No rows have been provided. Add rows to the dialog before attempting to display it.')
 
         if page < 0:
@@ -111,56 +111,53 @@ class CommonChooseObjectDialog:
             log.format_with_message('Finished handling choice.', result=result)
             return result
 
-        number_of_rows = len(self._choices)
-        log.format(number_of_rows=number_of_rows, per_page=self._per_page)
-        if number_of_rows > self._per_page:
-            number_of_pages = math.ceil(number_of_rows / self._per_page)
-
-            if page > number_of_pages:
-                raise AssertionError('page was out of range. Number of Pages: {}, Requested Page: {}'.format(str(number_of_pages), str(page)))
-
-            start_index = (page - 1) * self._per_page
-            end_index = page * self._per_page
-            log.format(start_index=start_index, end_index=end_index)
-            current_choices = self._choices[start_index:end_index]
-            log.format(current_rows=current_choices)
-            for row in current_choices:
-                _dialog.add_row(row)
-
-            if page < number_of_pages:
-                log.format_with_message('Adding Next.', page=page, number_of_pages=number_of_pages)
-                next_choice = ObjectPickerRow(
-                    option_id=len(self._choices) + 1,
-                    name=CommonLocalizationUtils.create_localized_string(CommonStringId.NEXT),
-                    row_description=None,
-                    row_tooltip=None,
-                    icon=CommonIconUtils.load_arrow_right_icon(),
-                    tag='S4CL_NEXT'
-                )
-                _dialog.add_row(next_choice)
-            else:
-                log.format_with_message('Not adding Next.', page=page, number_of_pages=number_of_pages)
-            if page > 1:
-                log.format_with_message('Adding Previous.', page=page, number_of_pages=number_of_pages)
-                previous_choice = ObjectPickerRow(
-                    option_id=len(self._choices) + 2,
-                    name=CommonLocalizationUtils.create_localized_string(CommonStringId.PREVIOUS),
-                    row_description=None,
-                    row_tooltip=None,
-                    icon=CommonIconUtils.load_arrow_right_icon(),
-                    tag='S4CL_PREVIOUS'
-                )
-                _dialog.add_row(previous_choice)
-            else:
-                log.format_with_message('Not adding Previous.', page=page)
+        log.format(known_row_count=row_pager.known_row_count, per_page=self._per_page)
+        if row_pager.has_next_page(1):
+            if not row_pager.has_page(page):
+                raise AssertionError('page was out of range. Number of Pages: {}, Requested Page: {}'.format(str(row_pager.number_of_pages), str(page)))
+        else:
+            log.debug('Only one page of choices, ignoring the requested page.')
+            page = 1
+
+        current_choices = row_pager.get_page(page)
+        log.format(page=page, current_rows=current_choices)
+        for row in current_choices:
+            _dialog.add_row(row)
+
+        if row_pager.has_next_page(page):
+            log.format_with_message('Adding Next.', page=page, number_of_pages=row_pager.number_of_pages)
+            next_choice = ObjectPickerRow(
+                option_id=row_pager.known_row_count + 1,
+                name=CommonLocalizationUtils.create_localized_string(CommonStringId.NEXT),
+                row_description=None,
+                row_tooltip=None,
+                icon=CommonIconUtils.load_arrow_right_icon(),
+                tag='S4CL_NEXT'
+            )
+            _dialog.add_row(next_choice)
         else:
-            log.debug('Adding all choices')
-            for row in self._choices:
-                _dialog.add_row(row)
+            log.format_with_message('Not adding Next.', page=page, number_of_pages=row_pager.number_of_pages)
+        if page > 1:
+            log.format_with_message('Adding Previous.', page=page, number_of_pages=row_pager.number_of_pages)
+            previous_choice = ObjectPickerRow(
+                option_id=row_pager.known_row_count + 2,
+                name=CommonLocalizationUtils.create_localized_string(CommonStringId.PREVIOUS),
+                row_description=None,
+                row_tooltip=None,
+                icon=CommonIconUtils.load_arrow_right_icon(),
+                tag='S4CL_PREVIOUS'
+            )
+            _dialog.add_row(previous_choice)
+        else:
+            log.format_with_message('Not adding Previous.', page=page)
 
         _dialog.add_listener(_on_chosen)
         _dialog.show_dialog()
 
+    def _get_row_pager(self) -> CommonDialogRowPager:
+        # Rows may be added after creation, so the pager is created from the current choices each time the dialog is shown.
+        return CommonDialogRowPager(self._per_page, row_count=len(self._choices), row_factory=self._choices.__getitem__)
+
     @CommonExceptionHandler.catch_exceptions(ModInfo.get_identity().name, fallback_return=None)
     def _create_dialog(
         self,
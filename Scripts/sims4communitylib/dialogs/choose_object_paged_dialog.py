@@ -0,0 +1,116 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import sims4.commands
+from typing import Tuple, Any, Callable, Union, Iterator
+
+from pprint import pformat
+from protocolbuffers.Localization_pb2 import LocalizedString
+from sims4communitylib.dialogs.choose_object_dialog import CommonChooseObjectDialog
+from sims4communitylib.dialogs.common_choice_outcome import CommonChoiceOutcome
+from sims4communitylib.dialogs.utils.common_dialog_row_pager import CommonDialogRowPager
+from sims4communitylib.enums.strings_enum import CommonStringId
+from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.utils.common_icon_utils import CommonIconUtils
+from sims4communitylib.utils.localization.common_localized_string_colors import CommonLocalizedStringColor
+from sims4communitylib.utils.localization.common_localization_utils import CommonLocalizationUtils
+from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
+from ui.ui_dialog_picker import ObjectPickerRow
+
+log = CommonLogRegistry.get().register_log(ModInfo.get_identity().name, 'choose_object_paged_dialog')
+
+
+class CommonChooseObjectPagedDialog(CommonChooseObjectDialog):
+    """
+        Create a dialog that asks the player to make a choice from a very large number of rows.
+
+        Unlike CommonChooseObjectDialog, the rows are not created up front.
+        Only the rows of the page being displayed are built, and pages are cached once built, so flipping back to a page will not rebuild it.
+
+        Rows are supplied either as a generator of rows or as a row count plus a factory that creates the row at an index.
+    """
+    def __init__(
+        self,
+        title_identifier: Union[int, LocalizedString],
+        description_identifier: Union[int, LocalizedString],
+        rows: Iterator[ObjectPickerRow]=None,
+        row_count: int=None,
+        row_factory: Callable[[int], ObjectPickerRow]=None,
+        title_tokens: Tuple[Any]=(),
+        description_tokens: Tuple[Any]=(),
+        per_page: int=25
+    ):
+        """
+            Create a paged dialog for displaying a large list of objects.
+        :param title_identifier: A decimal identifier of the title text.
+        :param description_identifier: A decimal identifier of the description text.
+        :param rows: A generator of the rows to display in the dialog. Rows are only pulled from it as pages are displayed.
+        :param row_count: The total number of rows to display. Used together with row_factory.
+        :param row_factory: A function that creates the row at the specified (zero based) index. Used together with row_count.
+        :param title_tokens: Tokens to format into the title.
+        :param description_tokens: Tokens to format into the description.
+        :param per_page: The number of rows to display per page.
+        """
+        super().__init__(
+            title_identifier,
+            description_identifier,
+            tuple(),
+            title_tokens=title_tokens,
+            description_tokens=description_tokens,
+            per_page=per_page
+        )
+        self._row_pager = CommonDialogRowPager(per_page, rows=rows, row_count=row_count, row_factory=row_factory)
+
+    @CommonExceptionHandler.catch_exceptions(ModInfo.get_identity().name)
+    def add_row(self, choice: ObjectPickerRow):
+        """
+            Rows cannot be added to a paged dialog, supply them through the rows generator or the row factory instead.
+        """
+        raise AssertionError('Rows cannot be added to a paged dialog. Supply them through the rows generator or the row factory instead.')
+
+    def _get_row_pager(self) -> CommonDialogRowPager:
+        return self._row_pager
+
+
+@sims4.commands.Command('s4clib_testing.show_choose_object_paged_dialog', command_type=sims4.commands.CommandType.Live)
+def _common_testing_show_choose_object_paged_dialog(row_count: int=1000, _connection: int=None):
+    output = sims4.commands.CheatOutput(_connection)
+    output('Showing test choose object paged dialog.')
+
+    def _on_chosen(choice: str, outcome: CommonChoiceOutcome):
+        output('Chose {} with result: {}.'.format(pformat(choice), pformat(outcome)))
+
+    def _create_row(index: int) -> ObjectPickerRow:
+        return ObjectPickerRow(
+            option_id=index + 1,
+            name=CommonLocalizationUtils.create_localized_string('Value {}'.format(index + 1)),
+            row_description=CommonLocalizationUtils.create_localized_string(CommonStringId.TESTING_TEST_BUTTON_ONE),
+            row_tooltip=None,
+            icon=CommonIconUtils.load_checked_square_icon(),
+            tag='Value {}'.format(index + 1)
+        )
+
+    try:
+        # LocalizedStrings within other LocalizedStrings
+        title_tokens = (CommonLocalizationUtils.create_localized_string(CommonStringId.TESTING_SOME_TEXT_FOR_TESTING, text_color=CommonLocalizedStringColor.GREEN),)
+        description_tokens = (CommonLocalizationUtils.create_localized_string(CommonStringId.TESTING_TEST_TEXT_WITH_SIM_FIRST_AND_LAST_NAME, tokens=(CommonSimUtils.get_active_sim_info(),), text_color=CommonLocalizedStringColor.BLUE),)
+        dialog = CommonChooseObjectPagedDialog(
+            CommonStringId.TESTING_TEST_TEXT_WITH_STRING_TOKEN,
+            CommonStringId.TESTING_TEST_TEXT_WITH_STRING_TOKEN,
+            row_count=row_count,
+            row_factory=_create_row,
+            title_tokens=title_tokens,
+            description_tokens=description_tokens,
+            per_page=25
+        )
+        dialog.show(on_chosen=_on_chosen)
+    except Exception as ex:
+        log.format_error_with_message('Failed to show dialog', exception=ex)
+        output('Failed to show dialog, please locate your exception log file.')
+    output('Done showing.')
@@ -0,0 +1,154 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import math
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, Tuple, Union
+
+
+class CommonDialogRowPager:
+    """
+        Splits the rows of a dialog into pages, building each page only when it is requested.
+
+        Rows can be supplied either as an iterator (or generator) of rows or as a row count plus a factory that creates the row at an index.
+        Pages are cached once built, so moving back and forth between pages will not rebuild any rows.
+    """
+    _NO_ROW = object()
+
+    def __init__(
+        self,
+        per_page: int,
+        rows: Iterator[Any]=None,
+        row_count: int=None,
+        row_factory: Callable[[int], Any]=None
+    ):
+        """
+            Create a pager for rows.
+        :param per_page: The number of rows to display per page.
+        :param rows: An iterator of rows. Rows will only be pulled from it as pages are requested.
+        :param row_count: The total number of rows. Used together with row_factory.
+        :param row_factory: A function that creates the row at the specified (zero based) index. Used together with row_count.
+        """
+        if per_page <= 0:
+            raise AssertionError('per_page must be greater than zero.')
+        if rows is None and (row_count is None or row_factory is None):
+            raise AssertionError('Either rows or both row_count and row_factory must be provided.')
+        if row_count is not None and row_count < 0:
+            raise AssertionError('row_count cannot be less than zero.')
+        self._per_page = per_page
+        self._row_iterator = iter(rows) if rows is not None else None
+        self._row_count = row_count if rows is None else None
+        self._row_factory = row_factory
+        self._pages: Dict[int, Tuple[Any]] = dict()
+        self._next_iterator_row = CommonDialogRowPager._NO_ROW
+        self._iterator_exhausted = False
+        self._iterator_row_count = 0
+
+    @property
+    def per_page(self) -> int:
+        """ The number of rows displayed per page. """
+        return self._per_page
+
+    @property
+    def number_of_pages(self) -> Union[int, None]:
+        """
+            The total number of pages.
+        :return: The number of pages or None if the rows come from an iterator that has not been fully consumed yet.
+        """
+        if self._row_iterator is None:
+            return max(1, math.ceil(self._row_count / self._per_page))
+        if not self._iterator_exhausted:
+            return None
+        return max(1, len(self._pages))
+
+    @property
+    def known_row_count(self) -> int:
+        """
+            The number of rows known to exist.
+            This is the total row count when a row count was specified, otherwise it is the number of rows pulled from the iterator so far.
+        """
+        if self._row_iterator is None:
+            return self._row_count
+        return self._iterator_row_count
+
+    @property
+    def built_pages(self) -> Tuple[int]:
+        """ The page numbers of the pages that have been built so far. """
+        return tuple(sorted(self._pages.keys()))
+
+    def is_empty(self) -> bool:
+        """
+            Determine if there are no rows at all.
+        :return: True if there are no rows.
+        """
+        return len(self.get_page(1)) == 0
+
+    def has_page(self, page: int) -> bool:
+        """
+            Determine if a page exists.
+        :param page: The page number, starting at 1.
+        :return: True if the page contains at least one row.
+        """
+        if page < 1:
+            return False
+        if self._row_iterator is None:
+            return (page - 1) * self._per_page < self._row_count
+        self._build_iterator_pages_until(page)
+        return page in self._pages
+
+    def has_next_page(self, page: int) -> bool:
+        """
+            Determine if there is a page after the specified page.
+        :param page: The page number, starting at 1.
+        :return: True if a page exists after the specified page.
+        """
+        if self._row_iterator is None:
+            return page * self._per_page < self._row_count
+        self._build_iterator_pages_until(page)
+        return page + 1 in self._pages or (page in self._pages and not self._iterator_exhausted)
+
+    def get_page(self, page: int) -> Tuple[Any]:
+        """
+            Retrieve the rows of a page, building them if they have not been built yet.
+        :param page: The page number, starting at 1.
+        :return: The rows of the page or an empty collection if the page does not exist.
+        """
+        if page in self._pages:
+            return self._pages[page]
+        if page < 1:
+            return tuple()
+        if self._row_iterator is not None:
+            self._build_iterator_pages_until(page)
+            return self._pages.get(page, tuple())
+        start_index = (page - 1) * self._per_page
+        end_index = min(page * self._per_page, self._row_count)
+        if start_index >= end_index:
+            return tuple()
+        rows = tuple([self._row_factory(index) for index in range(start_index, end_index)])
+        self._pages[page] = rows
+        return rows
+
+    def _build_iterator_pages_until(self, page: int):
+        # Iterator rows can only be pulled in order, so every page up to the requested one must be built first.
+        while not self._iterator_exhausted and page not in self._pages:
+            self._build_next_iterator_page()
+
+    def _build_next_iterator_page(self):
+        rows = list()
+        if self._next_iterator_row is not CommonDialogRowPager._NO_ROW:
+            rows.append(self._next_iterator_row)
+            self._next_iterator_row = CommonDialogRowPager._NO_ROW
+        rows.extend(islice(self._row_iterator, self._per_page - len(rows)))
+        if not rows:
+            self._iterator_exhausted = True
+            return
+        self._iterator_row_count += len(rows)
+        self._pages[len(self._pages) + 1] = tuple(rows)
+        # Look ahead a single row to know if another page exists without building it.
+        self._next_iterator_row = next(self._row_iterator, CommonDialogRowPager._NO_ROW)
+        if self._next_iterator_row is CommonDialogRowPager._NO_ROW:
+            self._iterator_exhausted = True
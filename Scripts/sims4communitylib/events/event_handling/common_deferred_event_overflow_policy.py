@@ -0,0 +1,18 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from sims4communitylib.enums.enumtypes.int_enum import CommonEnumIntBase
+
+
+class CommonDeferredEventOverflowPolicy(CommonEnumIntBase):
+    """ What to do with an event when the deferred event queue is full. """
+    # Drop the event that has been waiting the longest to make room for the new event.
+    DROP_OLDEST = 0
+    # Drop the new event.
+    DROP_NEWEST = 1
+    # Replace the waiting event of the same type for the same handler with the new event, otherwise drop the oldest event.
+    COALESCE = 2
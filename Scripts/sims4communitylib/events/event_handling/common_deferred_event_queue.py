@@ -0,0 +1,143 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from collections import deque
+from typing import Deque, List
+from sims4communitylib.events.event_handling.common_deferred_event_overflow_policy import CommonDeferredEventOverflowPolicy
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+from sims4communitylib.events.event_handling.common_event_handler import CommonEventHandler
+from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
+from sims4communitylib.modinfo import ModInfo
+
+
+class CommonDeferredEventQueue:
+    """
+        Holds events for deferred event handlers until they are delivered in batches.
+
+        When the queue is full, the overflow policy decides which event is dropped or coalesced.
+        The queue keeps counts of what happened to the events passing through it, for spotting handlers that cannot keep up.
+    """
+    def __init__(self, max_queued_events: int=1000, overflow_policy: CommonDeferredEventOverflowPolicy=CommonDeferredEventOverflowPolicy.DROP_OLDEST, events_per_batch: int=100):
+        """
+            Create a deferred event queue.
+        :param max_queued_events: The maximum number of events waiting to be delivered.
+        :param overflow_policy: What to do with an event when the queue is full.
+        :param events_per_batch: The maximum number of events delivered in a single batch.
+        """
+        self.max_queued_events = max_queued_events
+        self.overflow_policy = overflow_policy
+        self.events_per_batch = events_per_batch
+        self._queued_events: Deque[List] = deque()
+        self.reset_metrics()
+
+    @property
+    def queue_depth(self) -> int:
+        """ The number of events waiting to be delivered. """
+        return len(self._queued_events)
+
+    @property
+    def max_queue_depth(self) -> int:
+        """ The largest number of events that have been waiting at once since the metrics were reset. """
+        return self._max_queue_depth
+
+    @property
+    def total_queued(self) -> int:
+        """ The number of events queued since the metrics were reset. """
+        return self._total_queued
+
+    @property
+    def total_delivered(self) -> int:
+        """ The number of events delivered since the metrics were reset. """
+        return self._total_delivered
+
+    @property
+    def total_dropped(self) -> int:
+        """ The number of events dropped because the queue was full since the metrics were reset. """
+        return self._total_dropped
+
+    @property
+    def total_coalesced(self) -> int:
+        """ The number of events that replaced a waiting event because the queue was full since the metrics were reset. """
+        return self._total_coalesced
+
+    def reset_metrics(self):
+        """
+            Reset the event counts, the maximum queue depth starts again from the current queue depth.
+        """
+        self._max_queue_depth = len(self._queued_events)
+        self._total_queued = 0
+        self._total_delivered = 0
+        self._total_dropped = 0
+        self._total_coalesced = 0
+
+    def queue(self, event_handler: CommonEventHandler, event: CommonEvent) -> bool:
+        """
+            Queue an event for delivery to an event handler.
+        :param event_handler: The event handler to deliver the event to.
+        :param event: The event.
+        :return: True if the event was queued or replaced a waiting event, False if it was dropped.
+        """
+        self._total_queued += 1
+        if len(self._queued_events) >= self.max_queued_events:
+            if self.overflow_policy == CommonDeferredEventOverflowPolicy.DROP_NEWEST:
+                self._total_dropped += 1
+                return False
+            if self.overflow_policy == CommonDeferredEventOverflowPolicy.COALESCE and self._coalesce(event_handler, event):
+                self._total_coalesced += 1
+                return True
+            self._total_dropped += 1
+            if not self._queued_events:
+                return False
+            self._queued_events.popleft()
+        self._queued_events.append([event_handler, event])
+        if len(self._queued_events) > self._max_queue_depth:
+            self._max_queue_depth = len(self._queued_events)
+        return True
+
+    def _coalesce(self, event_handler: CommonEventHandler, event: CommonEvent) -> bool:
+        # The newest waiting event is the most likely to describe the same thing, so search from the back.
+        event_type = type(event)
+        for queued_event in reversed(self._queued_events):
+            if queued_event[0] is event_handler and type(queued_event[1]) is event_type:
+                queued_event[1] = event
+                return True
+        return False
+
+    def deliver(self, max_events: int=None) -> int:
+        """
+            Deliver the events that have been waiting the longest.
+        :param max_events: The maximum number of events to deliver. Defaults to events_per_batch.
+        :return: The number of events delivered.
+        """
+        if max_events is None:
+            max_events = self.events_per_batch
+        delivered_count = 0
+        while self._queued_events and delivered_count < max_events:
+            (event_handler, event) = self._queued_events.popleft()
+            delivered_count += 1
+            try:
+                event_handler.handle_event(event)
+            except Exception as ex:
+                CommonExceptionHandler.log_exception(ModInfo.get_identity().name, 'Error occurred when attempting to handle deferred event type \'{}\' via event handler \'{}\''.format(type(event), str(event_handler)), exception=ex)
+        self._total_delivered += delivered_count
+        return delivered_count
+
+    def deliver_all(self) -> int:
+        """
+            Deliver every waiting event.
+        :return: The number of events delivered.
+        """
+        return self.deliver(max_events=len(self._queued_events))
+
+    def clear(self):
+        """
+            Discard every waiting event without delivering it.
+        """
+        self._queued_events.clear()
+
+    def __str__(self):
+        return 'CommonDeferredEventQueue Depth: {} Max Depth: {} Queued: {} Delivered: {} Dropped: {} Coalesced: {}'.format(self.queue_depth, self.max_queue_depth, self.total_queued, self.total_delivered, self.total_dropped, self.total_coalesced)
@@ -11,7 +11,7 @@ from typing import Callable, Any
 
 class CommonEventHandler:
     """ A handler of events. """
-    def __init__(self, mod_name: str, event_function: Callable[..., Any]):
+    def __init__(self, mod_name: str, event_function: Callable[..., Any], deferred: bool=False):
         if event_function is None:
             raise RuntimeError('Required parameter \'event_function\' required for event function from mod: {}'.format(mod_name))
         if not inspect.isfunction(event_function):
@@ -26,6 +26,7 @@ class CommonEventHandler:
         self._mod_name = mod_name
         self._event_function = event_function
         self._event_type = function_signature.parameters['event_data'].annotation
+        self._deferred = deferred
 
     @property
     def mod_name(self) -> str:
@@ -42,6 +43,11 @@ class CommonEventHandler:
         """ The class type of events this Event Handler will handle. """
         return self._event_type
 
+    @property
+    def deferred(self) -> bool:
+        """ Determine if events are queued and delivered to this Event Handler on a later zone update rather than as they happen. """
+        return self._deferred
+
     def can_handle_event(self, event) -> bool:
         """ Determine if this event handler can handle the type of the event. """
         return isinstance(event, self.event_type)
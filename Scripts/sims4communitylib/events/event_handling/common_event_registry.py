@@ -5,7 +5,9 @@ https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import List, Callable, Any
+import time
+from typing import List, Callable, Any, Dict, Type, Set, Union
+from sims4communitylib.events.event_handling.common_deferred_event_queue import CommonDeferredEventQueue
 from sims4communitylib.events.event_handling.common_event import CommonEvent
 from sims4communitylib.events.event_handling.common_event_handler import CommonEventHandler
 from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
@@ -18,34 +20,76 @@ class CommonEventRegistry(CommonService):
 
     def __init__(self):
         self._event_handlers: List[CommonEventHandler] = []
+        # The handlers of each event type that has been queried or dispatched, cleared whenever a handler is registered.
+        self._event_handlers_by_event_type: Dict[Type[CommonEvent], List[CommonEventHandler]] = dict()
+        self._deferred_events = CommonDeferredEventQueue()
+        # When set, the time taken by each event handler is added to it, keyed by the name of the event handler.
+        self._handler_times: Union[Dict[str, float], None] = None
+
+    @property
+    def deferred_events(self) -> CommonDeferredEventQueue:
+        """ The events waiting to be delivered to deferred event handlers, along with the queue limits and metrics. """
+        return self._deferred_events
 
     @staticmethod
-    def handle_events(mod_name: str):
+    def handle_events(mod_name: str, deferred: bool=False):
         """
             Decorate functions with this static method to register that function to handle an event.
 
             Note: Event functions MUST be decorated with staticmethod and must only have a single argument with the name 'event_data' (Errors will be thrown upon loading the game otherwise)
         :param mod_name: The name of the mod the class is being registered for.
+        :param deferred: If True, events will be queued and delivered in batches on the next zone updates, rather than as they happen.
+        Use this for non-urgent work, such as bookkeeping, to keep it off of the game's critical path.
+        The return value of a deferred event function is ignored.
         """
         def _wrapper(event_function):
-            CommonEventRegistry.get()._register_event_handler(mod_name, event_function)
+            CommonEventRegistry.get()._register_event_handler(mod_name, event_function, deferred=deferred)
             return event_function
         return _wrapper
 
-    def _register_event_handler(self, mod_name: str, event_function: Callable[..., Any]):
-        event_handler = CommonEventHandler(mod_name, event_function)
+    def _register_event_handler(self, mod_name: str, event_function: Callable[..., Any], deferred: bool=False):
+        event_handler = CommonEventHandler(mod_name, event_function, deferred=deferred)
         self._event_handlers.append(event_handler)
+        self._event_handlers_by_event_type.clear()
+
+    def has_handlers(self, event_type: Type[CommonEvent]) -> bool:
+        """
+            Determine if any event handlers are listening for an event type.
 
-    def dispatch(self, event: CommonEvent) -> bool:
-        """ Dispatch an event to any event handlers listening for it. """
-        event_handlers = list(self._event_handlers)
+            Use this to avoid creating an event that nobody will handle.
+        :param event_type: The class type of the event.
+        :return: True if at least one event handler will handle events of the type.
+        """
+        return len(self._get_event_handlers(event_type)) > 0
+
+    def _get_event_handlers(self, event_type: Type[CommonEvent]) -> List[CommonEventHandler]:
+        event_handlers = self._event_handlers_by_event_type.get(event_type, None)
+        if event_handlers is None:
+            event_handlers = [event_handler for event_handler in self._event_handlers if isinstance(event_handler.event_type, type) and issubclass(event_type, event_handler.event_type)]
+            self._event_handlers_by_event_type[event_type] = event_handlers
+        return event_handlers
+
+    def dispatch(self, event: CommonEvent, excluded_mod_names: Set[str]=None) -> bool:
+        """
+            Dispatch an event to any event handlers listening for it.
+        :param event: The event to dispatch.
+        :param excluded_mod_names: The event will not be sent to the event handlers of these mods.
+        :return: True if every event handler handled the event successfully.
+        """
         result = True
         try:
+            event_handlers = self._get_event_handlers(type(event))
             for event_handler in event_handlers:
-                if not event_handler.can_handle_event(event):
+                if excluded_mod_names and event_handler.mod_name in excluded_mod_names:
+                    continue
+                if event_handler.deferred:
+                    self._deferred_events.queue(event_handler, event)
                     continue
                 try:
-                    handle_result = event_handler.handle_event(event)
+                    if self._handler_times is None:
+                        handle_result = event_handler.handle_event(event)
+                    else:
+                        handle_result = self._handle_event_timed(event_handler, event)
                     if not handle_result:
                         result = False
                 except Exception as ex:
@@ -55,3 +99,21 @@ class CommonEventRegistry(CommonService):
             CommonExceptionHandler.log_exception(ModInfo.get_identity().name, 'Failed to dispatch event \'{}\''.format(event), exception=ex)
             return False
         return result
+
+    def _handle_event_timed(self, event_handler: CommonEventHandler, event: CommonEvent) -> bool:
+        handler_times = self._handler_times
+        start_time = time.perf_counter()
+        try:
+            return event_handler.handle_event(event)
+        finally:
+            handler_name = '{}: {}.{}'.format(event_handler.mod_name, event_handler.event_function.__module__, event_handler.event_function.__qualname__)
+            handler_times[handler_name] = handler_times.get(handler_name, 0.0) + time.perf_counter() - start_time
+
+    def _dispatch_deferred_events(self, deliver_all: bool=False) -> int:
+        try:
+            if deliver_all:
+                return self._deferred_events.deliver_all()
+            return self._deferred_events.deliver()
+        except Exception as ex:
+            CommonExceptionHandler.log_exception(ModInfo.get_identity().name, 'Failed to dispatch deferred events.', exception=ex)
+            return 0
@@ -27,11 +27,15 @@ class CommonInteractionEventDispatcherService(CommonService):
 
     # noinspection PyUnusedLocal
     def _on_interaction_run(self, interaction_queue: InteractionQueue, timeline, interaction: Interaction, *_, **__):
+        if not CommonEventRegistry.get().has_handlers(S4CLInteractionRunEvent):
+            return True
         if interaction is None or interaction.sim is None:
             return False
         return CommonEventRegistry.get().dispatch(S4CLInteractionRunEvent(interaction, interaction_queue))
 
     def _on_interaction_queued(self, interaction_queue: InteractionQueue, interaction: Interaction, *_, **__) -> Union[TestResult, None]:
+        if not CommonEventRegistry.get().has_handlers(S4CLInteractionQueuedEvent):
+            return None
         if interaction is None or interaction.sim is None:
             return None
         if not CommonEventRegistry.get().dispatch(S4CLInteractionQueuedEvent(interaction, interaction_queue)):
@@ -39,6 +43,8 @@ class CommonInteractionEventDispatcherService(CommonService):
         return None
 
     def _on_interaction_outcome(self, interaction: Interaction, outcome: InteractionOutcome, result: OutcomeResult):
+        if not CommonEventRegistry.get().has_handlers(S4CLInteractionOutcomeEvent):
+            return True
         if interaction.sim is None:
             return False
         return CommonEventRegistry.get().dispatch(S4CLInteractionOutcomeEvent(interaction, outcome, result))
@@ -40,6 +40,10 @@ class CommonIntervalDispatcher:
         """
         return self._minimum_milliseconds_to_dispatch
 
+    @minimum_milliseconds_to_dispatch.setter
+    def minimum_milliseconds_to_dispatch(self, milliseconds: int):
+        self._minimum_milliseconds_to_dispatch = milliseconds
+
     @property
     def mod_name(self) -> str:
         """ The name of the mod that is listening for events. """
@@ -5,15 +5,23 @@ https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
+import time
+
 from sims.occult.occult_enums import OccultType
 from sims.occult.occult_tracker import OccultTracker
 from sims.sim_info import SimInfo
 from sims.sim_spawner import SimSpawner
 from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.sim.common_sims_loaded_event_collector import CommonSimsLoadedEventCollector
 from sims4communitylib.events.sim.events.sim_changed_occult_type import S4CLSimChangedOccultTypeEvent
 from sims4communitylib.events.sim.events.sim_initialized import S4CLSimInitializedEvent
 from sims4communitylib.events.sim.events.sim_loaded import S4CLSimLoadedEvent
 from sims4communitylib.events.sim.events.sim_spawned import S4CLSimSpawnedEvent
+from sims4communitylib.events.sim.events.sims_loaded import S4CLSimsLoadedEvent
+from sims4communitylib.events.zone_spin.common_zone_load_profiler import CommonZoneLoadProfiler
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
+from sims4communitylib.events.zone_spin.events.zone_teardown import S4CLZoneTeardownEvent
+from sims4communitylib.modinfo import ModInfo
 from sims4communitylib.services.common_service import CommonService
 from sims4communitylib.utils.common_injection_utils import CommonInjectionUtils
 
@@ -21,14 +29,33 @@ from sims4communitylib.utils.common_injection_utils import CommonInjectionUtils
 class CommonSimEventDispatcherService(CommonService):
     """
         A service for dispatching sim events.
+
+        While a zone is loading, the Sims being loaded are collected and sent as a single S4CLSimsLoadedEvent upon late load of the zone.
+        Mods that handle S4CLSimsLoadedEvent can stop receiving per Sim events while the zone is loading by calling suppress_per_sim_events_while_loading.
     """
 
+    def __init__(self):
+        self._sims_loaded_event_collector = CommonSimsLoadedEventCollector(S4CLSimsLoadedEvent)
+
+    def suppress_per_sim_events_while_loading(self, mod_name: str):
+        """
+            Stop sending per Sim events to the event handlers of a mod while a zone is loading.
+            The mod is expected to handle S4CLSimsLoadedEvent instead.
+        :param mod_name: The name of the mod.
+        """
+        self._sims_loaded_event_collector.suppress_per_sim_events_while_loading(mod_name)
+
     def _on_sim_init(self, sim_info: SimInfo, *_, **__):
-        CommonEventRegistry.get().dispatch(S4CLSimInitializedEvent(sim_info))
+        if not CommonEventRegistry.get().has_handlers(S4CLSimInitializedEvent):
+            return
+        from sims4communitylib.events.zone_spin.common_zone_spin_event_dispatcher import CommonZoneSpinEventDispatcher
+        excluded_mod_names = self._sims_loaded_event_collector.get_excluded_mod_names(CommonZoneSpinEventDispatcher.get().game_loading)
+        CommonEventRegistry.get().dispatch(S4CLSimInitializedEvent(sim_info), excluded_mod_names=excluded_mod_names)
 
     def _on_sim_load(self, sim_info: SimInfo, *_, **__):
         from sims4communitylib.events.zone_spin.common_zone_spin_event_dispatcher import CommonZoneSpinEventDispatcher
         if CommonZoneSpinEventDispatcher.get().game_loading:
+            self._sims_loaded_event_collector.collect(sim_info, CommonEventRegistry.get())
             return False
         return CommonEventRegistry.get().dispatch(S4CLSimLoadedEvent(sim_info))
 
@@ -40,21 +67,48 @@ class CommonSimEventDispatcherService(CommonService):
         return CommonEventRegistry.get().dispatch(S4CLSimSpawnedEvent(CommonSimUtils.get_sim_info(sim_info)))
 
     def _on_sim_change_occult_type(self, occult_tracker: OccultTracker, occult_type: OccultType, *_, **__):
+        if not CommonEventRegistry.get().has_handlers(S4CLSimChangedOccultTypeEvent):
+            return True
         sim_info = occult_tracker._sim_info
         return CommonEventRegistry.get().dispatch(S4CLSimChangedOccultTypeEvent(sim_info, occult_type, occult_tracker))
 
+    def _on_zone_late_load(self, event_data: S4CLZoneLateLoadEvent):
+        return self._sims_loaded_event_collector.dispatch(event_data.zone, CommonEventRegistry.get())
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def _dispatch_sims_loaded_on_zone_late_load(event_data: S4CLZoneLateLoadEvent):
+        return CommonSimEventDispatcherService.get()._on_zone_late_load(event_data)
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def _clear_loaded_sims_on_zone_teardown(event_data: S4CLZoneTeardownEvent):
+        # Sims collected for a zone that never finished loading must not be sent with the next zone.
+        CommonSimEventDispatcherService.get()._sims_loaded_event_collector.clear()
+        return True
+
 
 @CommonInjectionUtils.inject_into(SimInfo, SimInfo.__init__.__name__)
 def _common_on_sim_init(original, self, *args, **kwargs):
     result = original(self, *args, **kwargs)
-    CommonSimEventDispatcherService.get()._on_sim_init(self, *args, **kwargs)
+    if CommonZoneLoadProfiler.get().profiling:
+        start_time = time.perf_counter()
+        CommonSimEventDispatcherService.get()._on_sim_init(self, *args, **kwargs)
+        CommonZoneLoadProfiler.get().add_hook_time('sim_init', time.perf_counter() - start_time)
+    else:
+        CommonSimEventDispatcherService.get()._on_sim_init(self, *args, **kwargs)
     return result
 
 
 @CommonInjectionUtils.inject_into(SimInfo, SimInfo.load_sim_info.__name__)
 def _common_on_sim_load(original, self, *args, **kwargs):
     result = original(self, *args, **kwargs)
-    CommonSimEventDispatcherService.get()._on_sim_load(self, *args, **kwargs)
+    if CommonZoneLoadProfiler.get().profiling:
+        start_time = time.perf_counter()
+        CommonSimEventDispatcherService.get()._on_sim_load(self, *args, **kwargs)
+        CommonZoneLoadProfiler.get().add_hook_time('sim_load', time.perf_counter() - start_time)
+    else:
+        CommonSimEventDispatcherService.get()._on_sim_load(self, *args, **kwargs)
     return result
 
 
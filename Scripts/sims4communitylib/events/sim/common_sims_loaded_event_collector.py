@@ -0,0 +1,77 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, List, Set, Type, Union
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+
+
+class CommonSimsLoadedEventCollector:
+    """
+        Collects the Sims loaded while a zone is loading, so they can be sent in a single event once the zone has loaded.
+
+        Sims are only collected while something handles the event, so nothing is kept when no mod listens for it.
+        It also keeps track of the mods that asked to not receive per Sim events while a zone is loading.
+    """
+    def __init__(self, event_type: Type[CommonEvent]):
+        """
+            Create a collector.
+        :param event_type: The event sent with the collected Sims, it is created with the zone and the collected Sims.
+        """
+        self._event_type = event_type
+        self._sim_info_list: List[Any] = list()
+        self._suppressed_mod_names: Set[str] = set()
+
+    @property
+    def sim_info_list(self) -> List[Any]:
+        """ The Sims collected so far, in the order they were loaded. """
+        return list(self._sim_info_list)
+
+    def suppress_per_sim_events_while_loading(self, mod_name: str):
+        """
+            Stop sending per Sim events to the event handlers of a mod while a zone is loading.
+        :param mod_name: The name of the mod.
+        """
+        self._suppressed_mod_names.add(mod_name)
+
+    def get_excluded_mod_names(self, game_loading: bool) -> Union[Set[str], None]:
+        """
+            Retrieve the mods to leave out when dispatching a per Sim event.
+        :param game_loading: True if a zone is loading.
+        :return: The names of the mods to leave out or None if no mods are left out.
+        """
+        if not game_loading or not self._suppressed_mod_names:
+            return None
+        return self._suppressed_mod_names
+
+    def collect(self, sim_info: Any, event_registry: CommonEventRegistry):
+        """
+            Collect a loaded Sim, if something handles the event.
+        :param sim_info: The Sim that was loaded.
+        :param event_registry: The registry the event will be dispatched through.
+        """
+        if event_registry.has_handlers(self._event_type):
+            self._sim_info_list.append(sim_info)
+
+    def dispatch(self, zone: Any, event_registry: CommonEventRegistry) -> bool:
+        """
+            Send the collected Sims in a single event and forget them.
+        :param zone: The zone that was loaded.
+        :param event_registry: The registry to dispatch the event through.
+        :return: The result of the dispatch or True if nothing handles the event.
+        """
+        sim_info_list = tuple(self._sim_info_list)
+        self._sim_info_list.clear()
+        if not event_registry.has_handlers(self._event_type):
+            return True
+        return event_registry.dispatch(self._event_type(zone, sim_info_list))
+
+    def clear(self):
+        """
+            Forget the collected Sims without sending them.
+        """
+        self._sim_info_list.clear()
@@ -0,0 +1,33 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Tuple
+
+from sims.sim_info import SimInfo
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+from zone import Zone
+
+
+class S4CLSimsLoadedEvent(CommonEvent):
+    """
+        An Event that Occurs upon late load of a zone, containing every Sim loaded while the zone was loading.
+
+        Use this to process all of the loaded Sims in a single pass, rather than handling an event per Sim.
+    """
+    def __init__(self, zone: Zone, sim_info_list: Tuple[SimInfo]):
+        self._zone = zone
+        self._sim_info_list = sim_info_list
+
+    @property
+    def zone(self) -> Zone:
+        """ The zone that was loaded. """
+        return self._zone
+
+    @property
+    def sim_info_list(self) -> Tuple[SimInfo]:
+        """ The SimInfo of every Sim loaded while the zone was loading, in the order they were loaded. """
+        return self._sim_info_list
@@ -0,0 +1,162 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import os
+import time
+from typing import Any, Dict, Union
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_date_utils import CommonRealDateUtils
+from sims4communitylib.utils.common_io_utils import CommonIOUtils
+from sims4communitylib.utils.common_log_utils import CommonLogUtils
+
+
+class CommonZoneLoadProfiler(CommonService):
+    """
+        Records where the time goes while a zone loads.
+
+        A load starts with the load_zone phase and ends when the do_zone_spin_up phase finishes.
+        The wall time of each zone spin phase within a load (load_zone, do_zone_spin_up and any save_zone or on_teardown that happens during it), the time taken by each event handler
+        dispatched to during a phase and the total time spent in the Sim init and load hooks are collected.
+        Saves and teardowns outside of a load are not recorded, so gameplay between loads is never counted as load time.
+        When do_zone_spin_up finishes, everything collected during the load is appended as a single JSON line to the 'Sims4CommunityLib_Zone_Load_Profile.jsonl' file
+        in the 'Documents\\Electronic Arts\\The Sims 4' folder, so runs can be compared.
+
+        Profiling is enabled with the 's4clib.enable_zone_load_profiler' command and stays enabled across game sessions,
+        so that the very first load of the next session is recorded too, until the 's4clib.disable_zone_load_profiler' command is used.
+    """
+    LOAD_START_PHASE_NAME = 'load_zone'
+
+    def __init__(self):
+        self._enabled: Union[bool, None] = None
+        self._record: Union[Dict[str, Any], None] = None
+        self._phase: Union[Dict[str, Any], None] = None
+        self._phase_start_time = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """ Determine if zone loads are being profiled. """
+        if self._enabled is None:
+            self._enabled = os.path.isfile(self._get_enabled_file_path())
+        return self._enabled
+
+    @property
+    def profiling(self) -> bool:
+        """ Determine if a load is being profiled, from the start of its first zone spin phase until it is written. """
+        return self._record is not None
+
+    def enable(self):
+        """
+            Enable profiling, for this and future game sessions.
+        """
+        CommonIOUtils.write_to_file(self._get_enabled_file_path(), '')
+        self._enabled = True
+
+    def disable(self):
+        """
+            Disable profiling, for this and future game sessions.
+        """
+        enabled_file_path = self._get_enabled_file_path()
+        if os.path.isfile(enabled_file_path):
+            os.remove(enabled_file_path)
+        self._enabled = False
+        self._record = None
+        self._phase = None
+        CommonEventRegistry.get()._handler_times = None
+
+    def start_phase(self, phase_name: str, zone_id: int):
+        """
+            Start timing a zone spin phase. Only the load_zone phase starts a load, any other phase is ignored unless a load is being profiled.
+        :param phase_name: The name of the phase.
+        :param zone_id: The decimal identifier of the zone.
+        """
+        if not self.enabled:
+            return
+        if self._record is None and phase_name != CommonZoneLoadProfiler.LOAD_START_PHASE_NAME:
+            return
+        if self._phase is not None:
+            self.end_phase()
+        if self._record is None:
+            self._record = {
+                'started': CommonRealDateUtils.get_current_date_string(),
+                'zone_id': zone_id,
+                'phases': [],
+                'hooks': {}
+            }
+        self._phase = {'name': phase_name, 'zone_id': zone_id, 'time': 0.0, 'handlers': {}}
+        CommonEventRegistry.get()._handler_times = self._phase['handlers']
+        self._phase_start_time = time.perf_counter()
+
+    def end_phase(self):
+        """
+            Stop timing the current zone spin phase.
+        """
+        if self._phase is None:
+            return
+        self._phase['time'] = time.perf_counter() - self._phase_start_time
+        CommonEventRegistry.get()._handler_times = None
+        self._record['phases'].append(self._phase)
+        self._phase = None
+
+    def add_hook_time(self, hook_name: str, seconds: float):
+        """
+            Add time spent in a hook, such as the Sim init hook, to the current load.
+        :param hook_name: The name of the hook.
+        :param seconds: The time spent in the hook.
+        """
+        if self._record is None:
+            return
+        hook = self._record['hooks'].setdefault(hook_name, {'count': 0, 'time': 0.0})
+        hook['count'] += 1
+        hook['time'] += seconds
+
+    def finish_load(self, file_path: str=None) -> Union[Dict[str, Any], None]:
+        """
+            Write everything collected since the previous load as a single record.
+        :param file_path: The file to append the record to. Defaults to the profile file in the Sims 4 documents folder.
+        :return: The record that was written or None if nothing was collected.
+        """
+        record = self._record
+        if record is None:
+            return None
+        self._record = None
+        record['total_time'] = sum([phase['time'] for phase in record['phases']])
+        CommonIOUtils.write_to_file(file_path or self.get_profile_file_path(), json.dumps(record) + '\n')
+        return record
+
+    @staticmethod
+    def get_profile_file_path() -> str:
+        """
+            Retrieve the file path of the zone load profile.
+        :return: The file path of the zone load profile.
+        """
+        return CommonLogUtils.get_zone_load_profile_file_path(ModInfo.get_identity().name)
+
+    @staticmethod
+    def _get_enabled_file_path() -> str:
+        return os.path.join(CommonLogUtils.get_sims_documents_location_path(), '{}_Zone_Load_Profiler.enabled'.format(ModInfo.get_identity().name))
+
+
+try:
+    import sims4.commands
+
+    @sims4.commands.Command('s4clib.enable_zone_load_profiler', command_type=sims4.commands.CommandType.Live)
+    def _common_command_enable_zone_load_profiler(_connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        CommonZoneLoadProfiler.get().enable()
+        output('Zone load profiler enabled, loads will be recorded to: {}'.format(CommonZoneLoadProfiler.get_profile_file_path()))
+
+
+    @sims4.commands.Command('s4clib.disable_zone_load_profiler', command_type=sims4.commands.CommandType.Live)
+    def _common_command_disable_zone_load_profiler(_connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        CommonZoneLoadProfiler.get().disable()
+        output('Zone load profiler disabled')
+except ModuleNotFoundError:
+    pass
@@ -9,6 +9,7 @@ from typing import Any
 
 from server.client import Client
 from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.common_zone_load_profiler import CommonZoneLoadProfiler
 from sims4communitylib.events.zone_spin.events.zone_early_load import S4CLZoneEarlyLoadEvent
 from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
 from sims4communitylib.events.zone_spin.events.zone_save import S4CLZoneSaveEvent
@@ -43,6 +44,8 @@ class CommonZoneSpinEventDispatcher(CommonService):
         self._game_loading = False
 
     def _on_zone_teardown(self, zone: Zone, client: Client):
+        # Events still waiting refer to objects of this zone, so they are delivered before it goes away.
+        CommonEventRegistry.get()._dispatch_deferred_events(deliver_all=True)
         CommonEventRegistry.get().dispatch(S4CLZoneTeardownEvent(zone, client, game_loaded=self.game_loaded, game_loading=self.game_loading))
         self._game_loading = True
 
@@ -52,25 +55,42 @@ class CommonZoneSpinEventDispatcher(CommonService):
 
 @CommonInjectionUtils.inject_into(Zone, Zone.load_zone.__name__)
 def _common_on_early_zone_load(original, self: Zone, *args, **kwargs):
-    result = original(self, *args, **kwargs)
-    CommonZoneSpinEventDispatcher.get()._on_early_zone_load(self)
+    CommonZoneLoadProfiler.get().start_phase('load_zone', self.id)
+    try:
+        result = original(self, *args, **kwargs)
+        CommonZoneSpinEventDispatcher.get()._on_early_zone_load(self)
+    finally:
+        CommonZoneLoadProfiler.get().end_phase()
     return result
 
 
 @CommonInjectionUtils.inject_into(Zone, Zone.do_zone_spin_up.__name__)
 def _common_on_late_zone_load(original, self: Zone, *args, **kwargs):
-    result = original(self, *args, **kwargs)
-    CommonZoneSpinEventDispatcher.get()._on_late_zone_load(self, *args, **kwargs)
+    CommonZoneLoadProfiler.get().start_phase('do_zone_spin_up', self.id)
+    try:
+        result = original(self, *args, **kwargs)
+        CommonZoneSpinEventDispatcher.get()._on_late_zone_load(self, *args, **kwargs)
+    finally:
+        CommonZoneLoadProfiler.get().end_phase()
+        CommonZoneLoadProfiler.get().finish_load()
     return result
 
 
 @CommonInjectionUtils.inject_into(Zone, Zone.on_teardown.__name__)
 def _common_on_zone_teardown(original, self: Zone, client):
-    CommonZoneSpinEventDispatcher.get()._on_zone_teardown(self, client)
-    return original(self, client)
+    CommonZoneLoadProfiler.get().start_phase('on_teardown', self.id)
+    try:
+        CommonZoneSpinEventDispatcher.get()._on_zone_teardown(self, client)
+        return original(self, client)
+    finally:
+        CommonZoneLoadProfiler.get().end_phase()
 
 
 @CommonInjectionUtils.inject_into(Zone, Zone.save_zone.__name__)
 def _common_on_zone_save(original, self: Zone, *args, **kwargs):
-    CommonZoneSpinEventDispatcher.get()._on_zone_save(self, *args, **kwargs)
-    return original(self, *args, **kwargs)
+    CommonZoneLoadProfiler.get().start_phase('save_zone', self.id)
+    try:
+        CommonZoneSpinEventDispatcher.get()._on_zone_save(self, *args, **kwargs)
+        return original(self, *args, **kwargs)
+    finally:
+        CommonZoneLoadProfiler.get().end_phase()
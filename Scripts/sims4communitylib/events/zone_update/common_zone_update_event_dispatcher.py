@@ -50,6 +50,7 @@ class CommonZoneUpdateEventDispatcherService(CommonService):
         try:
             if not zone.is_zone_running:
                 return False
+            CommonEventRegistry.get()._dispatch_deferred_events()
             is_paused = CommonTimeUtils.game_is_paused()
             if not is_paused:
                 diff_ticks = absolute_ticks - self._last_absolute_ticks
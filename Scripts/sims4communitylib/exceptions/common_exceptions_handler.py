@@ -31,10 +31,20 @@ class CommonExceptionHandler:
         from sims4communitylib.utils.common_log_registry import CommonLogUtils
         file_path = CommonLogUtils.get_exceptions_file_path(mod_name)
         result = CommonExceptionHandler._log_stacktrace(mod_name, stack_trace, file_path)
+        CommonExceptionHandler._dump_log_buffer(mod_name)
         if result:
             CommonExceptionHandler._notify_exception_occurred(file_path)
         return result
 
+    @staticmethod
+    def _dump_log_buffer(mod_name: str):
+        # The buffered messages show what led up to the exception.
+        try:
+            from sims4communitylib.utils.common_log_registry import CommonLogRegistry
+            CommonLogRegistry.get().dump_log_buffers(mod_name=mod_name)
+        except Exception:
+            pass
+
     @staticmethod
     def _log_stacktrace(mod_name: str, _traceback, file_path: str) -> bool:
         exception_traceback_text = '[{}] {} {}\n'.format(mod_name, CommonRealDateUtils.get_current_date_string(), _traceback)
@@ -0,0 +1,242 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import os
+from typing import Any, Dict, Iterator, Tuple
+
+
+class CommonDataStore:
+    """
+        A key value store kept in a single file, built for saving large amounts of mod data quickly.
+
+        The file is a log of records, one per line, each holding a key and its value as JSON (a record without a value removes the key).
+        Changes are held in memory until flush is called, which appends only the changed keys to the end of the file,
+        so saving a few changed values does not rewrite the values that did not change.
+        Opening a store only reads the keys of the records and where each one is located in the file, a value is parsed the first time its key is read.
+        Once the file holds more replaced records than current ones, flush compacts it by writing the current records to a new file and renaming it over the old one.
+
+        A record that was only partially written, for example because the game crashed while saving, is ignored the next time the store is opened.
+
+        Example:
+
+        data_store = CommonDataStore('path/to/file.s4cldata')
+        data_store.set('sim_12345', {'points': 10})
+        data_store.flush()
+    """
+    _DELETED = object()
+
+    def __init__(self, file_path: str, min_compaction_size: int=65536):
+        """
+            Open a data store, creating it on the first flush if the file does not exist.
+        :param file_path: The file the data store is kept in.
+        :param min_compaction_size: The file is never compacted while it is smaller than this many bytes.
+        """
+        self._file_path = file_path
+        self._min_compaction_size = min_compaction_size
+        # The location of the latest record of each key within the file, as (offset, length of the record line).
+        self._record_locations: Dict[str, Tuple[int, int]] = dict()
+        self._values: Dict[str, Any] = dict()
+        self._pending_values: Dict[str, Any] = dict()
+        self._file_size = 0
+        self._stale_record_count = 0
+        self._load_record_locations()
+
+    @property
+    def file_path(self) -> str:
+        """ The file the data store is kept in. """
+        return self._file_path
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """ Determine if there are changes that have not been flushed yet. """
+        return len(self._pending_values) > 0
+
+    @property
+    def stale_record_count(self) -> int:
+        """ The number of records in the file that have been replaced by a later record. """
+        return self._stale_record_count
+
+    def get(self, key: str, default: Any=None) -> Any:
+        """
+            Retrieve the value of a key.
+        :param key: The key.
+        :param default: The value to return when the key does not exist.
+        :return: The value of the key or the default if the key does not exist.
+        """
+        if key in self._pending_values:
+            value = self._pending_values[key]
+            return default if value is CommonDataStore._DELETED else value
+        if key in self._values:
+            return self._values[key]
+        record_location = self._record_locations.get(key, None)
+        if record_location is None:
+            return default
+        value = self._read_value(record_location)
+        self._values[key] = value
+        return value
+
+    def set(self, key: str, value: Any):
+        """
+            Set the value of a key. The value is written to the file on the next flush.
+        :param key: The key.
+        :param value: The value, it must be serializable as JSON.
+        """
+        self._pending_values[key] = value
+        self._values.pop(key, None)
+
+    def delete(self, key: str):
+        """
+            Remove a key. The key is removed from the file on the next flush.
+        :param key: The key.
+        """
+        self._pending_values[key] = CommonDataStore._DELETED
+        self._values.pop(key, None)
+
+    def has_key(self, key: str) -> bool:
+        """
+            Determine if a key exists.
+        :param key: The key.
+        :return: True if the key exists.
+        """
+        if key in self._pending_values:
+            return self._pending_values[key] is not CommonDataStore._DELETED
+        return key in self._record_locations
+
+    def keys(self) -> Iterator[str]:
+        """
+            Retrieve all keys.
+        :return: An iterator of every key.
+        """
+        for key in self._record_locations.keys():
+            if key not in self._pending_values:
+                yield key
+        for (key, value) in self._pending_values.items():
+            if value is not CommonDataStore._DELETED:
+                yield key
+
+    def discard_pending_changes(self):
+        """
+            Throw away the changes made since the last flush.
+        """
+        self._pending_values.clear()
+        # A value that was read may have been changed in place, so values are read from the file again.
+        self._values.clear()
+
+    def flush(self) -> bool:
+        """
+            Write the changes made since the last flush to the file, compacting the file if it holds too many stale records.
+        :return: True if anything was written.
+        """
+        if not self._pending_values:
+            return False
+        pending_values = self._pending_values
+        record_lines = list()
+        for (key, value) in pending_values.items():
+            if value is CommonDataStore._DELETED and key not in self._record_locations:
+                continue
+            record_lines.append((key, self._get_record_line(key, value)))
+        if not record_lines:
+            self._pending_values = dict()
+            return False
+        directory_path = os.path.dirname(self._file_path)
+        if directory_path:
+            os.makedirs(directory_path, exist_ok=True)
+        with open(self._file_path, mode='ab') as file:
+            # A previous write may have been cut short, so only append after a complete record.
+            file.truncate(self._file_size)
+            file.write(b''.join([record_line for (_, record_line) in record_lines]))
+            file.flush()
+            os.fsync(file.fileno())
+        self._pending_values = dict()
+        for (key, record_line) in record_lines:
+            if key in self._record_locations:
+                self._stale_record_count += 1
+            if pending_values[key] is CommonDataStore._DELETED:
+                # The removal record itself is stale as soon as it is written.
+                self._record_locations.pop(key)
+                self._stale_record_count += 1
+            else:
+                self._record_locations[key] = (self._file_size, len(record_line))
+                self._values[key] = pending_values[key]
+            self._file_size += len(record_line)
+        if self._file_size >= self._min_compaction_size and self._stale_record_count > len(self._record_locations):
+            self.compact()
+        return True
+
+    def compact(self):
+        """
+            Rewrite the file so it only holds the latest record of each key.
+            The records are written to a new file which then replaces the old file, so the old file stays intact until the new file is complete.
+        """
+        self.save_as(self._file_path)
+
+    def save_as(self, file_path: str):
+        """
+            Write the latest record of each key to a file and continue using that file. Changes that have not been flushed are not written.
+        :param file_path: The file to write to.
+        """
+        directory_path = os.path.dirname(file_path)
+        if directory_path:
+            os.makedirs(directory_path, exist_ok=True)
+        temporary_file_path = file_path + '.tmp'
+        record_locations: Dict[str, Tuple[int, int]] = dict()
+        file_size = 0
+        with open(temporary_file_path, mode='wb') as temporary_file:
+            if self._record_locations:
+                with open(self._file_path, mode='rb') as file:
+                    for (key, (offset, length)) in sorted(self._record_locations.items(), key=lambda item: item[1][0]):
+                        file.seek(offset)
+                        record_line = file.read(length)
+                        temporary_file.write(record_line)
+                        record_locations[key] = (file_size, length)
+                        file_size += length
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_file_path, file_path)
+        self._file_path = file_path
+        self._record_locations = record_locations
+        self._file_size = file_size
+        self._stale_record_count = 0
+
+    def _load_record_locations(self):
+        if not os.path.isfile(self._file_path):
+            return
+        offset = 0
+        with open(self._file_path, mode='rb') as file:
+            for record_line in file:
+                if not record_line.endswith(b'\n'):
+                    # A record that was only partially written.
+                    break
+                (key_json, _, value_json) = record_line.partition(b'\t')
+                key = json.loads(key_json.decode('utf-8'))
+                if key in self._record_locations:
+                    self._stale_record_count += 1
+                if value_json.strip():
+                    self._record_locations[key] = (offset, len(record_line))
+                else:
+                    self._record_locations.pop(key, None)
+                    self._stale_record_count += 1
+                offset += len(record_line)
+        self._file_size = offset
+
+    def _read_value(self, record_location: Tuple[int, int]) -> Any:
+        (offset, length) = record_location
+        with open(self._file_path, mode='rb') as file:
+            file.seek(offset)
+            record_line = file.read(length)
+        return json.loads(record_line.partition(b'\t')[2].decode('utf-8'))
+
+    @staticmethod
+    def _get_record_line(key: str, value: Any) -> bytes:
+        # JSON escapes tabs and new lines, so neither can appear inside of the key or the value.
+        if value is CommonDataStore._DELETED:
+            return '{}\t\n'.format(json.dumps(key)).encode('utf-8')
+        return '{}\t{}\n'.format(json.dumps(key), json.dumps(value, separators=(',', ':'))).encode('utf-8')
+
+    def __str__(self):
+        return 'CommonDataStore File: \'{}\' Keys: {} Stale Records: {} Pending Changes: {}'.format(self._file_path, len(self._record_locations), self._stale_record_count, len(self._pending_values))
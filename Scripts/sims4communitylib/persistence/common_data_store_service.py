@@ -0,0 +1,140 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+import shutil
+from typing import Dict, Union
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.persistence.common_data_store import CommonDataStore
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_log_utils import CommonLogUtils
+
+
+class CommonDataStoreService(CommonService):
+    """
+        Provides each mod with a data store for the save slot being played.
+
+        Changes made to a data store are written when the game is saved, so the data of a mod always matches the save it belongs to.
+        Changes made since the last save are discarded whenever a zone is loaded, including when the same save slot is loaded again without saving.
+        When the game is saved to a new slot ("Save As"), the data stores of every mod with data in the previous slot are copied to the new slot,
+        whether or not the mod opened its data store this session.
+
+        The data stores are kept in the 'Documents\\Electronic Arts\\The Sims 4\\Mod_Data\\<mod name>' folder.
+
+        Example:
+
+        data_store = CommonDataStoreService.get().get_data_store('my_mod_name')
+        data_store.set('sim_12345', {'points': 10})
+    """
+    _DATA_STORE_FOLDER_NAME = 'Mod_Data'
+
+    def __init__(self):
+        self._save_slot_id: Union[int, None] = None
+        self._data_stores: Dict[str, CommonDataStore] = dict()
+        self._data_folder_path: Union[str, None] = None
+
+    @property
+    def data_folder_path(self) -> str:
+        """ The folder containing a folder of data stores for each mod. """
+        if self._data_folder_path is None:
+            self._data_folder_path = os.path.join(CommonLogUtils.get_sims_documents_location_path(), CommonDataStoreService._DATA_STORE_FOLDER_NAME)
+        return self._data_folder_path
+
+    @data_folder_path.setter
+    def data_folder_path(self, folder_path: str):
+        self._data_folder_path = folder_path
+
+    def get_data_store(self, mod_name: str, save_slot_id: int=None) -> CommonDataStore:
+        """
+            Retrieve the data store of a mod for the save slot being played.
+        :param mod_name: The name of the mod.
+        :param save_slot_id: The identifier of the save slot. Defaults to the save slot being played.
+        :return: The data store of the mod.
+        """
+        if save_slot_id is None:
+            from sims4communitylib.utils.common_save_utils import CommonSaveUtils
+            save_slot_id = CommonSaveUtils.get_save_slot_id()
+        if save_slot_id != self._save_slot_id:
+            self._data_stores.clear()
+            self._save_slot_id = save_slot_id
+        data_store = self._data_stores.get(mod_name, None)
+        if data_store is None:
+            data_store = CommonDataStore(self._get_data_store_file_path(mod_name, save_slot_id))
+            self._data_stores[mod_name] = data_store
+        return data_store
+
+    def _on_zone_load(self, save_slot_id: int):
+        # Anything not saved before this load does not belong to the save being loaded, even when it is the same save slot.
+        # A mod may still hold on to a data store, so its unsaved changes are thrown away as well as forgetting it.
+        for data_store in self._data_stores.values():
+            data_store.discard_pending_changes()
+        self._data_stores.clear()
+        self._save_slot_id = save_slot_id
+
+    def _on_zone_save(self, save_slot_id: int):
+        previous_save_slot_id = self._save_slot_id
+        if previous_save_slot_id is not None and save_slot_id != previous_save_slot_id:
+            self._copy_unopened_data_stores(previous_save_slot_id, save_slot_id)
+        for (mod_name, data_store) in self._data_stores.items():
+            try:
+                if save_slot_id != previous_save_slot_id:
+                    data_store.save_as(self._get_data_store_file_path(mod_name, save_slot_id))
+                data_store.flush()
+            except Exception as ex:
+                CommonExceptionHandler.log_exception(ModInfo.get_identity().name, 'Failed to save the data store of mod \'{}\''.format(mod_name), exception=ex)
+        self._save_slot_id = save_slot_id
+
+    def _copy_unopened_data_stores(self, from_save_slot_id: int, to_save_slot_id: int):
+        # The open data stores are written to the new save slot by save_as, every other mod has its file copied.
+        data_folder_path = self.data_folder_path
+        if not os.path.isdir(data_folder_path):
+            return
+        for mod_name in os.listdir(data_folder_path):
+            if mod_name in self._data_stores:
+                continue
+            from_file_path = self._get_data_store_file_path(mod_name, from_save_slot_id)
+            to_file_path = self._get_data_store_file_path(mod_name, to_save_slot_id)
+            try:
+                if not os.path.isfile(from_file_path):
+                    # The new save slot may have been saved over, data the mod kept for the old save in it no longer belongs to it.
+                    if os.path.isfile(to_file_path):
+                        os.remove(to_file_path)
+                    continue
+                temporary_file_path = to_file_path + '.tmp'
+                shutil.copyfile(from_file_path, temporary_file_path)
+                os.replace(temporary_file_path, to_file_path)
+            except Exception as ex:
+                CommonExceptionHandler.log_exception(ModInfo.get_identity().name, 'Failed to copy the data store of mod \'{}\' to the new save slot'.format(mod_name), exception=ex)
+
+    def _get_data_store_file_path(self, mod_name: str, save_slot_id: int) -> str:
+        return os.path.join(self.data_folder_path, mod_name, 'Slot_{:08x}.s4cldata'.format(save_slot_id))
+
+
+try:
+    from sims4communitylib.events.zone_spin.events.zone_early_load import S4CLZoneEarlyLoadEvent
+    from sims4communitylib.events.zone_spin.events.zone_save import S4CLZoneSaveEvent
+    from sims4communitylib.utils.common_save_utils import CommonSaveUtils
+
+    class _CommonDataStoreServiceEventHandlers:
+        @staticmethod
+        @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+        def _reset_data_stores_on_zone_load(event_data: S4CLZoneEarlyLoadEvent):
+            CommonDataStoreService.get()._on_zone_load(CommonSaveUtils.get_save_slot_id())
+            return True
+
+        @staticmethod
+        @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+        def _flush_data_stores_on_zone_save(event_data: S4CLZoneSaveEvent):
+            save_slot_id = CommonSaveUtils.get_save_slot_id()
+            if event_data.save_slot_data is not None and hasattr(event_data.save_slot_data, 'slot_id'):
+                save_slot_id = event_data.save_slot_data.slot_id
+            CommonDataStoreService.get()._on_zone_save(save_slot_id)
+            return True
+except ModuleNotFoundError:
+    pass
@@ -0,0 +1,153 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import services
+from typing import Iterable, Iterator, Set, Tuple, Union
+from objects.script_object import ScriptObject
+from sims4communitylib.classes.common_object_index import CommonObjectIndex
+from sims4communitylib.enums.tags_enum import CommonGameTag
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_teardown import S4CLZoneTeardownEvent
+from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_injection_utils import CommonInjectionUtils
+
+
+class CommonZoneObjectIndex(CommonService):
+    """
+        An index of the objects in the current zone by definition, tag and type, for finding objects without going through every object in the object manager.
+
+        Objects are added to the index when they are added to the object manager and removed when they are removed from it, objects in inventories are not included.
+        The tags of an object are read when it is added, use reindex_object after changing the tags of an object.
+
+        Example:
+
+        bed_ids = CommonZoneObjectIndex.get().get_object_ids_by_tag(CommonGameTag.FUNC_BED)
+    """
+    def __init__(self):
+        self._object_index = CommonObjectIndex()
+
+    def get_object_ids_by_definition_id(self, definition_id: int) -> Set[int]:
+        """
+            Retrieve the objects with a definition.
+        :param definition_id: The decimal identifier of the definition.
+        :return: A collection of object identifiers.
+        """
+        return self._object_index.get_object_ids_by_definition_id(definition_id)
+
+    def get_object_ids_by_tag(self, tag: Union[CommonGameTag, int]) -> Set[int]:
+        """
+            Retrieve the objects with a tag.
+        :param tag: The tag.
+        :return: A collection of object identifiers.
+        """
+        return self._object_index.get_object_ids_by_tag(tag)
+
+    def get_object_ids_by_tags(self, tags: Iterable[Union[CommonGameTag, int]], match_all: bool=False) -> Set[int]:
+        """
+            Retrieve the objects with any or all of a collection of tags.
+        :param tags: The tags.
+        :param match_all: If True, objects must have all of the tags. If False, objects must have at least one of the tags.
+        :return: A collection of object identifiers.
+        """
+        return self._object_index.get_object_ids_by_tags(tags, match_all=match_all)
+
+    def get_object_ids_by_type(self, object_type: type, include_subclasses: bool=True) -> Set[int]:
+        """
+            Retrieve the objects of a type.
+        :param object_type: The type, such as GameObject.
+        :param include_subclasses: If True, objects of a subclass of the type are included.
+        :return: A collection of object identifiers.
+        """
+        return self._object_index.get_object_ids_by_type(object_type, include_subclasses=include_subclasses)
+
+    def get_objects_by_tag(self, tag: Union[CommonGameTag, int]) -> Iterator[ScriptObject]:
+        """
+            Retrieve the objects with a tag.
+        :param tag: The tag.
+        :return: An iterator of objects.
+        """
+        return self._get_objects(self._object_index.get_object_ids_by_tag(tag))
+
+    def get_objects_by_definition_id(self, definition_id: int) -> Iterator[ScriptObject]:
+        """
+            Retrieve the objects with a definition.
+        :param definition_id: The decimal identifier of the definition.
+        :return: An iterator of objects.
+        """
+        return self._get_objects(self._object_index.get_object_ids_by_definition_id(definition_id))
+
+    def get_objects_by_type(self, object_type: type, include_subclasses: bool=True) -> Iterator[ScriptObject]:
+        """
+            Retrieve the objects of a type.
+        :param object_type: The type, such as GameObject.
+        :param include_subclasses: If True, objects of a subclass of the type are included.
+        :return: An iterator of objects.
+        """
+        return self._get_objects(self._object_index.get_object_ids_by_type(object_type, include_subclasses=include_subclasses))
+
+    def reindex_object(self, script_object: ScriptObject):
+        """
+            Read the definition and tags of an object again.
+        :param script_object: The object.
+        """
+        if script_object.id in self._object_index:
+            self._add_object(script_object)
+
+    def _add_object(self, script_object: ScriptObject):
+        definition = getattr(script_object, 'definition', None)
+        definition_id = getattr(definition, 'id', 0)
+        self._object_index.add(script_object.id, definition_id, CommonZoneObjectIndex._get_tags(script_object, definition), type(script_object))
+
+    def _on_script_object_add(self, script_object: ScriptObject):
+        if getattr(script_object, 'manager', None) is not services.object_manager():
+            return
+        self._add_object(script_object)
+
+    def _on_script_object_remove(self, script_object: ScriptObject):
+        self._object_index.remove(script_object.id)
+
+    @staticmethod
+    def _get_tags(script_object: ScriptObject, definition) -> Tuple[int, ...]:
+        get_tags = getattr(script_object, 'get_tags', None)
+        if get_tags is not None:
+            return tuple(get_tags())
+        return tuple(getattr(definition, 'build_buy_tags', None) or ())
+
+    @staticmethod
+    def _get_objects(object_ids: Set[int]) -> Iterator[ScriptObject]:
+        object_manager = services.object_manager()
+        for object_id in object_ids:
+            script_object = object_manager.get(object_id)
+            if script_object is None:
+                continue
+            yield script_object
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def _clear_on_zone_teardown(event_data: S4CLZoneTeardownEvent):
+        CommonZoneObjectIndex.get()._object_index.clear()
+
+
+@CommonInjectionUtils.inject_into(ScriptObject, ScriptObject.on_add.__name__)
+def _common_zone_object_index_on_add(original, self, *args, **kwargs):
+    result = original(self, *args, **kwargs)
+    try:
+        CommonZoneObjectIndex.get()._on_script_object_add(self)
+    except Exception as ex:
+        CommonExceptionHandler.log_exception(ModInfo.get_identity().name, 'Error occurred while adding object \'{}\' to the zone object index.'.format(self), exception=ex)
+    return result
+
+
+@CommonInjectionUtils.inject_into(ScriptObject, ScriptObject.on_remove.__name__)
+def _common_zone_object_index_on_remove(original, self, *args, **kwargs):
+    try:
+        CommonZoneObjectIndex.get()._on_script_object_remove(self)
+    except Exception as ex:
+        CommonExceptionHandler.log_exception(ModInfo.get_identity().name, 'Error occurred while removing object \'{}\' from the zone object index.'.format(self), exception=ex)
+    return original(self, *args, **kwargs)
@@ -0,0 +1,289 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import math
+import os
+import time
+from typing import Callable, Any, Dict, List, Tuple, Union
+from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
+from sims4communitylib.services.common_service import CommonService
+
+
+class CommonBenchmarkResult:
+    """ The timings of a single benchmark. All timings are in seconds per call. """
+    def __init__(self, benchmark_name: str, timings: List[float], calls_per_sample: int):
+        sorted_timings = sorted(timings)
+        self._benchmark_name = benchmark_name
+        self._calls_per_sample = calls_per_sample
+        self._sample_count = len(sorted_timings)
+        self._min = sorted_timings[0]
+        self._median = CommonBenchmarkResult._percentile(sorted_timings, 50)
+        self._p95 = CommonBenchmarkResult._percentile(sorted_timings, 95)
+
+    @property
+    def benchmark_name(self) -> str:
+        """ The name of the benchmark. """
+        return self._benchmark_name
+
+    @property
+    def calls_per_sample(self) -> int:
+        """ The number of times the benchmark was invoked within each timed sample. """
+        return self._calls_per_sample
+
+    @property
+    def sample_count(self) -> int:
+        """ The number of timed samples taken. """
+        return self._sample_count
+
+    @property
+    def min(self) -> float:
+        """ The fastest time per call. """
+        return self._min
+
+    @property
+    def median(self) -> float:
+        """ The median time per call. """
+        return self._median
+
+    @property
+    def p95(self) -> float:
+        """ The 95th percentile time per call. """
+        return self._p95
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ Convert the result to a dictionary, for storing in a baseline file. """
+        return {
+            'min': self.min,
+            'median': self.median,
+            'p95': self.p95,
+            'samples': self.sample_count,
+            'calls_per_sample': self.calls_per_sample
+        }
+
+    @staticmethod
+    def _percentile(sorted_timings: List[float], percent: int) -> float:
+        # Nearest-rank percentile.
+        rank = max(1, int(math.ceil(percent / 100 * len(sorted_timings))))
+        return sorted_timings[rank - 1]
+
+    def __str__(self):
+        return '{}: min {} median {} p95 {} ({} samples of {} calls)'.format(
+            self.benchmark_name,
+            CommonBenchmarkService._format_time(self.min),
+            CommonBenchmarkService._format_time(self.median),
+            CommonBenchmarkService._format_time(self.p95),
+            self.sample_count,
+            self.calls_per_sample
+        )
+
+
+class CommonBenchmarkService(CommonService):
+    """
+        Use to register and run micro-benchmarks.
+
+        Each benchmark is warmed up, then timed in samples. The number of calls per sample is adapted so each sample takes long enough to measure reliably,
+        and samples are taken until either the time budget or the maximum number of samples is reached.
+        Results can be stored in a baseline JSON file and later runs compared against it to flag regressions.
+
+        Benchmark Registration Example:
+
+        @CommonBenchmarkService.benchmark_class('mod_name')
+        class BenchmarkClass:
+            # Important that it is a static method, you won't get a cls or self value passed in, so don't expect one!
+            @staticmethod
+            @CommonBenchmarkService.benchmark((1, 2, 3), (3,))
+            def intersects(list_one, *list_items):
+                CommonCollectionUtils.intersects(list_one, *list_items)
+    """
+    def __init__(self):
+        self._benchmarks: Dict[str, List[Tuple[str, Callable[..., Any]]]] = dict()
+
+    def add_benchmark(self, benchmark_name: str, benchmark_function: Callable[..., Any], class_name: str=None):
+        """
+            Adds a benchmark with a benchmark name and class name.
+        :param benchmark_name: The name of the benchmark.
+        :param benchmark_function: The benchmark itself, it must take no arguments.
+        :param class_name: The name of the class the benchmark is contained within.
+        """
+        if class_name is None:
+            class_name = 'generic'
+        else:
+            class_name = class_name.lower()
+        class_benchmarks = self._benchmarks.get(class_name, list())
+        class_benchmarks.append((benchmark_name, benchmark_function))
+        self._benchmarks[class_name] = class_benchmarks
+
+    @property
+    def all_benchmarks(self) -> Dict[str, List[Tuple[str, Callable[..., Any]]]]:
+        """
+            Get all benchmarks.
+        :return: A dictionary of benchmarks.
+        """
+        return self._benchmarks
+
+    def get_benchmarks_by_class_name(self, class_name: str) -> List[Tuple[str, Callable[..., Any]]]:
+        """
+            Retrieve benchmarks by their class name.
+        :param class_name: The name of the class to locate benchmarks for.
+        :return: A list of benchmarks matching the class name.
+        """
+        return self._benchmarks.get(class_name, list())
+
+    @staticmethod
+    def benchmark_class(mod_name: str):
+        """
+            Decorator to indicate a benchmark class.
+        :param mod_name: The name of the mod this benchmark class is contained within.
+        :return: A wrapped function.
+        """
+        @CommonExceptionHandler.catch_exceptions(mod_name)
+        def _inner_benchmark_class(cls):
+            name_of_class = cls.__name__
+            for method_name in dir(cls):
+                method = getattr(cls, method_name)
+                if not hasattr(method, 'is_benchmark'):
+                    continue
+
+                def _benchmark_function(benchmark_method, *_, **__):
+                    def _wrapper():
+                        return benchmark_method(*_, **__)
+                    return _wrapper
+
+                if len(method.benchmark_parameters) > 1:
+                    idx = 1
+                    for benchmark_args, benchmark_kwargs in method.benchmark_parameters:
+                        CommonBenchmarkService.get().add_benchmark('{} {}'.format(method_name, str(idx)), _benchmark_function(method, *benchmark_args, **benchmark_kwargs), class_name=name_of_class)
+                        idx += 1
+                else:
+                    benchmark_args, benchmark_kwargs = method.benchmark_parameters[0]
+                    CommonBenchmarkService.get().add_benchmark(method_name, _benchmark_function(method, *benchmark_args, **benchmark_kwargs), class_name=name_of_class)
+            return cls
+        return _inner_benchmark_class
+
+    @staticmethod
+    def benchmark(*args, **kwargs):
+        """
+            Decorator to indicate a benchmark.
+            When the benchmark is run, it will be sent the specified arguments and keyword arguments.
+        :return: A wrapped function.
+        """
+        def _benchmark_func(benchmark_function):
+            benchmark_function.is_benchmark = True
+            if not hasattr(benchmark_function, 'benchmark_parameters'):
+                benchmark_function.benchmark_parameters = list()
+            benchmark_function.benchmark_parameters.append((args, kwargs))
+            return benchmark_function
+        return _benchmark_func
+
+    @staticmethod
+    def measure(
+        benchmark_name: str,
+        benchmark_function: Callable[[], Any],
+        warmup_runs: int=3,
+        min_sample_time: float=0.002,
+        min_samples: int=5,
+        max_samples: int=200,
+        max_time: float=0.5
+    ) -> CommonBenchmarkResult:
+        """
+            Time a function.
+        :param benchmark_name: The name of the benchmark.
+        :param benchmark_function: The function to time, it must take no arguments.
+        :param warmup_runs: The number of untimed calls made before timing begins.
+        :param min_sample_time: The number of calls per sample is increased until a single sample takes at least this many seconds.
+        :param min_samples: The minimum number of samples to take, regardless of max_time.
+        :param max_samples: The maximum number of samples to take.
+        :param max_time: The time budget in seconds for taking samples.
+        :return: The timings of the function.
+        """
+        for _ in range(warmup_runs):
+            benchmark_function()
+        calls_per_sample = 1
+        while True:
+            sample_time = CommonBenchmarkService._time_sample(benchmark_function, calls_per_sample)
+            if sample_time >= min_sample_time:
+                break
+            # Jump straight to roughly the right number of calls, rather than doubling many times.
+            calls_per_sample = max(calls_per_sample * 2, int(calls_per_sample * min_sample_time / max(sample_time, 1e-9)))
+        timings = [sample_time / calls_per_sample]
+        start_time = time.perf_counter()
+        while len(timings) < max_samples and (len(timings) < min_samples or time.perf_counter() - start_time < max_time):
+            timings.append(CommonBenchmarkService._time_sample(benchmark_function, calls_per_sample) / calls_per_sample)
+        return CommonBenchmarkResult(benchmark_name, timings, calls_per_sample)
+
+    def run_benchmarks(
+        self,
+        *class_names: str,
+        callback: Callable[..., Any]=print,
+        baseline_file_path: str=None,
+        update_baseline: bool=False,
+        regression_threshold: float=0.1,
+        **measure_kwargs
+    ) -> bool:
+        """
+            Runs the benchmarks of the specified classes.
+        :param class_names: A collection of classes to run benchmarks for.
+        :param callback: The callback to send string results to.
+        :param baseline_file_path: A JSON file containing results from a previous run to compare against.
+        :param update_baseline: If True, the results of this run will be stored in the baseline file. A missing baseline file is always created.
+        :param regression_threshold: A benchmark is flagged as a regression when its median is slower than the baseline median by more than this fraction.
+        :param measure_kwargs: Keyword arguments passed on to the 'measure' function.
+        :return: True if no regressions were found.
+        """
+        if len(class_names) > 0:
+            class_benchmarks = [class_name.lower() for class_name in class_names]
+        else:
+            class_benchmarks = list(self.all_benchmarks.keys())
+        baseline = self._load_baseline(baseline_file_path)
+        regression_count = 0
+        callback('Running Benchmarks')
+        for class_name in class_benchmarks:
+            callback('Running Benchmarks for class \'{}\''.format(class_name))
+            for benchmark_name, benchmark_function in self.get_benchmarks_by_class_name(class_name):
+                result = self.measure(benchmark_name, benchmark_function, **measure_kwargs)
+                baseline_key = '{}.{}'.format(class_name, benchmark_name)
+                comparison = ''
+                if baseline_key in baseline and baseline[baseline_key].get('median'):
+                    change = result.median / baseline[baseline_key]['median'] - 1.0
+                    comparison = ' ({:+.1f}% vs baseline)'.format(change * 100)
+                    if change > regression_threshold:
+                        regression_count += 1
+                        comparison += ' REGRESSION'
+                callback('{}{}'.format(str(result), comparison))
+                if update_baseline or baseline_key not in baseline:
+                    baseline[baseline_key] = result.to_dict()
+        if baseline_file_path:
+            with open(baseline_file_path, mode='w', encoding='utf-8') as file:
+                json.dump(baseline, file, indent=2, sort_keys=True)
+        callback('{} regressions found'.format(regression_count))
+        return regression_count == 0
+
+    @staticmethod
+    def _load_baseline(file_path: Union[str, None]) -> Dict[str, Dict[str, Any]]:
+        if not file_path or not os.path.isfile(file_path):
+            return dict()
+        with open(file_path, mode='r', encoding='utf-8') as file:
+            return json.load(file)
+
+    @staticmethod
+    def _time_sample(benchmark_function: Callable[[], Any], calls: int) -> float:
+        calls_range = range(calls)
+        start_time = time.perf_counter()
+        for _ in calls_range:
+            benchmark_function()
+        return time.perf_counter() - start_time
+
+    @staticmethod
+    def _format_time(seconds: float) -> str:
+        if seconds >= 1.0:
+            return '{:.3f}s'.format(seconds)
+        if seconds >= 0.001:
+            return '{:.3f}ms'.format(seconds * 1000)
+        if seconds >= 0.000001:
+            return '{:.3f}us'.format(seconds * 1000000)
+        return '{:.1f}ns'.format(seconds * 1000000000)
@@ -0,0 +1,176 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import importlib
+import io
+import json
+import os
+import time
+from contextlib import redirect_stdout
+from multiprocessing import Pool
+from typing import Any, Callable, Dict, List, Tuple, Union
+from xml.etree import ElementTree
+
+from sims4communitylib.testing.common_test_service import CommonTestService, CommonTestResultType
+
+
+def _run_test_class(test_module_names: Tuple[str], class_name: str) -> Dict[str, Any]:
+    # Runs inside of a worker process. Importing the test modules registers their tests in processes that did not inherit them.
+    for test_module_name in test_module_names:
+        importlib.import_module(test_module_name)
+    test_results = list()
+    class_start_time = time.perf_counter()
+    for test_name, test in CommonTestService.get().get_tests_by_class_name(class_name):
+        output = io.StringIO()
+        test_start_time = time.perf_counter()
+        with redirect_stdout(output):
+            result = test()
+        test_results.append({
+            'name': test_name,
+            'result': result,
+            'time': time.perf_counter() - test_start_time,
+            'output': output.getvalue()
+        })
+    return {
+        'class_name': class_name,
+        'time': time.perf_counter() - class_start_time,
+        'tests': test_results
+    }
+
+
+class CommonTestRunner:
+    """
+        Runs registered tests outside of the game, spreading the test classes across a pool of processes.
+
+        The wall time of every test and every test class is recorded and can be written as a JSON report and/or a JUnit XML report.
+        When a previous JSON report exists, the slowest test classes are started first so the suite finishes sooner.
+
+        Example:
+
+        CommonTestRunner(max_processes=4).run(json_report_file_path='test_results.json', junit_report_file_path='test_results.xml')
+    """
+    def __init__(self, max_processes: int=None):
+        """
+            Create a test runner.
+        :param max_processes: The number of worker processes to run tests in. Defaults to the number of CPUs.
+        """
+        self._max_processes = max_processes or os.cpu_count() or 1
+
+    def run(self, *class_names: str, callback: Callable[..., Any]=print, json_report_file_path: str=None, junit_report_file_path: str=None, timings_file_path: str=None) -> bool:
+        """
+            Runs the tests of the specified classes.
+        :param class_names: A collection of classes to run tests for. If none are specified, all tests will be run.
+        :param callback: The callback to send string results to.
+        :param json_report_file_path: If specified, a JSON report of the results and timings will be written to this file.
+        :param junit_report_file_path: If specified, a JUnit XML report of the results and timings will be written to this file.
+        :param timings_file_path: A JSON report from a previous run, used to start the slowest classes first. Defaults to json_report_file_path.
+        :return: True if all tests succeeded.
+        """
+        if len(class_names) > 0:
+            class_tests = tuple([class_name.lower() for class_name in class_names])
+        else:
+            class_tests = tuple(CommonTestService.get().all_tests.keys())
+        previous_class_times = self._load_class_times(timings_file_path or json_report_file_path)
+        # Classes without a previous timing go first, as they may be just as slow as the slowest known class.
+        scheduled_class_tests = sorted(class_tests, key=lambda name: -previous_class_times.get(name, float('inf')))
+        test_module_names = self._get_test_module_names(class_tests)
+
+        callback('Running Tests in {} processes'.format(self._max_processes))
+        start_time = time.perf_counter()
+        with Pool(processes=min(self._max_processes, max(1, len(class_tests)))) as pool:
+            pending_results = [(class_name, pool.apply_async(_run_test_class, (test_module_names, class_name))) for class_name in scheduled_class_tests]
+            class_results = {class_name: pending_result.get() for (class_name, pending_result) in pending_results}
+        total_time = time.perf_counter() - start_time
+
+        total_run_test_count = 0
+        total_failed_test_count = 0
+        for class_name in class_tests:
+            class_result = class_results[class_name]
+            callback('Running Tests for class \'{}\''.format(class_name))
+            total_test_count = len(class_result['tests'])
+            failed_test_count = 0
+            current_test_count = 0
+            for test_result in class_result['tests']:
+                total_run_test_count += 1
+                current_test_count += 1
+                if test_result['result'] == CommonTestResultType.FAILED:
+                    failed_test_count += 1
+                    total_failed_test_count += 1
+                    callback(test_result['output'].rstrip('\n'))
+                callback('{} of {} {} {} ({:0.4f}s)'.format(current_test_count, total_test_count, test_result['result'], test_result['name'], test_result['time']))
+            callback('{} of {} tests Succeeded for class \'{}\' ({:0.4f}s)\n'.format(total_test_count - failed_test_count, total_test_count, class_name, class_result['time']))
+        callback('{} of {} total tests Succeeded ({:0.4f}s)'.format(total_run_test_count - total_failed_test_count, total_run_test_count, total_time))
+
+        ordered_class_results = [class_results[class_name] for class_name in class_tests]
+        if json_report_file_path:
+            self._write_json_report(json_report_file_path, ordered_class_results, total_time)
+        if junit_report_file_path:
+            self._write_junit_report(junit_report_file_path, ordered_class_results, total_time)
+        return total_failed_test_count == 0
+
+    @staticmethod
+    def _get_test_module_names(class_names: Tuple[str]) -> Tuple[str]:
+        test_module_names = list()
+        for class_name in class_names:
+            for (_, test) in CommonTestService.get().get_tests_by_class_name(class_name):
+                if test.__module__ not in test_module_names:
+                    test_module_names.append(test.__module__)
+        return tuple(test_module_names)
+
+    @staticmethod
+    def _load_class_times(file_path: Union[str, None]) -> Dict[str, float]:
+        if not file_path or not os.path.isfile(file_path):
+            return dict()
+        try:
+            with open(file_path, mode='r', encoding='utf-8') as file:
+                report = json.load(file)
+            return {class_name: class_report['time'] for (class_name, class_report) in report['classes'].items()}
+        except (ValueError, KeyError, TypeError):
+            return dict()
+
+    @staticmethod
+    def _write_json_report(file_path: str, class_results: List[Dict[str, Any]], total_time: float):
+        report = {
+            'time': total_time,
+            'tests': sum([len(class_result['tests']) for class_result in class_results]),
+            'failures': sum([1 for class_result in class_results for test_result in class_result['tests'] if test_result['result'] == CommonTestResultType.FAILED]),
+            'classes': {
+                class_result['class_name']: {
+                    'time': class_result['time'],
+                    'tests': [{'name': test_result['name'], 'result': test_result['result'], 'time': test_result['time']} for test_result in class_result['tests']]
+                } for class_result in class_results
+            }
+        }
+        with open(file_path, mode='w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+    @staticmethod
+    def _write_junit_report(file_path: str, class_results: List[Dict[str, Any]], total_time: float):
+        test_suites = ElementTree.Element('testsuites', name='sims4communitylib', time='{:0.6f}'.format(total_time))
+        total_test_count = 0
+        total_failed_test_count = 0
+        for class_result in class_results:
+            failed_test_results = [test_result for test_result in class_result['tests'] if test_result['result'] == CommonTestResultType.FAILED]
+            total_test_count += len(class_result['tests'])
+            total_failed_test_count += len(failed_test_results)
+            test_suite = ElementTree.SubElement(
+                test_suites,
+                'testsuite',
+                name=class_result['class_name'],
+                tests=str(len(class_result['tests'])),
+                failures=str(len(failed_test_results)),
+                errors='0',
+                time='{:0.6f}'.format(class_result['time'])
+            )
+            for test_result in class_result['tests']:
+                test_case = ElementTree.SubElement(test_suite, 'testcase', classname=class_result['class_name'], name=test_result['name'], time='{:0.6f}'.format(test_result['time']))
+                if test_result['result'] == CommonTestResultType.FAILED:
+                    failure = ElementTree.SubElement(test_case, 'failure', message='{} failed'.format(test_result['name']))
+                    failure.text = test_result['output']
+        test_suites.set('tests', str(total_test_count))
+        test_suites.set('failures', str(total_failed_test_count))
+        ElementTree.ElementTree(test_suites).write(file_path, encoding='utf-8', xml_declaration=True)
@@ -12,6 +12,9 @@ from sims4communitylib.exceptions.common_exceptions_handler import CommonExcepti
 from sims4communitylib.modinfo import ModInfo
 from sims4communitylib.services.common_service import CommonService
 try:
+    # The test log can only be written to while running within the game.
+    # noinspection PyUnresolvedReferences
+    import sims4.commands
     from sims4communitylib.utils.common_log_registry import CommonLogRegistry
 
     community_test_log_log = CommonLogRegistry.get().register_log(ModInfo.get_identity().name, 'community_test_log')
@@ -0,0 +1,101 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from collections import deque
+from datetime import datetime
+from pprint import pformat
+from typing import Any, Deque, Dict, Iterator, Tuple, Union
+from sims4communitylib.utils.common_io_utils import CommonIOUtils
+
+
+class CommonLogBuffer:
+    """
+        Holds the latest messages of the logs of a mod in memory, so they can be written to a file when something goes wrong.
+
+        The buffer holds at most max_messages messages, once it is full the oldest message is thrown away for each new message.
+        The arguments of a message are kept as they were passed in and are only formatted into it when the buffer is dumped,
+        which means an argument that is changed after it was logged is written as it was when dumped.
+    """
+    def __init__(self, mod_name: str, max_messages: int=1000):
+        """
+            Create a log buffer.
+        :param mod_name: The name of the mod the buffer holds messages for.
+        :param max_messages: The maximum number of messages held.
+        """
+        self._mod_name = mod_name
+        self._messages: Deque[Tuple[datetime, str, str, Union[str, None], Union[Tuple[Any, ...], None], Union[Tuple[Any, ...], None], Union[Dict[str, Any], None]]] = deque(maxlen=max_messages)
+
+    @property
+    def mod_name(self) -> str:
+        """ The name of the mod the buffer holds messages for. """
+        return self._mod_name
+
+    @property
+    def max_messages(self) -> int:
+        """ The maximum number of messages held. """
+        return self._messages.maxlen
+
+    @property
+    def message_count(self) -> int:
+        """ The number of messages held. """
+        return len(self._messages)
+
+    def resize(self, max_messages: int):
+        """
+            Change the maximum number of messages held, throwing away the oldest messages if there are too many.
+        :param max_messages: The maximum number of messages held.
+        """
+        if max_messages == self._messages.maxlen:
+            return
+        self._messages = deque(self._messages, maxlen=max_messages)
+
+    def add_message(self, message_type: str, log_name: str, message: Union[str, None], message_args: Tuple[Any, ...]=None, args: Tuple[Any, ...]=None, kwargs: Dict[str, Any]=None):
+        """
+            Add a message to the buffer.
+        :param message_type: The type of message being logged.
+        :param log_name: The name of the log the message is logged to.
+        :param message: The message being logged or None if the message only consists of arguments.
+        :param message_args: The arguments to format into the message using str.format when it is dumped or None if the message is complete.
+        :param args: The arguments to format into the message when it is dumped or None if the message is not formatted.
+        :param kwargs: The keyword arguments to format into the message when it is dumped or None if the message is not formatted.
+        """
+        self._messages.append((datetime.now(), message_type, log_name, message, message_args, args, kwargs))
+
+    def format_messages(self) -> Iterator[str]:
+        """
+            Format the messages held, oldest first.
+        :return: An iterator of the formatted messages.
+        """
+        for (date_time, message_type, log_name, message, message_args, args, kwargs) in tuple(self._messages):
+            if message_args is not None:
+                message = message.format(*message_args)
+            if args is not None or kwargs is not None:
+                formatted_arguments = '{}, {}\n'.format(pformat(args or tuple()), pformat(kwargs or dict()))
+                message = formatted_arguments if message is None else '{} {}'.format(message, formatted_arguments)
+            yield '{} [{}] {}: [{}]: {}\n'.format(date_time.strftime('%Y-%m-%d %H:%M:%S.%f'), self._mod_name, str(message_type), log_name, message)
+
+    def dump(self, file_path: str) -> int:
+        """
+            Write the messages held to a file and clear the buffer.
+        :param file_path: The file to append the messages to.
+        :return: The number of messages written.
+        """
+        if not self._messages:
+            return 0
+        message_count = len(self._messages)
+        CommonIOUtils.write_to_file(file_path, ''.join(self.format_messages()), ignore_errors=True)
+        self._messages.clear()
+        return message_count
+
+    def clear(self):
+        """
+            Throw away the messages held.
+        """
+        self._messages.clear()
+
+    def __str__(self):
+        return 'CommonLogBuffer Mod: {} Messages: {}/{}'.format(self._mod_name, self.message_count, self.max_messages)
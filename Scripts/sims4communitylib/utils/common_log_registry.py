@@ -5,13 +5,13 @@ https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-import sims4.commands
-from typing import List, Dict
+from typing import List, Dict, Union
 from pprint import pformat
 
 from sims4communitylib.enums.enumtypes.string_enum import CommonEnumStringBase
 from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
 from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_log_buffer import CommonLogBuffer
 from sims4communitylib.utils.common_log_utils import CommonLogUtils
 
 
@@ -28,27 +28,38 @@ class CommonLog:
         self._log_name = log_name
         self._mod_name = mod_name
         self._enabled = False
+        self._buffer: Union[CommonLogBuffer, None] = None
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """
             Log a message with message type DEBUG.
+            The message is only formatted with the arguments when the log is enabled, so pass values as arguments instead of formatting them into the message beforehand.
+
+            Example:
+
+            log.debug('Checking household \'{}\' for match.', household_name)
         :param message: The message to log.
+        :param args: Arguments to format into the message using str.format.
         """
-        if self.enabled:
-            self._log_message(CommonMessageType.DEBUG, message)
+        if self._enabled:
+            self._log_formatted_message(CommonMessageType.DEBUG, message, args)
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """
             Log a message with message type INFO.
+            The message is only formatted with the arguments when the log is enabled.
         :param message: The message to log.
+        :param args: Arguments to format into the message using str.format.
         """
-        if self.enabled:
-            self._log_message(CommonMessageType.INFO, message)
+        if self._enabled:
+            self._log_formatted_message(CommonMessageType.INFO, message, args)
 
     def format_info(self, *args, **kwargs):
         """
             Log a non-descriptive message containing pformatted arguments and keyword arguments with message type INFO.
         """
+        if not self._enabled:
+            return
         self.format(*args, message_type=CommonMessageType.INFO, **kwargs)
 
     def format_info_with_message(self, message: str, *args, **kwargs):
@@ -56,6 +67,8 @@ class CommonLog:
             Log a message containing pformatted arguments and keyword arguments with message type INFO.
         :param message: The message to log.
         """
+        if not self._enabled:
+            return
         self.format_with_message(message, *args, message_type=CommonMessageType.INFO, **kwargs)
 
     def format(self, *args, message_type: str=CommonMessageType.DEBUG, **kwargs):
@@ -63,7 +76,10 @@ class CommonLog:
             Log a non-descriptive message containing pformatted arguments and keyword arguments with the specified message type.
         :param message_type: The MessageType of the logged message.
         """
-        if self.enabled:
+        if self._enabled:
+            if self._buffer is not None:
+                self._buffer.add_message(message_type, self.name, None, args=args, kwargs=kwargs)
+                return
             self._log_message(message_type, '{}, {}\n'.format(pformat(args), pformat(kwargs)))
 
     def format_with_message(self, message: str, *args, message_type: str=CommonMessageType.DEBUG, **kwargs):
@@ -72,7 +88,10 @@ class CommonLog:
         :param message: The message to log.
         :param message_type: The type of message being logged.
         """
-        if self.enabled:
+        if self._enabled:
+            if self._buffer is not None:
+                self._buffer.add_message(message_type, self.name, message, args=args, kwargs=kwargs)
+                return
             self._log_message(message_type, '{} {}, {}\n'.format(message, pformat(args), pformat(kwargs)))
 
     def error(self, message: str, message_type: str=CommonMessageType.ERROR, exception: Exception=None, throw: bool=True):
@@ -85,9 +104,9 @@ class CommonLog:
         """
         if throw:
             CommonExceptionHandler.log_exception(self._mod_name, message, exception=exception)
-        self._log_message(message_type, message)
+        self._write_message(message_type, message)
         if exception is not None:
-            self._log_message(message_type, pformat(exception))
+            self._write_message(message_type, pformat(exception))
 
     def format_error(self, *args, exception: Exception=None, throw: bool=True, **kwargs):
         """
@@ -130,6 +149,39 @@ class CommonLog:
         """
         self._enabled = False
     
+    def enable_buffering(self, buffer: CommonLogBuffer):
+        """
+            Log messages to a buffer in memory instead of to the messages file, errors are still written to the messages file.
+        :param buffer: The buffer to log messages to.
+        """
+        self._buffer = buffer
+
+    def disable_buffering(self):
+        """
+            Log messages to the messages file again.
+        """
+        self._buffer = None
+
+    @property
+    def buffered(self) -> bool:
+        """
+            Determine if messages are logged to a buffer in memory.
+        :return: True if messages are logged to a buffer.
+        """
+        return self._buffer is not None
+
+    def is_enabled(self) -> bool:
+        """
+            Determine if the log is enabled, as a cheap guard around building messages that are expensive to create.
+
+            Example:
+
+            if log.is_enabled():
+                log.format_with_message('Found Sims.', sims=[CommonSimNameUtils.get_full_name(sim_info) for sim_info in sim_info_list])
+        :return: True if the log is enabled.
+        """
+        return self._enabled
+
     @property
     def enabled(self) -> bool:
         """
@@ -146,12 +198,24 @@ class CommonLog:
         """
         return self._log_name
 
+    def _log_formatted_message(self, message_type: str, message: str, message_args: tuple):
+        if self._buffer is not None:
+            self._buffer.add_message(message_type, self.name, message, message_args=message_args or None)
+            return
+        self._write_message(message_type, message.format(*message_args) if message_args else message)
+
     def _log_message(self, message_type: str, message: str):
         """
             Log a message with message type.
         :param message_type: The type of message being logged.
         :param message: The message being logged.
         """
+        if self._buffer is not None:
+            self._buffer.add_message(message_type, self.name, message)
+            return
+        self._write_message(message_type, message)
+
+    def _write_message(self, message_type: str, message: str):
         from sims4communitylib.utils.common_date_utils import CommonRealDateUtils
         from pprint import pformat
         from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
@@ -172,6 +236,7 @@ class CommonLogRegistry(CommonService):
     """
     def __init__(self):
         self._registered_logs: Dict[str, List[CommonLog]] = dict()
+        self._log_buffers: Dict[str, CommonLogBuffer] = dict()
 
     def get_registered_log_names(self) -> List[str]:
         """
@@ -246,47 +311,136 @@ class CommonLogRegistry(CommonService):
                 log.disable()
         return True
 
+    def enable_log_buffering(self, log_name: str, max_messages: int=None) -> bool:
+        """
+            Enable all logs with the specified name and log their messages to the in memory buffer of their mod instead of to the messages file.
+            The buffer of a mod is written to a file when an exception is logged for the mod or when the buffers are dumped.
+        :param log_name: The name of the logs.
+        :param max_messages: The maximum number of messages held by the buffer of each mod. Defaults to the current size of the buffer.
+        :return: True if successful
+        """
+        for log in self._registered_logs.get(log_name, list()):
+            log.enable_buffering(self.get_log_buffer(log._mod_name, max_messages=max_messages))
+            log.enable()
+        return True
+
+    def disable_log_buffering(self, log_name: str) -> bool:
+        """
+            Disable all logs with the specified name and stop logging their messages to a buffer.
+        :param log_name: The name of the logs.
+        :return: True if successful
+        """
+        for log in self._registered_logs.get(log_name, list()):
+            log.disable_buffering()
+            log.disable()
+        return True
 
-@sims4.commands.Command('s4clib.enable_log', 's4clib.enablelog', command_type=sims4.commands.CommandType.Live)
-def _common_command_enable_log(*args, _connection: int=None):
-    output = sims4.commands.CheatOutput(_connection)
-    if len(args) == 0 or args[0] is None:
-        output('specify a log name (See all logs via "s4clib.logs" command)')
-        return
-    if CommonLogRegistry.get().log_exists(args[0]) and CommonLogRegistry.get().enable_logs(args[0]):
-        output('Log enabled: ' + str(args[0]))
-    else:
-        output('No log found: ' + str(args[0]))
-
-
-@sims4.commands.Command('s4clib.disable_log', 's4clib.disablelog', command_type=sims4.commands.CommandType.Live)
-def _common_command_disable_log(*args, _connection: int=None):
-    output = sims4.commands.CheatOutput(_connection)
-    if len(args) == 0 or args[0] is None:
-        output('specify a log name (See all logs via "s4clib.logs" command)')
-        return
-    if CommonLogRegistry.get().log_exists(args[0]) and CommonLogRegistry.get().disable_logs(args[0]):
-        output('Log disabled: ' + str(args[0]))
-    else:
-        output('No log found: ' + str(args[0]))
-
-
-@sims4.commands.Command('s4clib.disable_all_logs', 's4clib.disablealllogs', command_type=sims4.commands.CommandType.Live)
-def _common_command_disable_all_logs(_connection: int=None):
-    output = sims4.commands.CheatOutput(_connection)
-    output('Disabling all logs')
-    CommonLogRegistry.get().disable_all_logs()
-    output('All logs disabled')
-
-
-@sims4.commands.Command('s4clib.logs', command_type=sims4.commands.CommandType.Live)
-def _common_command_show_all_logs(_connection: int=None):
-    output = sims4.commands.CheatOutput(_connection)
-    log_names = CommonLogRegistry.get().get_registered_log_names()
-    if log_names is None or output is None:
-        return
-    if len(log_names) == 0:
-        output('No registered logs found')
-        return
-    for log_name in log_names:
-        output('' + str(log_name))
+    def get_log_buffer(self, mod_name: str, max_messages: int=None) -> CommonLogBuffer:
+        """
+            Retrieve the in memory log buffer of a mod, creating it if it does not exist.
+        :param mod_name: The name of the mod.
+        :param max_messages: The maximum number of messages held by the buffer. Defaults to the current size of the buffer.
+        :return: The log buffer of the mod.
+        """
+        log_buffer = self._log_buffers.get(mod_name, None)
+        if log_buffer is None:
+            log_buffer = CommonLogBuffer(mod_name) if max_messages is None else CommonLogBuffer(mod_name, max_messages=max_messages)
+            self._log_buffers[mod_name] = log_buffer
+        elif max_messages is not None:
+            log_buffer.resize(max_messages)
+        return log_buffer
+
+    def dump_log_buffers(self, mod_name: str=None) -> int:
+        """
+            Write the messages held by log buffers to the 'Buffered_Messages' file of their mod and clear the buffers.
+        :param mod_name: The name of the mod to dump the buffer of. Defaults to dumping the buffers of every mod.
+        :return: The number of messages written.
+        """
+        if mod_name is not None:
+            log_buffers = [self._log_buffers[mod_name]] if mod_name in self._log_buffers else list()
+        else:
+            log_buffers = list(self._log_buffers.values())
+        message_count = 0
+        for log_buffer in log_buffers:
+            if log_buffer.message_count == 0:
+                continue
+            message_count += log_buffer.dump(CommonLogUtils.get_buffered_message_file_path(log_buffer.mod_name))
+        return message_count
+
+
+try:
+    import sims4.commands
+
+    @sims4.commands.Command('s4clib.enable_log', 's4clib.enablelog', command_type=sims4.commands.CommandType.Live)
+    def _common_command_enable_log(*args, _connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        if len(args) == 0 or args[0] is None:
+            output('specify a log name (See all logs via "s4clib.logs" command)')
+            return
+        if CommonLogRegistry.get().log_exists(args[0]) and CommonLogRegistry.get().enable_logs(args[0]):
+            output('Log enabled: ' + str(args[0]))
+        else:
+            output('No log found: ' + str(args[0]))
+
+
+    @sims4.commands.Command('s4clib.disable_log', 's4clib.disablelog', command_type=sims4.commands.CommandType.Live)
+    def _common_command_disable_log(*args, _connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        if len(args) == 0 or args[0] is None:
+            output('specify a log name (See all logs via "s4clib.logs" command)')
+            return
+        if CommonLogRegistry.get().log_exists(args[0]) and CommonLogRegistry.get().disable_logs(args[0]):
+            output('Log disabled: ' + str(args[0]))
+        else:
+            output('No log found: ' + str(args[0]))
+
+
+    @sims4.commands.Command('s4clib.disable_all_logs', 's4clib.disablealllogs', command_type=sims4.commands.CommandType.Live)
+    def _common_command_disable_all_logs(_connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        output('Disabling all logs')
+        CommonLogRegistry.get().disable_all_logs()
+        output('All logs disabled')
+
+
+    @sims4.commands.Command('s4clib.logs', command_type=sims4.commands.CommandType.Live)
+    def _common_command_show_all_logs(_connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        log_names = CommonLogRegistry.get().get_registered_log_names()
+        if log_names is None or output is None:
+            return
+        if len(log_names) == 0:
+            output('No registered logs found')
+            return
+        for log_name in log_names:
+            output('' + str(log_name))
+
+    @sims4.commands.Command('s4clib.enable_log_buffer', 's4clib.enablelogbuffer', command_type=sims4.commands.CommandType.Live)
+    def _common_command_enable_log_buffer(log_name: str=None, max_messages: int=None, _connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        if log_name is None:
+            output('specify a log name (See all logs via "s4clib.logs" command)')
+            return
+        if CommonLogRegistry.get().log_exists(log_name) and CommonLogRegistry.get().enable_log_buffering(log_name, max_messages=max_messages):
+            output('Log buffer enabled: ' + str(log_name))
+        else:
+            output('No log found: ' + str(log_name))
+
+    @sims4.commands.Command('s4clib.disable_log_buffer', 's4clib.disablelogbuffer', command_type=sims4.commands.CommandType.Live)
+    def _common_command_disable_log_buffer(log_name: str=None, _connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        if log_name is None:
+            output('specify a log name (See all logs via "s4clib.logs" command)')
+            return
+        if CommonLogRegistry.get().log_exists(log_name) and CommonLogRegistry.get().disable_log_buffering(log_name):
+            output('Log buffer disabled: ' + str(log_name))
+        else:
+            output('No log found: ' + str(log_name))
+
+    @sims4.commands.Command('s4clib.dump_log_buffers', 's4clib.dumplogbuffers', command_type=sims4.commands.CommandType.Live)
+    def _common_command_dump_log_buffers(_connection: int=None):
+        output = sims4.commands.CheatOutput(_connection)
+        message_count = CommonLogRegistry.get().dump_log_buffers()
+        output('Dumped {} buffered log messages'.format(message_count))
+except ModuleNotFoundError:
+    pass
@@ -0,0 +1,220 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import gzip
+import os
+import re
+import shutil
+import threading
+from typing import Dict, List, Set, Union
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_date_utils import CommonRealDateUtils
+
+
+class CommonLogRotationService(CommonService):
+    """
+        Keeps log files from growing without limit, without slowing down the writes to them.
+
+        Log files are watched instead of being checked each time they are written to.
+        A background thread checks the size of each watched file on a timer and once a file is bigger than max_file_size,
+        it is moved aside to 'Old_<File Name>_<Date>.<Extension>.gz' (With a counter after the date if that archive already exists) and compressed with gzip.
+        Only the newest max_archive_count archives are kept for each mod, counting the archives of every file watched for the mod, or for each file watched without a mod name.
+        Moving the file aside is a single rename, the file is created again by the next write to it.
+        A file that could not be compressed, for example because the disk is full, is left as 'Old_<File Name>_<Date>.<Extension>.rotating' and compressed on a later check.
+    """
+    # 1 MB
+    DEFAULT_MAX_FILE_SIZE = 1048576
+    DEFAULT_MAX_ARCHIVE_COUNT = 5
+    DEFAULT_CHECK_INTERVAL_SECONDS = 30.0
+
+    def __init__(self):
+        self.max_file_size = CommonLogRotationService.DEFAULT_MAX_FILE_SIZE
+        self.max_archive_count = CommonLogRotationService.DEFAULT_MAX_ARCHIVE_COUNT
+        self.check_interval_seconds = CommonLogRotationService.DEFAULT_CHECK_INTERVAL_SECONDS
+        self._watched_file_paths: Set[str] = set()
+        self._mod_name_by_file_path: Dict[str, str] = dict()
+        # The watched files that may have files left over from a rotation that was not finished.
+        self._unfinished_file_paths: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Union[threading.Thread, None] = None
+
+    @property
+    def running(self) -> bool:
+        """ Determine if the background thread is checking the watched files. """
+        return self._thread is not None and self._thread.is_alive()
+
+    def watch(self, file_path: str, mod_name: str=None):
+        """
+            Watch a log file, starting the background thread if it is not running yet.
+        :param file_path: The log file.
+        :param mod_name: The name of the mod the log file belongs to, the archives of all files of a mod count towards the same max_archive_count. Default is None.
+        """
+        if file_path in self._watched_file_paths:
+            return
+        with self._lock:
+            self._watched_file_paths.add(file_path)
+            self._unfinished_file_paths.add(file_path)
+            if mod_name is not None:
+                self._mod_name_by_file_path[file_path] = mod_name
+        self.start()
+
+    def start(self):
+        """
+            Start the background thread.
+        """
+        if self.running:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='S4CL Log Rotation', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stop the background thread.
+        """
+        self._stop_event.set()
+        self._thread = None
+
+    def _run(self):
+        # The stop event of this thread is kept, so that stopping and starting again quickly does not leave two threads running.
+        stop_event = self._stop_event
+        while not stop_event.wait(self.check_interval_seconds):
+            self.rotate_files()
+
+    def rotate_files(self) -> int:
+        """
+            Rotate each watched file that is bigger than max_file_size.
+        :return: The number of files rotated.
+        """
+        with self._lock:
+            watched_file_paths = list(self._watched_file_paths)
+            unfinished_file_paths = list(self._unfinished_file_paths)
+        for file_path in unfinished_file_paths:
+            if self.finish_rotations(file_path):
+                with self._lock:
+                    self._unfinished_file_paths.discard(file_path)
+        rotated_count = 0
+        for file_path in watched_file_paths:
+            try:
+                if os.path.isfile(file_path) and os.path.getsize(file_path) > self.max_file_size:
+                    if self.rotate_file(file_path):
+                        rotated_count += 1
+            except OSError:
+                # The file may be in use, it will be tried again on the next check.
+                pass
+        return rotated_count
+
+    def rotate_file(self, file_path: str) -> bool:
+        """
+            Move a log file aside, compress it and remove the oldest archives of it.
+        :param file_path: The log file.
+        :return: True if the file was rotated.
+        """
+        (directory_path, file_name) = os.path.split(file_path)
+        (base_name, file_extension) = os.path.splitext(file_name)
+        current_date_time = str(CommonRealDateUtils.get_current_date_string()).replace(':', '_')
+        archive_file_path = os.path.join(directory_path, 'Old_{}_{}{}'.format(base_name, current_date_time, file_extension))
+        counter = 1
+        while os.path.exists(archive_file_path + '.gz') or os.path.exists(archive_file_path + '.rotating'):
+            archive_file_path = os.path.join(directory_path, 'Old_{}_{}_{}{}'.format(base_name, current_date_time, counter, file_extension))
+            counter += 1
+        rotating_file_path = archive_file_path + '.rotating'
+        try:
+            os.rename(file_path, rotating_file_path)
+        except OSError:
+            return False
+        if not CommonLogRotationService._compress_file(rotating_file_path):
+            with self._lock:
+                self._unfinished_file_paths.add(file_path)
+        self.remove_old_archives(file_path)
+        return True
+
+    def finish_rotations(self, file_path: str) -> bool:
+        """
+            Compress the files of a log file that were moved aside but not compressed.
+        :param file_path: The log file.
+        :return: True if every file that was moved aside is compressed.
+        """
+        finished = True
+        for rotating_file_path in CommonLogRotationService.get_rotating_file_paths(file_path):
+            if not CommonLogRotationService._compress_file(rotating_file_path):
+                finished = False
+        if finished:
+            self.remove_old_archives(file_path)
+        return finished
+
+    @staticmethod
+    def _compress_file(rotating_file_path: str) -> bool:
+        archive_file_path = rotating_file_path[:-len('.rotating')] + '.gz'
+        try:
+            with open(rotating_file_path, mode='rb') as file, gzip.open(archive_file_path, mode='wb') as archive_file:
+                shutil.copyfileobj(file, archive_file)
+            os.remove(rotating_file_path)
+            return True
+        except OSError:
+            # A partly written archive is removed, the file is compressed again on a later check.
+            try:
+                if os.path.exists(archive_file_path):
+                    os.remove(archive_file_path)
+            except OSError:
+                pass
+            return False
+
+    def remove_old_archives(self, file_path: str) -> List[str]:
+        """
+            Remove the oldest archives of the mod of a log file, keeping the newest max_archive_count archives.
+            If the log file was not watched with a mod name, only the archives of the log file itself are counted.
+        :param file_path: The log file.
+        :return: The file paths of the removed archives.
+        """
+        with self._lock:
+            mod_name = self._mod_name_by_file_path.get(file_path, None)
+            if mod_name is None:
+                mod_file_paths = [file_path]
+            else:
+                mod_file_paths = sorted([watched_file_path for (watched_file_path, watched_mod_name) in self._mod_name_by_file_path.items() if watched_mod_name == mod_name])
+        archive_file_paths = list()
+        for mod_file_path in mod_file_paths:
+            archive_file_paths.extend(CommonLogRotationService.get_archive_file_paths(mod_file_path))
+        archive_file_paths.sort(key=lambda archive_file_path: (os.path.getmtime(archive_file_path), archive_file_path))
+        removed_file_paths = archive_file_paths[:max(0, len(archive_file_paths) - self.max_archive_count)]
+        for archive_file_path in removed_file_paths:
+            os.remove(archive_file_path)
+        return removed_file_paths
+
+    @staticmethod
+    def get_archive_file_paths(file_path: str) -> List[str]:
+        """
+            Retrieve the archives of a log file.
+        :param file_path: The log file.
+        :return: The file paths of the archives, oldest first.
+        """
+        return CommonLogRotationService._get_old_file_paths(file_path, '.gz')
+
+    @staticmethod
+    def get_rotating_file_paths(file_path: str) -> List[str]:
+        """
+            Retrieve the files of a log file that were moved aside but not compressed.
+        :param file_path: The log file.
+        :return: The file paths of the files moved aside, oldest first.
+        """
+        return CommonLogRotationService._get_old_file_paths(file_path, '.rotating')
+
+    @staticmethod
+    def _get_old_file_paths(file_path: str, suffix: str) -> List[str]:
+        (directory_path, file_name) = os.path.split(file_path)
+        (base_name, file_extension) = os.path.splitext(file_name)
+        # Only the date may follow the name of the log file, so the archives of a log whose name starts with the same name are not matched.
+        old_file_pattern = re.compile(r'^Old_{}_\d{{4}}-\d{{2}}-\d{{2}} \d{{2}}_\d{{2}}_\d{{2}}\.\d{{6}}(_\d+)?{}{}$'.format(re.escape(base_name), re.escape(file_extension), re.escape(suffix)))
+        if not os.path.isdir(directory_path or '.'):
+            return list()
+        old_file_paths = [os.path.join(directory_path, old_file_name) for old_file_name in os.listdir(directory_path or '.') if old_file_pattern.match(old_file_name)]
+        return sorted(old_file_paths, key=lambda old_file_path: (os.path.getmtime(old_file_path), old_file_path))
+
+    def __str__(self):
+        return 'CommonLogRotationService Running: {} Watched Files: {} Max File Size: {} Max Archives: {}'.format(self.running, len(self._watched_file_paths), self.max_file_size, self.max_archive_count)
@@ -6,13 +6,13 @@ https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
 Copyright (c) COLONOLNUTTY
 """
 import os
-from sims4communitylib.utils.common_date_utils import CommonRealDateUtils
+from typing import Union
+from sims4communitylib.utils.common_log_rotation_service import CommonLogRotationService
 
 
 class CommonLogUtils:
     """ Utilities for getting paths used for logging. """
-    # 10 MB
-    _MAX_FILE_SIZE = 1048576
+    _SIMS_DOCUMENTS_LOCATION_PATH: Union[str, None] = None
 
     @staticmethod
     def get_exceptions_file_path(mod_name: str) -> str:
@@ -32,12 +32,36 @@ class CommonLogUtils:
         """
         return CommonLogUtils._get_file_path(mod_name, 'Messages')
 
+    @staticmethod
+    def get_buffered_message_file_path(mod_name: str) -> str:
+        """
+            Retrieve the file path to the Buffered Messages file that log buffers are dumped to.
+        :param mod_name: The name of the mod requesting the file path.
+        :return: An str file path to the Buffered Messages file.
+        """
+        return CommonLogUtils._get_file_path(mod_name, 'Buffered_Messages')
+
+    @staticmethod
+    def get_zone_load_profile_file_path(mod_name: str) -> str:
+        """
+            Retrieve the file path to the Zone Load Profile file used for recording zone load timings as JSON lines.
+        :param mod_name: The name of the mod requesting the file path.
+        :return: An str file path to the Zone Load Profile file.
+        """
+        return CommonLogUtils._get_file_path(mod_name, 'Zone_Load_Profile', file_extension='jsonl')
+
     @staticmethod
     def get_sims_documents_location_path() -> str:
         """
             Retrieves the folder path of the folder 'Documents\Electronic Arts\The Sims 4'
         :return: The file path to 'Documents\Electronic Arts\The Sims 4' folder.
         """
+        if CommonLogUtils._SIMS_DOCUMENTS_LOCATION_PATH is None:
+            CommonLogUtils._SIMS_DOCUMENTS_LOCATION_PATH = CommonLogUtils._find_sims_documents_location_path()
+        return CommonLogUtils._SIMS_DOCUMENTS_LOCATION_PATH
+
+    @staticmethod
+    def _find_sims_documents_location_path() -> str:
         file_path = ''
         from sims4communitylib.modinfo import ModInfo
         root_file = os.path.normpath(os.path.dirname(os.path.realpath(ModInfo.get_identity().file_path))).replace(os.sep, '/')
@@ -49,20 +73,16 @@ class CommonLogUtils:
         return file_path
 
     @staticmethod
-    def _get_file_path(mod_name: str, file_name: str) -> str:
+    def _get_file_path(mod_name: str, file_name: str, file_extension: str='txt') -> str:
         """
             Get an absolute file path to the file with the file name.
+            The file is rotated by the CommonLogRotationService once it grows too big.
         :param mod_name: The name of the mod requesting the file name.
         :param file_name: A part of the name of the file being requested.
+        :param file_extension: The extension of the file being requested.
         :return: Ab str file path to the file.
         """
         root_path = CommonLogUtils.get_sims_documents_location_path()
-        file_path = os.path.join(root_path, '{}_{}.txt'.format(mod_name, file_name))
-        if os.path.exists(file_path) and CommonLogUtils._file_is_too_big(file_path):
-            current_date_time = CommonRealDateUtils.get_current_date_string()
-            os.rename(file_path, os.path.join(root_path, 'Old_{}_{}_{}.txt'.format(mod_name, file_name, str(current_date_time).replace(':', '_'))))
+        file_path = os.path.join(root_path, '{}_{}.{}'.format(mod_name, file_name, file_extension))
+        CommonLogRotationService.get().watch(file_path, mod_name=mod_name)
         return file_path
-
-    @staticmethod
-    def _file_is_too_big(file_path: str) -> bool:
-        return os.path.getsize(file_path) > CommonLogUtils._MAX_FILE_SIZE
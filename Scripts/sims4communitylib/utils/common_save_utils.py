@@ -0,0 +1,19 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import services
+
+
+class CommonSaveUtils:
+    """ Utilities for retrieving information about the save being played. """
+    @staticmethod
+    def get_save_slot_id() -> int:
+        """
+            Retrieve the identifier of the save slot being played.
+        :return: The decimal identifier of the save slot.
+        """
+        return services.get_persistence_service().get_save_slot_proto_buff().slot_id
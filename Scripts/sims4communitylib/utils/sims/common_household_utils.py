@@ -106,7 +106,7 @@ class CommonHouseholdUtils:
                 continue
             return household
         if not create_on_missing:
-            log.debug('No household found matching name \'{}\'.'.format(name))
+            log.debug('No household found matching name \'{}\'.', name)
             return None
         log.debug('No household found, creating one.')
         return CommonHouseholdUtils.create_empty_household(starting_funds=starting_funds, as_hidden_household=as_hidden_household)
@@ -120,16 +120,16 @@ class CommonHouseholdUtils:
         :return: A Household with the specified name.
         """
         if allow_partial_match:
-            log.debug('Locating households containing name: \'{}\''.format(name))
+            log.debug('Locating households containing name: \'{}\'', name)
         else:
-            log.debug('Locating households with name: \'{}\''.format(name))
+            log.debug('Locating households with name: \'{}\'', name)
         for household in CommonHouseholdUtils.get_all_households_generator():
             if household is None:
                 continue
             # noinspection PyPropertyAccess
             household_name = household.name
             # noinspection PyPropertyAccess
-            log.debug('Checking household \'{}\' for match.'.format(household_name))
+            log.debug('Checking household \'{}\' for match.', household_name)
             if household_name is None:
                 continue
             if allow_partial_match:
@@ -311,9 +311,9 @@ class CommonHouseholdUtils:
         :param allow_partial_match: If True, households only need to contain the name to match.
         """
         if allow_partial_match:
-            log.debug('Attempting to delete households containing name \'{}\'.'.format(name))
+            log.debug('Attempting to delete households containing name \'{}\'.', name)
         else:
-            log.debug('Attempting to delete households with name \'{}\'.'.format(name))
+            log.debug('Attempting to delete households with name \'{}\'.', name)
         all_completed = True
         for household in CommonHouseholdUtils.locate_households_by_name_generator(name, allow_partial_match=allow_partial_match):
             if household is None:
@@ -0,0 +1,162 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Iterator, List, Tuple, Union
+
+import services
+from objects import ALL_HIDDEN_REASONS
+from protocolbuffers.Math_pb2 import Vector3
+from sims.sim_info import SimInfo
+from sims4communitylib.classes.common_spatial_grid import CommonSpatialGrid
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.interval.common_interval_event_service import CommonIntervalEventRegistry, CommonIntervalDispatcher
+from sims4communitylib.events.zone_spin.events.zone_teardown import S4CLZoneTeardownEvent
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.location.common_location_utils import CommonLocationUtils
+
+
+class CommonSimSpatialIndex(CommonService):
+    """
+        An index of the positions of instanced Sims, for finding the Sims near a position without checking every Sim.
+
+        The index is kept up to date by an interval, every update_interval_milliseconds the positions of the instanced Sims are read and only the Sims that moved to another cell of the grid are moved within it.
+        Positions are therefore up to update_interval_milliseconds old. Distances are measured on the ground, ignoring the level a Sim is on.
+        The index does nothing until it is first queried, so it costs nothing while no mod uses it.
+
+        Example:
+
+        sim_position = CommonSimLocationUtils.get_position(sim_info)
+        for (nearby_sim_info, distance) in CommonSimSpatialIndex.get().get_sims_in_radius(sim_position, 5.0):
+            pass
+    """
+    DEFAULT_UPDATE_INTERVAL_MILLISECONDS = 1000
+    DEFAULT_CELL_SIZE = 8.0
+
+    def __init__(self):
+        self._grid = CommonSpatialGrid(cell_size=CommonSimSpatialIndex.DEFAULT_CELL_SIZE)
+        self._active = False
+        self._interval_dispatcher: Union[CommonIntervalDispatcher, None] = None
+
+    @property
+    def update_interval_milliseconds(self) -> int:
+        """ The number of milliseconds between updates of the index. """
+        if self._interval_dispatcher is None:
+            return CommonSimSpatialIndex.DEFAULT_UPDATE_INTERVAL_MILLISECONDS
+        return self._interval_dispatcher.minimum_milliseconds_to_dispatch
+
+    @update_interval_milliseconds.setter
+    def update_interval_milliseconds(self, milliseconds: int):
+        self._get_interval_dispatcher().minimum_milliseconds_to_dispatch = milliseconds
+
+    @property
+    def cell_size(self) -> float:
+        """ The width and depth of each cell of the grid. """
+        return self._grid.cell_size
+
+    @cell_size.setter
+    def cell_size(self, cell_size: float):
+        self._grid = CommonSpatialGrid(cell_size=cell_size)
+        if self._active:
+            self.update()
+
+    def update(self):
+        """
+            Update the positions of the instanced Sims. Sims that are no longer instanced are removed.
+        """
+        grid = self._grid
+        instanced_sim_ids = set()
+        for sim in services.sim_info_manager().instanced_sims_gen(allow_hidden_flags=ALL_HIDDEN_REASONS):
+            position = sim.position
+            grid.update(sim.sim_id, position.x, position.z)
+            instanced_sim_ids.add(sim.sim_id)
+        if len(grid) > len(instanced_sim_ids):
+            for sim_id in grid.get_item_ids():
+                if sim_id not in instanced_sim_ids:
+                    grid.remove(sim_id)
+
+    def get_sims_in_radius(self, position: Vector3, radius: float) -> List[Tuple[SimInfo, float]]:
+        """
+            Retrieve the instanced Sims within a distance of a position.
+        :param position: The position.
+        :param radius: The maximum distance of a Sim from the position, in meters.
+        :return: A collection of Sims with their distance from the position, nearest first.
+        """
+        self._activate()
+        return self._to_sim_infos(self._grid.get_in_radius(position.x, position.z, radius))
+
+    def get_nearest_sims(self, position: Vector3, count: int, max_radius: float=None) -> List[Tuple[SimInfo, float]]:
+        """
+            Retrieve the instanced Sims nearest to a position.
+        :param position: The position.
+        :param count: The maximum number of Sims to retrieve.
+        :param max_radius: The maximum distance of a Sim from the position, in meters. Default is no limit.
+        :return: A collection of at most count Sims with their distance from the position, nearest first.
+        """
+        self._activate()
+        return self._to_sim_infos(self._grid.get_nearest(position.x, position.z, count, max_radius=max_radius))
+
+    def get_sims_on_current_lot(self) -> Iterator[SimInfo]:
+        """
+            Retrieve the instanced Sims on the current lot.
+        :return: An iterator of Sims.
+        """
+        self._activate()
+        lot = CommonLocationUtils.get_current_lot()
+        if lot is None:
+            return
+        corners = lot.corners
+        min_x = min([corner.x for corner in corners])
+        min_z = min([corner.z for corner in corners])
+        max_x = max([corner.x for corner in corners])
+        max_z = max([corner.z for corner in corners])
+        sim_info_manager = services.sim_info_manager()
+        # The lot may be rotated, so the Sims within the bounds of its corners are checked against the lot itself.
+        for sim_id in self._grid.get_in_rect(min_x, min_z, max_x, max_z):
+            sim_info = sim_info_manager.get(sim_id)
+            if sim_info is None:
+                continue
+            sim = sim_info.get_sim_instance(allow_hidden_flags=ALL_HIDDEN_REASONS)
+            if sim is None or not lot.is_position_on_lot(sim.position):
+                continue
+            yield sim_info
+
+    def _activate(self):
+        if self._active:
+            return
+        self._active = True
+        self._get_interval_dispatcher()
+        self.update()
+
+    def _get_interval_dispatcher(self) -> CommonIntervalDispatcher:
+        if self._interval_dispatcher is None:
+            self._interval_dispatcher = CommonIntervalEventRegistry.get()._add_tracker(ModInfo.get_identity().name, CommonSimSpatialIndex.DEFAULT_UPDATE_INTERVAL_MILLISECONDS, self._update_on_interval)
+        return self._interval_dispatcher
+
+    def _update_on_interval(self):
+        if self._active:
+            self.update()
+
+    def _reset(self):
+        self._grid.clear()
+        self._active = False
+
+    @staticmethod
+    def _to_sim_infos(found_sims: List[Tuple[int, float]]) -> List[Tuple[SimInfo, float]]:
+        sim_info_manager = services.sim_info_manager()
+        sim_infos: List[Tuple[SimInfo, float]] = list()
+        for (sim_id, distance) in found_sims:
+            sim_info = sim_info_manager.get(sim_id)
+            if sim_info is None:
+                continue
+            sim_infos.append((sim_info, distance))
+        return sim_infos
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity().name)
+    def _reset_on_zone_teardown(event_data: S4CLZoneTeardownEvent):
+        CommonSimSpatialIndex.get()._reset()
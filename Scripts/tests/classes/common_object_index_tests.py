@@ -0,0 +1,71 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from sims4communitylib.classes.common_object_index import CommonObjectIndex
+from sims4communitylib.enums.tags_enum import CommonGameTag
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+class _TestObject:
+    pass
+
+
+class _TestBed(_TestObject):
+    pass
+
+
+class _TestDoubleBed(_TestBed):
+    pass
+
+
+def _create_object_index() -> CommonObjectIndex:
+    object_index = CommonObjectIndex()
+    object_index.add(1, 100, (CommonGameTag.FUNC_BED, 5), _TestBed)
+    object_index.add(2, 100, (CommonGameTag.FUNC_BED,), _TestBed)
+    object_index.add(3, 200, (5,), _TestObject)
+    return object_index
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonObjectIndexTests:
+    @staticmethod
+    @CommonTestService.test()
+    def should_find_objects_by_definition_and_tag():
+        object_index = _create_object_index()
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_definition_id(100)), [1, 2])
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_tag(CommonGameTag.FUNC_BED)), [1, 2])
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_tags((CommonGameTag.FUNC_BED, 5))), [1, 2, 3])
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_tags((CommonGameTag.FUNC_BED, 5), match_all=True)), [1])
+        CommonAssertionUtils.are_equal(len(object_index.get_object_ids_by_tag(9)), 0)
+
+    @staticmethod
+    @CommonTestService.test()
+    def should_find_objects_by_type_including_subclasses():
+        object_index = _create_object_index()
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_type(_TestBed)), [1, 2])
+        object_index.add(4, 300, (), _TestDoubleBed)
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_type(_TestBed)), [1, 2, 4])
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_type(_TestBed, include_subclasses=False)), [1, 2])
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_type(_TestObject)), [1, 2, 3, 4])
+
+    @staticmethod
+    @CommonTestService.test()
+    def remove_should_remove_object_from_every_lookup():
+        object_index = _create_object_index()
+        CommonAssertionUtils.is_true(object_index.remove(1))
+        CommonAssertionUtils.is_false(object_index.remove(1))
+        CommonAssertionUtils.is_false(1 in object_index)
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_definition_id(100)), [2])
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_tag(5)), [3])
+        CommonAssertionUtils.list_contents_are_same(list(object_index.get_object_ids_by_type(_TestBed)), [2])
+        object_index.add(2, 200, (5,), _TestObject)
+        CommonAssertionUtils.are_equal(len(object_index), 2)
+        CommonAssertionUtils.are_equal(len(object_index.get_object_ids_by_tag(CommonGameTag.FUNC_BED)), 0)
+        CommonAssertionUtils.are_equal(len(object_index.get_object_ids_by_type(_TestBed)), 0)
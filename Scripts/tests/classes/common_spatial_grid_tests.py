@@ -0,0 +1,77 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import math
+import random
+
+from sims4communitylib.classes.common_spatial_grid import CommonSpatialGrid
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+def _create_random_grid(item_count: int, cell_size: float=4.0) -> CommonSpatialGrid:
+    randomizer = random.Random(item_count)
+    grid = CommonSpatialGrid(cell_size=cell_size)
+    for item_id in range(item_count):
+        grid.update(item_id, randomizer.uniform(-50.0, 50.0), randomizer.uniform(-50.0, 50.0))
+    return grid
+
+
+def _get_distance(grid: CommonSpatialGrid, item_id: int, x: float, z: float) -> float:
+    (item_x, item_z) = grid.get_position(item_id)
+    return math.sqrt((item_x - x) ** 2 + (item_z - z) ** 2)
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonSpatialGridTests:
+    @staticmethod
+    @CommonTestService.test()
+    def update_should_move_item_between_cells():
+        grid = CommonSpatialGrid(cell_size=2.0)
+        grid.update(1, 0.5, 0.5)
+        grid.update(1, 10.5, -3.0)
+        CommonAssertionUtils.are_equal(len(grid), 1)
+        CommonAssertionUtils.are_equal(grid.get_position(1), (10.5, -3.0))
+        CommonAssertionUtils.are_equal(grid.get_in_radius(0.5, 0.5, 1.0), [])
+        CommonAssertionUtils.are_equal(grid.get_in_rect(10.0, -4.0, 11.0, -2.0), [1])
+        CommonAssertionUtils.are_equal(len(grid._cells), 1)
+        CommonAssertionUtils.is_true(grid.remove(1))
+        CommonAssertionUtils.is_false(grid.remove(1))
+        CommonAssertionUtils.is_false(1 in grid)
+        CommonAssertionUtils.are_equal(len(grid._cells), 0)
+
+    @staticmethod
+    @CommonTestService.test(0.0, 0.0, 5.0)
+    @CommonTestService.test(12.3, -40.0, 9.5)
+    @CommonTestService.test(200.0, 200.0, 10.0)
+    @CommonTestService.test(0.0, 0.0, 500.0)
+    def get_in_radius_should_match_checking_every_item(x: float, z: float, radius: float):
+        grid = _create_random_grid(300)
+        expected_item_ids = [item_id for item_id in grid.get_item_ids() if _get_distance(grid, item_id, x, z) <= radius]
+        found_items = grid.get_in_radius(x, z, radius)
+        CommonAssertionUtils.list_contents_are_same([item_id for (item_id, _) in found_items], expected_item_ids)
+        distances = [distance for (_, distance) in found_items]
+        CommonAssertionUtils.are_equal(distances, sorted(distances))
+
+    @staticmethod
+    @CommonTestService.test(0.0, 0.0, 1, None)
+    @CommonTestService.test(12.3, -40.0, 10, None)
+    @CommonTestService.test(200.0, 200.0, 5, None)
+    @CommonTestService.test(-20.0, 5.0, 20, 6.0)
+    @CommonTestService.test(0.0, 0.0, 500, None)
+    def get_nearest_should_match_checking_every_item(x: float, z: float, count: int, max_radius: float):
+        grid = _create_random_grid(300)
+        distances = sorted([_get_distance(grid, item_id, x, z) for item_id in grid.get_item_ids()])
+        if max_radius is not None:
+            distances = [distance for distance in distances if distance <= max_radius]
+        found_items = grid.get_nearest(x, z, count, max_radius=max_radius)
+        CommonAssertionUtils.are_equal(len(found_items), min(count, len(distances)))
+        for (index, (item_id, distance)) in enumerate(found_items):
+            CommonAssertionUtils.are_equal(distance, distances[index])
+            CommonAssertionUtils.are_equal(distance, _get_distance(grid, item_id, x, z))
@@ -0,0 +1,85 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Tuple
+
+from sims4communitylib.dialogs.utils.common_dialog_row_pager import CommonDialogRowPager
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonDialogRowPagerTests:
+    @staticmethod
+    @CommonTestService.test(10, 3, 1, (0, 1, 2))
+    @CommonTestService.test(10, 3, 4, (9,))
+    @CommonTestService.test(10, 3, 5, tuple())
+    def row_factory_page_should_contain_rows(row_count: int, per_page: int, page: int, expected_rows: Tuple[int]):
+        row_pager = CommonDialogRowPager(per_page, row_count=row_count, row_factory=lambda index: index)
+        CommonAssertionUtils.are_equal(row_pager.get_page(page), expected_rows)
+
+    @staticmethod
+    @CommonTestService.test(10, 3, 4)
+    @CommonTestService.test(9, 3, 3)
+    @CommonTestService.test(0, 3, 1)
+    def row_factory_number_of_pages_should_be_correct(row_count: int, per_page: int, expected_number_of_pages: int):
+        row_pager = CommonDialogRowPager(per_page, row_count=row_count, row_factory=lambda index: index)
+        CommonAssertionUtils.are_equal(row_pager.number_of_pages, expected_number_of_pages)
+
+    @staticmethod
+    @CommonTestService.test()
+    def row_factory_should_only_build_requested_page():
+        built_indexes = list()
+
+        def _row_factory(index: int) -> int:
+            built_indexes.append(index)
+            return index
+
+        row_pager = CommonDialogRowPager(25, row_count=10000, row_factory=_row_factory)
+        row_pager.get_page(3)
+        row_pager.get_page(3)
+        CommonAssertionUtils.are_equal(tuple(built_indexes), tuple(range(50, 75)))
+        CommonAssertionUtils.is_true(row_pager.has_next_page(3))
+        CommonAssertionUtils.are_equal(row_pager.built_pages, (3,))
+
+    @staticmethod
+    @CommonTestService.test(7, 3, 1, (0, 1, 2), True)
+    @CommonTestService.test(7, 3, 3, (6,), False)
+    @CommonTestService.test(6, 3, 2, (3, 4, 5), False)
+    def row_generator_page_should_contain_rows(row_count: int, per_page: int, page: int, expected_rows: Tuple[int], expected_has_next_page: bool):
+        row_pager = CommonDialogRowPager(per_page, rows=iter(range(row_count)))
+        CommonAssertionUtils.are_equal(row_pager.get_page(page), expected_rows)
+        CommonAssertionUtils.are_equal(row_pager.has_next_page(page), expected_has_next_page)
+
+    @staticmethod
+    @CommonTestService.test()
+    def row_generator_should_be_consumed_lazily():
+        pulled_rows = list()
+
+        def _row_generator():
+            for index in range(1000):
+                pulled_rows.append(index)
+                yield index
+
+        row_pager = CommonDialogRowPager(10, rows=_row_generator())
+        CommonAssertionUtils.are_equal(row_pager.get_page(2), tuple(range(10, 20)))
+        # The two requested pages plus a single row of look ahead.
+        CommonAssertionUtils.are_equal(len(pulled_rows), 21)
+        CommonAssertionUtils.are_equal(row_pager.get_page(1), tuple(range(10)))
+        CommonAssertionUtils.are_equal(len(pulled_rows), 21)
+        CommonAssertionUtils.are_equal(row_pager.number_of_pages, None)
+        CommonAssertionUtils.are_equal(row_pager.known_row_count, 20)
+
+    @staticmethod
+    @CommonTestService.test()
+    def empty_row_generator_should_be_empty():
+        row_pager = CommonDialogRowPager(10, rows=iter(()))
+        CommonAssertionUtils.is_true(row_pager.is_empty())
+        CommonAssertionUtils.is_false(row_pager.has_next_page(1))
+        CommonAssertionUtils.are_equal(row_pager.number_of_pages, 1)
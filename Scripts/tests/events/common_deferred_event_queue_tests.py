@@ -0,0 +1,63 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import List, Tuple
+
+from sims4communitylib.events.event_handling.common_deferred_event_overflow_policy import CommonDeferredEventOverflowPolicy
+from sims4communitylib.events.event_handling.common_deferred_event_queue import CommonDeferredEventQueue
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+from sims4communitylib.events.event_handling.common_event_handler import CommonEventHandler
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+class _TestEvent(CommonEvent):
+    def __init__(self, value: int):
+        self.value = value
+
+
+def _create_event_handler(handled_values: List[int]) -> CommonEventHandler:
+    def _handle_event(event_data: _TestEvent) -> bool:
+        handled_values.append(event_data.value)
+        return True
+    return CommonEventHandler(ModInfo.get_identity().name, _handle_event, deferred=True)
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonDeferredEventQueueTests:
+    @staticmethod
+    @CommonTestService.test(5, 2, (0, 1), 3)
+    @CommonTestService.test(5, 10, (0, 1, 2, 3, 4), 0)
+    def deliver_should_deliver_oldest_events_in_batches(event_count: int, events_per_batch: int, expected_values: Tuple[int], expected_queue_depth: int):
+        handled_values = list()
+        event_handler = _create_event_handler(handled_values)
+        deferred_events = CommonDeferredEventQueue(events_per_batch=events_per_batch)
+        for value in range(event_count):
+            deferred_events.queue(event_handler, _TestEvent(value))
+        CommonAssertionUtils.are_equal(deferred_events.deliver(), len(expected_values))
+        CommonAssertionUtils.are_equal(tuple(handled_values), expected_values)
+        CommonAssertionUtils.are_equal(deferred_events.queue_depth, expected_queue_depth)
+        CommonAssertionUtils.are_equal(deferred_events.max_queue_depth, event_count)
+
+    @staticmethod
+    @CommonTestService.test(CommonDeferredEventOverflowPolicy.DROP_OLDEST, (2, 3, 4), 2, 0)
+    @CommonTestService.test(CommonDeferredEventOverflowPolicy.DROP_NEWEST, (0, 1, 2), 2, 0)
+    @CommonTestService.test(CommonDeferredEventOverflowPolicy.COALESCE, (0, 1, 4), 0, 2)
+    def queue_should_apply_overflow_policy_when_full(overflow_policy: CommonDeferredEventOverflowPolicy, expected_values: Tuple[int], expected_dropped: int, expected_coalesced: int):
+        handled_values = list()
+        event_handler = _create_event_handler(handled_values)
+        deferred_events = CommonDeferredEventQueue(max_queued_events=3, overflow_policy=overflow_policy)
+        for value in range(5):
+            deferred_events.queue(event_handler, _TestEvent(value))
+        deferred_events.deliver_all()
+        CommonAssertionUtils.are_equal(tuple(handled_values), expected_values)
+        CommonAssertionUtils.are_equal(deferred_events.total_queued, 5)
+        CommonAssertionUtils.are_equal(deferred_events.total_delivered, 3)
+        CommonAssertionUtils.are_equal(deferred_events.total_dropped, expected_dropped)
+        CommonAssertionUtils.are_equal(deferred_events.total_coalesced, expected_coalesced)
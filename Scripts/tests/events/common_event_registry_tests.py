@@ -0,0 +1,110 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+class _TestEvent(CommonEvent):
+    pass
+
+
+class _TestChildEvent(_TestEvent):
+    pass
+
+
+class _TestOtherEvent(CommonEvent):
+    pass
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonEventRegistryTests:
+    @staticmethod
+    @CommonTestService.test()
+    def has_handlers_should_be_false_without_handlers():
+        event_registry = CommonEventRegistry()
+        CommonAssertionUtils.is_false(event_registry.has_handlers(_TestEvent))
+
+    @staticmethod
+    @CommonTestService.test()
+    def has_handlers_should_include_handlers_of_parent_types():
+        def _handle_event(event_data: _TestEvent) -> bool:
+            return True
+
+        event_registry = CommonEventRegistry()
+        event_registry._register_event_handler(ModInfo.get_identity().name, _handle_event)
+        CommonAssertionUtils.is_true(event_registry.has_handlers(_TestEvent))
+        CommonAssertionUtils.is_true(event_registry.has_handlers(_TestChildEvent))
+        CommonAssertionUtils.is_false(event_registry.has_handlers(_TestOtherEvent))
+
+    @staticmethod
+    @CommonTestService.test()
+    def has_handlers_should_update_when_handler_registered():
+        def _handle_event(event_data: _TestOtherEvent) -> bool:
+            return True
+
+        event_registry = CommonEventRegistry()
+        CommonAssertionUtils.is_false(event_registry.has_handlers(_TestOtherEvent))
+        event_registry._register_event_handler(ModInfo.get_identity().name, _handle_event)
+        CommonAssertionUtils.is_true(event_registry.has_handlers(_TestOtherEvent))
+
+    @staticmethod
+    @CommonTestService.test()
+    def dispatch_should_only_send_to_matching_handlers():
+        handled_events = list()
+
+        def _handle_event(event_data: _TestChildEvent) -> bool:
+            handled_events.append(event_data)
+            return True
+
+        event_registry = CommonEventRegistry()
+        event_registry._register_event_handler(ModInfo.get_identity().name, _handle_event)
+        child_event = _TestChildEvent()
+        CommonAssertionUtils.is_true(event_registry.dispatch(_TestEvent()))
+        CommonAssertionUtils.is_true(event_registry.dispatch(child_event))
+        CommonAssertionUtils.are_equal(handled_events, [child_event])
+
+    @staticmethod
+    @CommonTestService.test()
+    def dispatch_should_queue_events_for_deferred_handlers():
+        handled_events = list()
+
+        def _handle_event(event_data: _TestEvent) -> bool:
+            handled_events.append(event_data)
+            return False
+
+        event_registry = CommonEventRegistry()
+        event_registry._register_event_handler(ModInfo.get_identity().name, _handle_event, deferred=True)
+        event = _TestEvent()
+        CommonAssertionUtils.is_true(event_registry.dispatch(event))
+        CommonAssertionUtils.are_equal(handled_events, [])
+        CommonAssertionUtils.are_equal(event_registry.deferred_events.queue_depth, 1)
+        CommonAssertionUtils.are_equal(event_registry._dispatch_deferred_events(), 1)
+        CommonAssertionUtils.are_equal(handled_events, [event])
+
+    @staticmethod
+    @CommonTestService.test()
+    def dispatch_should_skip_handlers_of_excluded_mods():
+        handled_mod_names = list()
+
+        def _handle_event_one(event_data: _TestEvent) -> bool:
+            handled_mod_names.append('mod_one')
+            return True
+
+        def _handle_event_two(event_data: _TestEvent) -> bool:
+            handled_mod_names.append('mod_two')
+            return True
+
+        event_registry = CommonEventRegistry()
+        event_registry._register_event_handler('mod_one', _handle_event_one)
+        event_registry._register_event_handler('mod_two', _handle_event_two)
+        CommonAssertionUtils.is_true(event_registry.dispatch(_TestEvent(), excluded_mod_names={'mod_one'}))
+        CommonAssertionUtils.are_equal(handled_mod_names, ['mod_two'])
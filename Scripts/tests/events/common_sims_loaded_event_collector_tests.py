@@ -0,0 +1,109 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.sim.common_sims_loaded_event_collector import CommonSimsLoadedEventCollector
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+class _TestSimsLoadedEvent(CommonEvent):
+    def __init__(self, zone, sim_info_list):
+        self.zone = zone
+        self.sim_info_list = sim_info_list
+
+
+class _TestSimEvent(CommonEvent):
+    def __init__(self, sim_info):
+        self.sim_info = sim_info
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonSimsLoadedEventCollectorTests:
+    @staticmethod
+    @CommonTestService.test()
+    def dispatch_should_send_collected_sims_once():
+        handled_events = list()
+
+        def _handle_event(event_data: _TestSimsLoadedEvent) -> bool:
+            handled_events.append(event_data)
+            return True
+
+        event_registry = CommonEventRegistry()
+        event_registry._register_event_handler(ModInfo.get_identity().name, _handle_event)
+        collector = CommonSimsLoadedEventCollector(_TestSimsLoadedEvent)
+        collector.collect('sim_one', event_registry)
+        collector.collect('sim_two', event_registry)
+        CommonAssertionUtils.are_equal(handled_events, list())
+        CommonAssertionUtils.is_true(collector.dispatch('zone', event_registry))
+        CommonAssertionUtils.is_true(collector.dispatch('zone', event_registry))
+        CommonAssertionUtils.are_equal(len(handled_events), 2)
+        CommonAssertionUtils.are_equal(handled_events[0].zone, 'zone')
+        CommonAssertionUtils.are_equal(handled_events[0].sim_info_list, ('sim_one', 'sim_two'))
+        # The Sims are only sent with the first dispatch.
+        CommonAssertionUtils.are_equal(handled_events[1].sim_info_list, tuple())
+
+    @staticmethod
+    @CommonTestService.test()
+    def collect_should_not_keep_sims_without_handlers():
+        event_registry = CommonEventRegistry()
+        collector = CommonSimsLoadedEventCollector(_TestSimsLoadedEvent)
+        collector.collect('sim_one', event_registry)
+        CommonAssertionUtils.are_equal(collector.sim_info_list, list())
+        CommonAssertionUtils.is_true(collector.dispatch('zone', event_registry))
+
+    @staticmethod
+    @CommonTestService.test()
+    def clear_should_forget_collected_sims():
+        handled_events = list()
+
+        def _handle_event(event_data: _TestSimsLoadedEvent) -> bool:
+            handled_events.append(event_data)
+            return True
+
+        event_registry = CommonEventRegistry()
+        event_registry._register_event_handler(ModInfo.get_identity().name, _handle_event)
+        collector = CommonSimsLoadedEventCollector(_TestSimsLoadedEvent)
+        collector.collect('sim_one', event_registry)
+        collector.clear()
+        collector.dispatch('zone', event_registry)
+        CommonAssertionUtils.are_equal(handled_events[0].sim_info_list, tuple())
+
+    @staticmethod
+    @CommonTestService.test()
+    def get_excluded_mod_names_should_only_exclude_suppressed_mods_while_loading():
+        collector = CommonSimsLoadedEventCollector(_TestSimsLoadedEvent)
+        CommonAssertionUtils.is_true(collector.get_excluded_mod_names(True) is None)
+        collector.suppress_per_sim_events_while_loading('Bulk Mod')
+        CommonAssertionUtils.are_equal(collector.get_excluded_mod_names(True), {'Bulk Mod'})
+        CommonAssertionUtils.is_true(collector.get_excluded_mod_names(False) is None)
+
+    @staticmethod
+    @CommonTestService.test()
+    def dispatch_should_skip_excluded_mods():
+        handled_mod_names = list()
+
+        def _handle_bulk_mod_event(event_data: _TestSimEvent) -> bool:
+            handled_mod_names.append('Bulk Mod')
+            return True
+
+        def _handle_other_mod_event(event_data: _TestSimEvent) -> bool:
+            handled_mod_names.append('Other Mod')
+            return True
+
+        event_registry = CommonEventRegistry()
+        event_registry._register_event_handler('Bulk Mod', _handle_bulk_mod_event)
+        event_registry._register_event_handler('Other Mod', _handle_other_mod_event)
+        collector = CommonSimsLoadedEventCollector(_TestSimsLoadedEvent)
+        collector.suppress_per_sim_events_while_loading('Bulk Mod')
+        event_registry.dispatch(_TestSimEvent('sim_one'), excluded_mod_names=collector.get_excluded_mod_names(True))
+        CommonAssertionUtils.are_equal(handled_mod_names, ['Other Mod'])
+        event_registry.dispatch(_TestSimEvent('sim_two'), excluded_mod_names=collector.get_excluded_mod_names(False))
+        CommonAssertionUtils.are_equal(handled_mod_names, ['Other Mod', 'Bulk Mod', 'Other Mod'])
@@ -0,0 +1,85 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import os
+import tempfile
+
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.common_zone_load_profiler import CommonZoneLoadProfiler
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+class _TestEvent(CommonEvent):
+    pass
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonZoneLoadProfilerTests:
+    @staticmethod
+    @CommonTestService.test()
+    def finish_load_should_write_one_record_per_load():
+        def _handle_event(event_data: _TestEvent) -> bool:
+            return True
+
+        event_registry = CommonEventRegistry()
+        event_registry._register_event_handler('test_mod', _handle_event)
+        profiler = CommonZoneLoadProfiler()
+        profiler._enabled = True
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'profile.jsonl')
+            for _ in range(2):
+                profiler.start_phase('load_zone', 1)
+                event_registry.dispatch(_TestEvent())
+                profiler.add_hook_time('sim_init', 0.25)
+                profiler.add_hook_time('sim_init', 0.25)
+                profiler.end_phase()
+                profiler.start_phase('do_zone_spin_up', 1)
+                profiler.end_phase()
+                profiler.finish_load(file_path=file_path)
+            with open(file_path, mode='r', encoding='utf-8') as file:
+                records = [json.loads(line) for line in file]
+        CommonAssertionUtils.has_length(records, 2)
+        CommonAssertionUtils.are_equal([phase['name'] for phase in records[1]['phases']], ['load_zone', 'do_zone_spin_up'])
+        CommonAssertionUtils.are_equal(list(records[1]['phases'][0]['handlers'].keys()), ['test_mod: {}.{}'.format(_handle_event.__module__, _handle_event.__qualname__)])
+        CommonAssertionUtils.are_equal(records[1]['hooks']['sim_init']['count'], 2)
+        CommonAssertionUtils.are_equal(records[1]['hooks']['sim_init']['time'], 0.5)
+        CommonAssertionUtils.is_false(profiler.profiling)
+        CommonAssertionUtils.is_true(event_registry._handler_times is None)
+
+    @staticmethod
+    @CommonTestService.test()
+    def start_phase_should_do_nothing_when_disabled():
+        profiler = CommonZoneLoadProfiler()
+        profiler._enabled = False
+        profiler.start_phase('load_zone', 1)
+        CommonAssertionUtils.is_false(profiler.profiling)
+        CommonAssertionUtils.is_true(profiler.finish_load() is None)
+
+    @staticmethod
+    @CommonTestService.test()
+    def start_phase_should_only_start_a_load_from_load_zone():
+        profiler = CommonZoneLoadProfiler()
+        profiler._enabled = True
+        for phase_name in ('save_zone', 'on_teardown', 'do_zone_spin_up'):
+            profiler.start_phase(phase_name, 1)
+            profiler.add_hook_time('sim_init', 0.25)
+            profiler.end_phase()
+            CommonAssertionUtils.is_false(profiler.profiling)
+        CommonAssertionUtils.is_true(CommonEventRegistry.get()._handler_times is None)
+        profiler.start_phase('load_zone', 1)
+        CommonAssertionUtils.is_true(profiler.profiling)
+        profiler.end_phase()
+        profiler.start_phase('save_zone', 1)
+        profiler.end_phase()
+        CommonAssertionUtils.are_equal([phase['name'] for phase in profiler._record['phases']], ['load_zone', 'save_zone'])
+        CommonAssertionUtils.are_equal(profiler._record['hooks'], dict())
+        profiler._record = None
@@ -0,0 +1,65 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+import tempfile
+
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.persistence.common_data_store import CommonDataStore
+from sims4communitylib.persistence.common_data_store_service import CommonDataStoreService
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+def _create_data_store_service(folder_path: str, save_slot_id: int) -> CommonDataStoreService:
+    data_store_service = CommonDataStoreService()
+    data_store_service.data_folder_path = folder_path
+    data_store_service._on_zone_load(save_slot_id)
+    return data_store_service
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonDataStoreServiceTests:
+    @staticmethod
+    @CommonTestService.test()
+    def zone_load_of_same_slot_should_discard_unsaved_changes():
+        with tempfile.TemporaryDirectory() as folder_path:
+            data_store_service = _create_data_store_service(folder_path, 1)
+            data_store = data_store_service.get_data_store('mod', save_slot_id=1)
+            data_store.set('sim', {'points': 1})
+            data_store_service._on_zone_save(1)
+            data_store.get('sim')['points'] = 2
+            data_store.set('other_sim', 3)
+            data_store_service._on_zone_load(1)
+            CommonAssertionUtils.is_false(data_store.has_pending_changes)
+            CommonAssertionUtils.are_equal(data_store.get('sim')['points'], 1)
+            reloaded_data_store = data_store_service.get_data_store('mod', save_slot_id=1)
+            CommonAssertionUtils.is_false(reloaded_data_store is data_store)
+            data_store_service._on_zone_save(1)
+            reopened_data_store = CommonDataStore(os.path.join(folder_path, 'mod', 'Slot_00000001.s4cldata'))
+            CommonAssertionUtils.are_equal(reopened_data_store.get('sim')['points'], 1)
+            CommonAssertionUtils.is_false(reopened_data_store.has_key('other_sim'))
+
+    @staticmethod
+    @CommonTestService.test()
+    def save_as_should_copy_data_stores_of_every_mod():
+        with tempfile.TemporaryDirectory() as folder_path:
+            data_store_service = _create_data_store_service(folder_path, 1)
+            for mod_name in ('opened_mod', 'unopened_mod'):
+                data_store_service.get_data_store(mod_name, save_slot_id=1).set('value', mod_name)
+            data_store_service._on_zone_save(1)
+            stale_data_store = CommonDataStore(os.path.join(folder_path, 'stale_mod', 'Slot_00000002.s4cldata'))
+            stale_data_store.set('value', 'stale')
+            stale_data_store.flush()
+            data_store_service._on_zone_load(1)
+            data_store_service.get_data_store('opened_mod', save_slot_id=1).set('value', 'changed')
+            data_store_service._on_zone_save(2)
+            CommonAssertionUtils.are_equal(CommonDataStore(os.path.join(folder_path, 'opened_mod', 'Slot_00000002.s4cldata')).get('value'), 'changed')
+            CommonAssertionUtils.are_equal(CommonDataStore(os.path.join(folder_path, 'unopened_mod', 'Slot_00000002.s4cldata')).get('value'), 'unopened_mod')
+            CommonAssertionUtils.are_equal(CommonDataStore(os.path.join(folder_path, 'opened_mod', 'Slot_00000001.s4cldata')).get('value'), 'opened_mod')
+            CommonAssertionUtils.is_false(os.path.exists(os.path.join(folder_path, 'stale_mod', 'Slot_00000002.s4cldata')))
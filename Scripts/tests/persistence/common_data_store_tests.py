@@ -0,0 +1,88 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+import tempfile
+
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.persistence.common_data_store import CommonDataStore
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonDataStoreTests:
+    @staticmethod
+    @CommonTestService.test()
+    def flush_should_persist_values_and_removals():
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'data.s4cldata')
+            data_store = CommonDataStore(file_path)
+            data_store.set('one', {'value': 1})
+            data_store.set('two\twith\ntabs', [2, 'two'])
+            data_store.set('three', 3)
+            data_store.flush()
+            data_store.set('one', {'value': 11})
+            data_store.delete('three')
+            CommonAssertionUtils.are_equal(CommonDataStore(file_path).get('one')['value'], 1)
+            data_store.flush()
+            reopened_data_store = CommonDataStore(file_path)
+            CommonAssertionUtils.are_equal(reopened_data_store.get('one')['value'], 11)
+            CommonAssertionUtils.are_equal(reopened_data_store.get('two\twith\ntabs'), [2, 'two'])
+            CommonAssertionUtils.is_false(reopened_data_store.has_key('three'))
+            CommonAssertionUtils.are_equal(reopened_data_store.stale_record_count, 3)
+            CommonAssertionUtils.list_contents_are_same(list(reopened_data_store.keys()), ['one', 'two\twith\ntabs'])
+
+    @staticmethod
+    @CommonTestService.test()
+    def flush_should_only_append_changed_keys():
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'data.s4cldata')
+            data_store = CommonDataStore(file_path)
+            for index in range(100):
+                data_store.set('sim_{}'.format(index), {'points': index})
+            data_store.flush()
+            file_size = os.path.getsize(file_path)
+            data_store.set('sim_5', {'points': 50})
+            data_store.flush()
+            CommonAssertionUtils.are_equal(os.path.getsize(file_path), file_size + len('"sim_5"\t{"points":50}\n'))
+
+    @staticmethod
+    @CommonTestService.test()
+    def flush_should_compact_when_mostly_stale():
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'data.s4cldata')
+            data_store = CommonDataStore(file_path, min_compaction_size=0)
+            data_store.set('one', 1)
+            data_store.set('two', 2)
+            data_store.flush()
+            for value in range(3):
+                data_store.set('one', value)
+                data_store.flush()
+            CommonAssertionUtils.are_equal(data_store.stale_record_count, 0)
+            CommonAssertionUtils.are_equal(os.path.getsize(file_path), len('"one"\t2\n"two"\t2\n'))
+            CommonAssertionUtils.is_false(os.path.exists(file_path + '.tmp'))
+            CommonAssertionUtils.are_equal(CommonDataStore(file_path).get('one'), 2)
+
+    @staticmethod
+    @CommonTestService.test()
+    def open_should_ignore_partially_written_record():
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'data.s4cldata')
+            data_store = CommonDataStore(file_path)
+            data_store.set('one', 1)
+            data_store.flush()
+            with open(file_path, mode='ab') as file:
+                file.write(b'"two"\t{"cut sh')
+            data_store = CommonDataStore(file_path)
+            CommonAssertionUtils.is_false(data_store.has_key('two'))
+            data_store.set('three', 3)
+            data_store.flush()
+            reopened_data_store = CommonDataStore(file_path)
+            CommonAssertionUtils.are_equal(reopened_data_store.get('one'), 1)
+            CommonAssertionUtils.are_equal(reopened_data_store.get('three'), 3)
@@ -0,0 +1,89 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+import tempfile
+
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+from sims4communitylib.utils.common_log_buffer import CommonLogBuffer
+from sims4communitylib.utils.common_log_registry import CommonLog, CommonMessageType
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonLogBufferTests:
+    @staticmethod
+    @CommonTestService.test()
+    def add_message_should_drop_oldest_messages_when_full():
+        log_buffer = CommonLogBuffer('mod', max_messages=2)
+        for index in range(3):
+            log_buffer.add_message(CommonMessageType.DEBUG, 'log', 'message {}'.format(index))
+        messages = list(log_buffer.format_messages())
+        CommonAssertionUtils.are_equal(len(messages), 2)
+        CommonAssertionUtils.is_true(messages[0].endswith('[mod] {}: [log]: message 1\n'.format(CommonMessageType.DEBUG)))
+        CommonAssertionUtils.is_true(messages[1].endswith('[mod] {}: [log]: message 2\n'.format(CommonMessageType.DEBUG)))
+
+    @staticmethod
+    @CommonTestService.test()
+    def buffered_log_should_format_arguments_when_dumped():
+        class _Argument:
+            def __init__(self):
+                self.format_count = 0
+
+            def __repr__(self):
+                self.format_count += 1
+                return 'argument'
+
+        argument = _Argument()
+        log_buffer = CommonLogBuffer('mod')
+        log = CommonLog('mod', 'log')
+        log.enable_buffering(log_buffer)
+        log.format_with_message('message', argument, value=1)
+        log.debug('debug message')
+        log.enable()
+        log.format_with_message('message', argument, value=1)
+        log.format(argument)
+        CommonAssertionUtils.are_equal(log_buffer.message_count, 2)
+        CommonAssertionUtils.are_equal(argument.format_count, 0)
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'mod_Buffered_Messages.txt')
+            CommonAssertionUtils.are_equal(log_buffer.dump(file_path), 2)
+            with open(file_path, mode='r') as file:
+                lines = file.read().splitlines()
+        CommonAssertionUtils.are_equal(argument.format_count, 2)
+        CommonAssertionUtils.are_equal(log_buffer.message_count, 0)
+        CommonAssertionUtils.is_true(lines[0].endswith('[mod] {}: [log]: message (argument,), {{\'value\': 1}}'.format(CommonMessageType.DEBUG)))
+        CommonAssertionUtils.is_true(lines[2].endswith('[mod] {}: [log]: (argument,), {{}}'.format(CommonMessageType.DEBUG)))
+
+    @staticmethod
+    @CommonTestService.test()
+    def buffered_debug_should_format_message_arguments_when_dumped():
+        class _Argument:
+            def __init__(self):
+                self.format_count = 0
+
+            def __str__(self):
+                self.format_count += 1
+                return 'argument'
+
+        argument = _Argument()
+        log_buffer = CommonLogBuffer('mod')
+        log = CommonLog('mod', 'log')
+        log.enable_buffering(log_buffer)
+        log.debug('Checking \'{}\'.', argument)
+        CommonAssertionUtils.is_false(log.is_enabled())
+        log.enable()
+        CommonAssertionUtils.is_true(log.is_enabled())
+        log.debug('Checking \'{}\'.', argument)
+        log.info('No {arguments}.')
+        CommonAssertionUtils.are_equal(argument.format_count, 0)
+        messages = list(log_buffer.format_messages())
+        CommonAssertionUtils.are_equal(argument.format_count, 1)
+        CommonAssertionUtils.is_true(messages[0].endswith('[mod] {}: [log]: Checking \'argument\'.\n'.format(CommonMessageType.DEBUG)))
+        CommonAssertionUtils.is_true(messages[1].endswith('[mod] {}: [log]: No {{arguments}}.\n'.format(CommonMessageType.INFO)))
@@ -0,0 +1,134 @@
+"""
+This file is part of the Sims 4 Community Library, licensed under the Creative Commons Attribution-NonCommercial-NoDerivatives 4.0 International public license (CC BY-NC-ND 4.0).
+https://creativecommons.org/licenses/by-nc-nd/4.0/
+https://creativecommons.org/licenses/by-nc-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import gzip
+import os
+import shutil
+import tempfile
+
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+from sims4communitylib.utils.common_date_utils import CommonRealDateUtils
+from sims4communitylib.utils.common_log_rotation_service import CommonLogRotationService
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity().name)
+class CommonLogRotationServiceTests:
+    @staticmethod
+    @CommonTestService.test()
+    def rotate_files_should_compress_files_that_are_too_big():
+        with tempfile.TemporaryDirectory() as folder_path:
+            big_file_path = os.path.join(folder_path, 'mod_Messages.txt')
+            small_file_path = os.path.join(folder_path, 'mod_Exceptions.txt')
+            with open(big_file_path, mode='w') as file:
+                file.write('message\n' * 100)
+            with open(small_file_path, mode='w') as file:
+                file.write('exception\n')
+            log_rotation_service = CommonLogRotationService()
+            log_rotation_service.max_file_size = 100
+            log_rotation_service._watched_file_paths.update((big_file_path, small_file_path))
+            CommonAssertionUtils.are_equal(log_rotation_service.rotate_files(), 1)
+            CommonAssertionUtils.is_false(os.path.exists(big_file_path))
+            CommonAssertionUtils.is_true(os.path.exists(small_file_path))
+            archive_file_paths = CommonLogRotationService.get_archive_file_paths(big_file_path)
+            CommonAssertionUtils.are_equal(len(archive_file_paths), 1)
+            with gzip.open(archive_file_paths[0], mode='rt') as archive_file:
+                CommonAssertionUtils.are_equal(archive_file.read(), 'message\n' * 100)
+            CommonAssertionUtils.are_equal(CommonLogRotationService.get_archive_file_paths(small_file_path), [])
+            CommonAssertionUtils.are_equal(len(os.listdir(folder_path)), 2)
+
+    @staticmethod
+    @CommonTestService.test()
+    def remove_old_archives_should_keep_newest_archives():
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'mod_Messages.txt')
+            other_file_path = os.path.join(folder_path, 'mod_Exceptions.txt')
+            archive_file_paths = list()
+            for index in range(4):
+                archive_file_path = os.path.join(folder_path, 'Old_mod_Messages_2020-01-0{} 10_20_30.123456.txt.gz'.format(index + 1))
+                open(archive_file_path, mode='w').close()
+                os.utime(archive_file_path, (index, index))
+                archive_file_paths.append(archive_file_path)
+            open(os.path.join(folder_path, 'Old_mod_Exceptions_2020-01-01 10_20_30.123456.txt.gz'), mode='w').close()
+            open(os.path.join(folder_path, 'Old_mod_Messages_Extra_2020-01-01 10_20_30.123456.txt.gz'), mode='w').close()
+            log_rotation_service = CommonLogRotationService()
+            log_rotation_service.max_archive_count = 2
+            CommonAssertionUtils.are_equal(log_rotation_service.remove_old_archives(file_path), archive_file_paths[:2])
+            CommonAssertionUtils.are_equal(CommonLogRotationService.get_archive_file_paths(file_path), archive_file_paths[2:])
+            CommonAssertionUtils.are_equal(len(CommonLogRotationService.get_archive_file_paths(other_file_path)), 1)
+
+    @staticmethod
+    @CommonTestService.test()
+    def rotate_file_should_not_overwrite_archive_with_same_date():
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'mod_Messages.txt')
+            log_rotation_service = CommonLogRotationService()
+            original_get_current_date_string = CommonRealDateUtils.get_current_date_string
+            CommonRealDateUtils.get_current_date_string = staticmethod(lambda: '2020-01-01 10:20:30.123456')
+            try:
+                for index in range(2):
+                    with open(file_path, mode='w') as file:
+                        file.write('message {}\n'.format(index))
+                    CommonAssertionUtils.is_true(log_rotation_service.rotate_file(file_path))
+            finally:
+                CommonRealDateUtils.get_current_date_string = original_get_current_date_string
+            archive_file_names = sorted([os.path.basename(archive_file_path) for archive_file_path in CommonLogRotationService.get_archive_file_paths(file_path)])
+            CommonAssertionUtils.are_equal(archive_file_names, ['Old_mod_Messages_2020-01-01 10_20_30.123456.txt.gz', 'Old_mod_Messages_2020-01-01 10_20_30.123456_1.txt.gz'])
+
+    @staticmethod
+    @CommonTestService.test()
+    def remove_old_archives_should_keep_newest_archives_of_mod():
+        with tempfile.TemporaryDirectory() as folder_path:
+            messages_file_path = os.path.join(folder_path, 'mod_Messages.txt')
+            exceptions_file_path = os.path.join(folder_path, 'mod_Exceptions.txt')
+            other_mod_file_path = os.path.join(folder_path, 'other_Messages.txt')
+            archive_file_paths = list()
+            for index in range(4):
+                base_name = 'mod_Messages' if index % 2 == 0 else 'mod_Exceptions'
+                archive_file_path = os.path.join(folder_path, 'Old_{}_2020-01-0{} 10_20_30.123456.txt.gz'.format(base_name, index + 1))
+                open(archive_file_path, mode='w').close()
+                os.utime(archive_file_path, (index, index))
+                archive_file_paths.append(archive_file_path)
+            open(os.path.join(folder_path, 'Old_other_Messages_2020-01-01 10_20_30.123456.txt.gz'), mode='w').close()
+            log_rotation_service = CommonLogRotationService()
+            log_rotation_service.max_archive_count = 2
+            log_rotation_service._mod_name_by_file_path.update({messages_file_path: 'mod', exceptions_file_path: 'mod', other_mod_file_path: 'other'})
+            CommonAssertionUtils.are_equal(log_rotation_service.remove_old_archives(messages_file_path), archive_file_paths[:2])
+            CommonAssertionUtils.are_equal(CommonLogRotationService.get_archive_file_paths(messages_file_path), archive_file_paths[2:3])
+            CommonAssertionUtils.are_equal(CommonLogRotationService.get_archive_file_paths(exceptions_file_path), archive_file_paths[3:])
+            CommonAssertionUtils.are_equal(len(CommonLogRotationService.get_archive_file_paths(other_mod_file_path)), 1)
+
+    @staticmethod
+    @CommonTestService.test()
+    def rotate_files_should_compress_files_left_by_failed_compression():
+        def _fail_to_copy(source_file, destination_file, *_, **__):
+            destination_file.write(b'partial')
+            raise OSError(28, 'No space left on device')
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path = os.path.join(folder_path, 'mod_Messages.txt')
+            with open(file_path, mode='w') as file:
+                file.write('message\n' * 100)
+            log_rotation_service = CommonLogRotationService()
+            log_rotation_service.max_file_size = 100
+            log_rotation_service._watched_file_paths.add(file_path)
+            original_copyfileobj = shutil.copyfileobj
+            shutil.copyfileobj = _fail_to_copy
+            try:
+                CommonAssertionUtils.are_equal(log_rotation_service.rotate_files(), 1)
+            finally:
+                shutil.copyfileobj = original_copyfileobj
+            CommonAssertionUtils.are_equal(CommonLogRotationService.get_archive_file_paths(file_path), [])
+            CommonAssertionUtils.are_equal(len(CommonLogRotationService.get_rotating_file_paths(file_path)), 1)
+            CommonAssertionUtils.are_equal(log_rotation_service.rotate_files(), 0)
+            CommonAssertionUtils.are_equal(CommonLogRotationService.get_rotating_file_paths(file_path), [])
+            archive_file_paths = CommonLogRotationService.get_archive_file_paths(file_path)
+            CommonAssertionUtils.are_equal(len(archive_file_paths), 1)
+            with gzip.open(archive_file_paths[0], mode='rt') as archive_file:
+                CommonAssertionUtils.are_equal(archive_file.read(), 'message\n' * 100)
@@ -1,8 +1,15 @@
 import shutil
 import io
 import fnmatch
-from zipfile import PyZipFile
-from Utilities.unpyc3 import decompile
+import hashlib
+import importlib.util
+import json
+import marshal
+import struct
+import time
+from multiprocessing import Pool
+from zipfile import PyZipFile, ZipFile, ZipInfo
+from Utilities.unpyc3 import decompile, dec_module_bytes, IndentStream
 from settings import *
 
 
@@ -14,13 +21,7 @@ def decompile_dir(rootPath):
             try:
                 print('Decompiling \'{}\''.format(p))
                 py = decompile(p)
-                with io.open(p.replace('.pyc', '.py'), 'w') as output_py:
-                    for statement in py.statements:
-                        try:
-                            output_py.write(str(statement) + '\r')
-                        except Exception as ex:
-                            print(statement.__class__)
-                            raise ex
+                write_decompiled(py, p.replace('.pyc', '.py'))
             except Exception as ex:
                 print("FAILED to decompile %s" % p)
                 print(ex)
@@ -28,34 +29,67 @@ def decompile_dir(rootPath):
 
 def decompile_file(file_path, throw_on_error=True) -> bool:
     py = decompile(file_path)
-    with io.open(file_path.replace('.pyc', '.py'), 'w') as output_py:
+    return write_decompiled(py, file_path.replace('.pyc', '.py'), throw_on_error=throw_on_error)
+
+
+def write_decompiled(py, py_file_path, throw_on_error=True) -> bool:
+    # Each statement is rendered straight into the buffered file rather than being built up as a string first.
+    with io.open(py_file_path, 'w') as output_py:
+        indent = IndentStream(output_py)
         success = True
         for statement in py.statements:
+            indent.start()
             try:
-                output_py.write(str(statement) + '\r')
+                statement.display(indent)
             except Exception as ex:
-                print('Failed to parse statement.' + str(statement))
+                print('Failed to parse statement.')
                 print(statement.__class__)
                 if throw_on_error:
                     raise ex
                 success = False
+                output_py.write('\n# Failed to decompile {}: {}'.format(statement.__class__.__name__, ex))
+            output_py.write('\r')
     return success
 
 
+def decompile_archive(archive_path, out_folder):
+    # Reads each .pyc straight out of the archive and decompiles it in memory, so only the .py files are written to disk.
+    decompiled_count = 0
+    failed_count = 0
+    with ZipFile(archive_path) as archive:
+        for member in archive.infolist():
+            if member.is_dir() or not fnmatch.fnmatch(member.filename, '*.pyc'):
+                continue
+            py_file_path = os.path.join(out_folder, *os.path.splitext(member.filename)[0].split('/')) + '.py'
+            try:
+                print('Decompiling \'{}\''.format(os.path.join(archive_path, member.filename)))
+                py = dec_module_bytes(archive.read(member))
+                os.makedirs(os.path.dirname(py_file_path), exist_ok=True)
+                write_decompiled(py, py_file_path)
+                decompiled_count += 1
+            except Exception as ex:
+                print("FAILED to decompile %s" % member.filename)
+                print(ex)
+                failed_count += 1
+    print('Decompiled {} files from \'{}\', {} failed.'.format(decompiled_count, archive_path, failed_count))
+    return failed_count == 0
+
+
 script_package_types = ['*.zip', '*.ts4script']
 
 
 def extract_subfolder(root, filename, ea_folder, decompile_files=True):
     src = os.path.join(root, filename)
+    out_folder = os.path.join(ea_folder, os.path.splitext(filename)[0])
+    if decompile_files:
+        # No need to copy or extract the archive, the .py files are decompiled straight from it.
+        decompile_archive(src, out_folder)
+        return
     dst = os.path.join(ea_folder, filename)
     if src != dst:
         shutil.copyfile(src, dst)
     zip = PyZipFile(dst)
-    out_folder = os.path.join(ea_folder, os.path.splitext(filename)[0])
     zip.extractall(out_folder)
-    if decompile_files:
-        decompile_dir(out_folder)
-    pass
 
 
 def extract_folder(ea_folder, gameplay_folder):
@@ -65,7 +99,7 @@ def extract_folder(ea_folder, gameplay_folder):
                 extract_subfolder(root, filename, ea_folder)
 
 
-def compile_module(mod_creator_name=None, root=None, mod_scripts_folder=None, mod_name=None, ignore_folders=None, include_folders=None):
+def compile_module(mod_creator_name=None, root=None, mod_scripts_folder=None, mod_name=None, ignore_folders=None, include_folders=None, incremental=False, parallel=False, processes=None):
     if not mod_creator_name:
         mod_creator_name = creator_name
     if not mod_name:
@@ -82,6 +116,13 @@ def compile_module(mod_creator_name=None, root=None, mod_scripts_folder=None, mo
     else:
         ts4script = os.path.join(root, script_zip_name)
 
+    if incremental and parallel:
+        raise ValueError('incremental and parallel builds cannot be combined, choose one of them.')
+    if incremental:
+        return compile_module_incremental(ts4script, mod_scripts_folder, ignore_folders=ignore_folders, include_folders=include_folders)
+    if parallel:
+        return compile_module_parallel(ts4script, mod_scripts_folder, ignore_folders=ignore_folders, include_folders=include_folders, processes=processes)
+
     try:
         if os.path.exists(ts4script):
             print('Script archive found, removing found archive.')
@@ -123,4 +164,206 @@ def compile_module(mod_creator_name=None, root=None, mod_scripts_folder=None, mo
 
 
 def get_child_directories(d):
-    return filter(os.path.isdir, [f for f in os.listdir(d)])
\ No newline at end of file
+    return filter(os.path.isdir, [f for f in os.listdir(d)])
+
+
+def get_module_sources(folder, basename=''):
+    # Lists (source path, archive name) for every module PyZipFile.writepy would add for folder, in the same order.
+    if not os.path.isfile(os.path.join(folder, '__init__.py')):
+        # Not a package, only its own modules are added and at the top level.
+        return [(os.path.join(folder, filename), filename[:-3] + '.pyc') for filename in sorted(os.listdir(folder)) if filename.endswith('.py')]
+    basename = '{}/{}'.format(basename, os.path.basename(folder)) if basename else os.path.basename(folder)
+    module_sources = [(os.path.join(folder, '__init__.py'), basename + '/__init__.pyc')]
+    for filename in sorted(os.listdir(folder)):
+        path = os.path.join(folder, filename)
+        if filename == '__init__.py':
+            continue
+        if os.path.isdir(path):
+            if os.path.isfile(os.path.join(path, '__init__.py')):
+                module_sources.extend(get_module_sources(path, basename))
+        elif filename.endswith('.py'):
+            module_sources.append((path, '{}/{}.pyc'.format(basename, filename[:-3])))
+    return module_sources
+
+
+def compile_source(source_path, optimize=2, mtime=None, source_name=None):
+    # Byte-compiles a module the same way py_compile does, returning the contents of the .pyc file.
+    with open(source_path, 'rb') as source_file:
+        source = source_file.read()
+    if mtime is None:
+        mtime = os.stat(source_path).st_mtime
+    code = compile(source, source_name or source_path, 'exec', dont_inherit=True, optimize=optimize)
+    header = importlib.util.MAGIC_NUMBER + struct.pack('<III', 0, int(mtime) & 0xFFFFFFFF, len(source) & 0xFFFFFFFF)
+    return header + marshal.dumps(code)
+
+
+def get_file_hash(file_path):
+    with open(file_path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def load_build_manifest(manifest_path):
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def compile_module_incremental(ts4script, mod_scripts_folder, ignore_folders=None, include_folders=None, optimize=2):
+    # Rebuilds ts4script, only byte-compiling the modules that changed since the previous build.
+    # A manifest next to the archive records the mtime, size and hash of the source of every module.
+    # Modules whose source is unchanged are copied from the previous archive as they are, the archive
+    # is stored uncompressed so nothing is recompressed either.
+    # The new archive is written to a temporary file and swapped in once it is complete. If any module fails
+    # to compile, the temporary file is thrown away and the previous archive and manifest are kept as they are.
+    timer_start = time.perf_counter()
+    ts4script = os.path.abspath(ts4script)
+    manifest_path = ts4script + '.manifest.json'
+    temp_path = ts4script + '.tmp'
+    previous_manifest = load_build_manifest(manifest_path)
+    previous_modules = previous_manifest.get('modules', {}) if previous_manifest.get('optimize') == optimize else {}
+    previous_archive = None
+    if previous_modules and os.path.exists(ts4script):
+        try:
+            previous_archive = ZipFile(ts4script)
+            previous_entries = set(previous_archive.namelist())
+        except Exception as ex:
+            print('Failed to read previous archive {}, rebuilding everything. {}'.format(ts4script, ex))
+            previous_archive = None
+    if previous_archive is None:
+        previous_modules = {}
+        previous_entries = set()
+
+    modules = {}
+    compiled_count = 0
+    copied_count = 0
+    failed_count = 0
+    previous_working_directory = os.getcwd()
+    print('Changing the working directory to \'{}\''.format(mod_scripts_folder))
+    os.chdir(mod_scripts_folder)
+    try:
+        with ZipFile(temp_path, mode='w', allowZip64=True) as zf:
+            for folder in sorted(get_child_directories('.')):
+                if ignore_folders is not None and os.path.basename(folder) in ignore_folders:
+                    continue
+                if include_folders is not None and os.path.basename(folder) not in include_folders:
+                    continue
+                print('Compiling folder \'{}\''.format(folder))
+                for (source_path, arcname) in get_module_sources(folder):
+                    source_stat = os.stat(source_path)
+                    module = {'mtime': source_stat.st_mtime, 'size': source_stat.st_size}
+                    previous_module = previous_modules.get(arcname)
+                    if previous_module is not None and arcname in previous_entries:
+                        if previous_module['mtime'] == module['mtime'] and previous_module['size'] == module['size']:
+                            module['hash'] = previous_module['hash']
+                        else:
+                            module['hash'] = get_file_hash(source_path)
+                        if module['hash'] == previous_module['hash']:
+                            zinfo = previous_archive.getinfo(arcname)
+                            zf.writestr(zinfo, previous_archive.read(zinfo))
+                            modules[arcname] = module
+                            copied_count += 1
+                            continue
+                    try:
+                        compiled = compile_source(source_path, optimize=optimize, mtime=module['mtime'])
+                    except Exception as ex:
+                        print('Failed to compile {}. {}'.format(source_path, ex))
+                        failed_count += 1
+                        continue
+                    if 'hash' not in module:
+                        module['hash'] = get_file_hash(source_path)
+                    zinfo = ZipInfo(arcname, date_time=time.localtime(module['mtime'])[:6])
+                    zf.writestr(zinfo, compiled)
+                    modules[arcname] = module
+                    compiled_count += 1
+    finally:
+        if previous_archive is not None:
+            previous_archive.close()
+        os.chdir(previous_working_directory)
+    if failed_count > 0:
+        os.remove(temp_path)
+        print('Failed to compile {} modules, {} was left unchanged.'.format(failed_count, ts4script))
+        return False
+    os.replace(temp_path, ts4script)
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as manifest_file:
+        json.dump({'optimize': optimize, 'modules': modules}, manifest_file, indent=1, sort_keys=True)
+    os.replace(manifest_path + '.tmp', manifest_path)
+    print('Compiled {} modules, reused {} unchanged modules in {:0.2f} seconds.'.format(compiled_count, copied_count, time.perf_counter() - timer_start))
+    return True
+
+
+# Every entry of a reproducible archive gets the same timestamp and attributes, so building the same sources
+# twice gives byte-identical archives.
+REPRODUCIBLE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def compile_job(job):
+    # Runs inside of a pool process. Returns (archive name, .pyc contents or None, compile time, error).
+    (source_path, arcname, optimize) = job
+    start_time = time.perf_counter()
+    try:
+        # The source mtime is left out of the .pyc header and the file name is the same on every platform.
+        compiled = compile_source(source_path, optimize=optimize, mtime=0, source_name=source_path.replace(os.sep, '/'))
+        return arcname, compiled, time.perf_counter() - start_time, None
+    except Exception as ex:
+        return arcname, None, time.perf_counter() - start_time, str(ex)
+
+
+def compile_module_parallel(ts4script, mod_scripts_folder, ignore_folders=None, include_folders=None, optimize=2, processes=None):
+    # Byte-compiles the modules of every folder in a process pool, then writes them into ts4script in sorted
+    # order with fixed timestamps. The same sources always produce a byte-identical archive.
+    # A timing report is printed for every folder. If any module fails to compile, the previous archive is kept.
+    build_start_time = time.perf_counter()
+    ts4script = os.path.abspath(ts4script)
+    temp_path = ts4script + '.tmp'
+    previous_working_directory = os.getcwd()
+    print('Changing the working directory to \'{}\''.format(mod_scripts_folder))
+    os.chdir(mod_scripts_folder)
+    try:
+        jobs = []
+        folder_of_module = {}
+        for folder in sorted(get_child_directories('.')):
+            if ignore_folders is not None and os.path.basename(folder) in ignore_folders:
+                continue
+            if include_folders is not None and os.path.basename(folder) not in include_folders:
+                continue
+            for (source_path, arcname) in get_module_sources(folder):
+                jobs.append((source_path, arcname, optimize))
+                folder_of_module[arcname] = folder
+        jobs.sort(key=lambda job: job[1])
+        folder_stats = {}
+        failed_count = 0
+        compile_start_time = time.perf_counter()
+        with Pool(processes=processes) as pool, ZipFile(temp_path, mode='w', allowZip64=True) as zf:
+            for (arcname, compiled, compile_time, error) in pool.imap(compile_job, jobs, chunksize=8):
+                # [modules, compile time, bytes]
+                stats = folder_stats.setdefault(folder_of_module[arcname], [0, 0.0, 0])
+                stats[1] += compile_time
+                if compiled is None:
+                    print('Failed to compile {}. {}'.format(arcname, error))
+                    failed_count += 1
+                    continue
+                zinfo = ZipInfo(arcname, date_time=REPRODUCIBLE_DATE_TIME)
+                zinfo.create_system = 0
+                zinfo.external_attr = 0o644 << 16
+                zf.writestr(zinfo, compiled)
+                stats[0] += 1
+                stats[2] += len(compiled)
+        compile_time = time.perf_counter() - compile_start_time
+    finally:
+        os.chdir(previous_working_directory)
+    if failed_count > 0:
+        os.remove(temp_path)
+    else:
+        os.replace(temp_path, ts4script)
+
+    print('{:<40}{:>10}{:>14}{:>12}'.format('Folder', 'Modules', 'Compile (s)', 'KB'))
+    for folder in sorted(folder_stats.keys()):
+        (module_count, folder_compile_time, folder_bytes) = folder_stats[folder]
+        print('{:<40}{:>10}{:>14.3f}{:>12.1f}'.format(folder, module_count, folder_compile_time, folder_bytes / 1024))
+    print('Compiled {} modules ({} failed) in {:0.2f} seconds, {:0.2f} seconds in total.'.format(len(jobs) - failed_count, failed_count, compile_time, time.perf_counter() - build_start_time))
+    if failed_count > 0:
+        print('{} was left unchanged.'.format(ts4script))
+        return False
+    return True
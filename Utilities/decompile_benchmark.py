@@ -0,0 +1,83 @@
+"""
+Times unpyc3 over a fixed corpus of compiled Python files, so changes to the decompiler can be compared.
+
+usage: python -m Utilities.decompile_benchmark [-r N] [-p [N]] CORPUS [CORPUS ...]
+
+CORPUS may be a folder (searched recursively for .pyc files) or a single .pyc file.
+The whole corpus is decompiled N times and the fastest, median and slowest runs are reported,
+along with the slowest files of the fastest run.
+With -p the corpus is decompiled once more with profiling on, and the time spent in each opcode handler is reported.
+"""
+import argparse
+import fnmatch
+import os
+import statistics
+import time
+from Utilities.unpyc3 import decompile, start_profile, stop_profile, profile_report
+
+
+def find_corpus_files(corpus_paths, file_pattern='*.pyc'):
+    corpus_files = []
+    for corpus_path in corpus_paths:
+        if os.path.isfile(corpus_path):
+            corpus_files.append(corpus_path)
+            continue
+        for root, dirs, files in os.walk(corpus_path):
+            dirs.sort()
+            for filename in sorted(fnmatch.filter(files, file_pattern)):
+                corpus_files.append(os.path.join(root, filename))
+    return corpus_files
+
+
+def decompile_corpus(corpus_files):
+    file_times = {}
+    failures = 0
+    for file_path in corpus_files:
+        start_time = time.perf_counter()
+        try:
+            str(decompile(file_path))
+        except Exception:
+            failures += 1
+        file_times[file_path] = time.perf_counter() - start_time
+    return file_times, failures
+
+
+def run_benchmark(corpus_paths, runs=3, slowest_count=10, profile_handlers=None):
+    corpus_files = find_corpus_files(corpus_paths)
+    if not corpus_files:
+        print('No .pyc files found in {}'.format(', '.join(corpus_paths)))
+        return None
+    print('Decompiling {} files {} times'.format(len(corpus_files), runs))
+    run_times = []
+    fastest_file_times = None
+    failures = 0
+    for run in range(runs):
+        file_times, failures = decompile_corpus(corpus_files)
+        run_time = sum(file_times.values())
+        print('run {}: {:0.3f} seconds'.format(run + 1, run_time))
+        if not run_times or run_time < min(run_times):
+            fastest_file_times = file_times
+        run_times.append(run_time)
+    print('\nmin\t= {:0.3f} seconds'.format(min(run_times)))
+    print('median\t= {:0.3f} seconds'.format(statistics.median(run_times)))
+    print('max\t= {:0.3f} seconds'.format(max(run_times)))
+    print('failed\t= {} files'.format(failures))
+    print('\nslowest files:')
+    for file_path, file_time in sorted(fastest_file_times.items(), key=lambda item: -item[1])[:slowest_count]:
+        print('{:0.4f}\t{}'.format(file_time, file_path))
+    if profile_handlers is not None:
+        # Profiling slows the decompiler down, so it gets a run of its own rather than skewing the timed runs.
+        start_profile()
+        decompile_corpus(corpus_files)
+        print('\nopcode handlers:')
+        print(profile_report(stop_profile(), limit=profile_handlers or None))
+    return run_times
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time unpyc3 over a fixed corpus of .pyc files.')
+    parser.add_argument('corpus', nargs='+', metavar='CORPUS', help='folder of .pyc files or a single .pyc file')
+    parser.add_argument('-r', type=int, metavar='N', default=3, dest='runs', help='number of times to decompile the corpus (default 3)')
+    parser.add_argument('-p', nargs='?', type=int, metavar='N', const=0, default=None, dest='profile_handlers', help='profile the opcode handlers, showing the N most expensive (default all)')
+    args = parser.parse_args()
+    run_benchmark(args.corpus, runs=args.runs, profile_handlers=args.profile_handlers)
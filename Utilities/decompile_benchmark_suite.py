@@ -0,0 +1,250 @@
+"""
+Benchmarks the decompiler.py backends over a fixed corpus, so changes to unpyc3 or decompiler.py can be checked for
+speed, memory and accuracy regressions.
+
+usage: python -m Utilities.decompile_benchmark_suite [-o FOLDER] [-r N] [-B BACKEND] [-b FILENAME] [-u] [-t PERCENT]
+
+The corpus is this repo's Scripts tree plus a set of generated stress modules (deep nesting, huge functions,
+large literals), compiled to .pyc by the running interpreter. Run it with Python 3.7 to match the game.
+Every file is decompiled by every available backend through decompiler.decompile(). The fastest of N runs,
+the peak memory (in process backends only, py37dec runs in a subprocess) and the result category are recorded
+per file and compared against a baseline JSON file.
+"""
+import argparse
+import json
+import os
+import py_compile
+import shutil
+import time
+import tracemalloc
+import decompiler
+from Utilities.decompile_benchmark import find_corpus_files
+
+CORPUS_SOURCE_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scripts')
+DEFAULT_OUTPUT_FOLDER = './decompile_benchmark'
+DEFAULT_BASELINE_FILE = 'decompile_benchmark_baseline.json'
+BACKENDS = ('unpyc3', 'py37dec')
+# Result codes of DecompileResultData, from best to worst.
+RESULT_CATEGORIES = ('perfect', 'good', 'syntax', 'failed', 'timeout')
+# Timings of files this fast are mostly noise, so they are never flagged as slower.
+MIN_FLAGGED_TIME = 0.005
+
+
+def generate_deep_nesting(depth=20):
+    lines = ['def deep_nesting(values):', '    total = 0']
+    indent = '    '
+    for level in range(depth):
+        statement = ('for item_{0} in values:', 'if item_{0}:', 'while total < {0}:', 'try:')[level % 4].format(level)
+        lines.append(indent + statement)
+        indent += '    '
+        lines.append(indent + 'total += {}'.format(level))
+    for level in reversed(range(depth)):
+        indent = indent[:-4]
+        if level % 4 == 3:
+            lines.append(indent + 'except ValueError:')
+            lines.append(indent + '    total -= 1')
+        elif level % 4 == 2:
+            lines.append(indent + '    break')
+    lines.append('    return total')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_huge_function(block_count=1500):
+    lines = ['def huge_function(value):', '    result = 0']
+    for index in range(block_count):
+        lines.append('    if value == {}:'.format(index))
+        lines.append('        result += value * {}'.format(index % 7))
+        lines.append('    else:')
+        lines.append('        result -= 1')
+    lines.append('    return result')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_elif_chain(branch_count=150):
+    # Every elif is decompiled one level deeper than the last, so much longer chains overflow the C stack.
+    lines = ['def elif_chain(value):']
+    for index in range(branch_count):
+        lines.append('    {} value == {}:'.format('if' if index == 0 else 'elif', index))
+        lines.append('        return {}'.format(index * 3))
+    lines.append('    return -1')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_large_literals(entry_count=3000):
+    lines = ['TUNING = {']
+    for index in range(entry_count):
+        lines.append('    {0}: ({0}, \'name_{0}\', {1}, frozenset(({0}, {2}))),'.format(index, index / 4, index * 3))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_many_classes(class_count=300):
+    lines = []
+    for index in range(class_count):
+        lines.append('class Generated{}:'.format(index))
+        lines.append('    def __init__(self, value={}):'.format(index))
+        lines.append('        self.value = value')
+        lines.append('')
+        lines.append('    def get(self, other):')
+        lines.append('        return [self.value + item for item in other if item % {} == 0]'.format(index % 5 + 1))
+        lines.append('')
+        lines.append('')
+    return '\n'.join(lines)
+
+
+STRESS_MODULES = {
+    'deep_nesting': generate_deep_nesting,
+    'elif_chain': generate_elif_chain,
+    'huge_function': generate_huge_function,
+    'large_literals': generate_large_literals,
+    'many_classes': generate_many_classes
+}
+
+
+def build_corpus(output_folder):
+    """
+        Compile the corpus sources into output_folder/pyc, returning the relative paths of the .pyc files.
+    """
+    pyc_folder = os.path.join(output_folder, 'pyc')
+    source_folder = os.path.join(output_folder, 'stress')
+    shutil.rmtree(pyc_folder, ignore_errors=True)
+    os.makedirs(source_folder, exist_ok=True)
+    sources = []
+    for name, generate in sorted(STRESS_MODULES.items()):
+        source_path = os.path.join(source_folder, name + '.py')
+        with open(source_path, 'w', encoding='utf-8') as fp:
+            fp.write(generate())
+        sources.append((source_path, os.path.join('stress', name + '.pyc')))
+    for source_path in find_corpus_files([CORPUS_SOURCE_FOLDER], file_pattern='*.py'):
+        relative_path = os.path.relpath(source_path, os.path.dirname(CORPUS_SOURCE_FOLDER))
+        sources.append((source_path, os.path.splitext(relative_path)[0] + '.pyc'))
+    corpus_files = []
+    for source_path, relative_path in sources:
+        try:
+            py_compile.compile(source_path, cfile=os.path.join(pyc_folder, relative_path), doraise=True)
+        except py_compile.PyCompileError as ex:
+            print('Skipping {}: {}'.format(source_path, ex.msg))
+            continue
+        corpus_files.append(relative_path)
+    return corpus_files
+
+
+def get_available_backends():
+    available = []
+    if decompiler.UNPYC3_AVAILABLE:
+        available.append('unpyc3')
+    if decompiler.PY37DEC_AVAILABLE:
+        available.append('py37dec')
+    return available
+
+
+def decompile_file(pyc_folder, dest_folder, relative_path, backend, trace_memory=False):
+    sub_folder, pyc_file = os.path.split(relative_path)
+    py_file = os.path.splitext(pyc_file)[0] + '.py'
+    if trace_memory:
+        tracemalloc.start()
+    start_time = time.perf_counter()
+    try:
+        result = decompiler.decompile(pyc_folder, dest_folder, sub_folder, pyc_file, py_file, False, 10000, 0, backend, 5, False, remove_pyc=False)
+    finally:
+        elapsed = time.perf_counter() - start_time
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        if trace_memory:
+            tracemalloc.stop()
+    return result, elapsed, peak_memory
+
+
+def benchmark_backend(output_folder, corpus_files, backend, runs=3):
+    """
+        Decompile the corpus with one backend.
+        Files are timed without tracing memory, then decompiled once more to measure their peak memory.
+    """
+    pyc_folder = os.path.join(output_folder, 'pyc')
+    dest_folder = os.path.join(output_folder, backend)
+    file_results = {}
+    for relative_path in corpus_files:
+        times = []
+        for _ in range(runs):
+            result, elapsed, _ = decompile_file(pyc_folder, dest_folder, relative_path, backend)
+            times.append(elapsed)
+        peak_memory = None
+        if backend != 'py37dec':
+            _, _, peak_memory = decompile_file(pyc_folder, dest_folder, relative_path, backend, trace_memory=True)
+        file_results[relative_path.replace(os.sep, '/')] = {
+            'time': min(times),
+            'peak_memory': peak_memory,
+            'category': RESULT_CATEGORIES[result.result] if 0 <= result.result < len(RESULT_CATEGORIES) else 'timeout'
+        }
+    return file_results
+
+
+def find_regressions(file_result, baseline_result, regression_threshold):
+    regressions = []
+    if file_result['time'] >= MIN_FLAGGED_TIME and file_result['time'] > baseline_result['time'] * (1 + regression_threshold):
+        regressions.append('time {:+.1f}%'.format((file_result['time'] / baseline_result['time'] - 1) * 100))
+    if file_result['peak_memory'] and baseline_result.get('peak_memory') and file_result['peak_memory'] > baseline_result['peak_memory'] * (1 + regression_threshold):
+        regressions.append('memory {:+.1f}%'.format((file_result['peak_memory'] / baseline_result['peak_memory'] - 1) * 100))
+    if RESULT_CATEGORIES.index(file_result['category']) > RESULT_CATEGORIES.index(baseline_result['category']):
+        regressions.append('{} -> {}'.format(baseline_result['category'], file_result['category']))
+    return regressions
+
+
+def load_baseline(baseline_file):
+    if not baseline_file or not os.path.isfile(baseline_file):
+        return {}
+    with open(baseline_file, 'r', encoding='utf-8') as fp:
+        return json.load(fp)
+
+
+def run_suite(output_folder=DEFAULT_OUTPUT_FOLDER, backends=None, runs=3, baseline_file=DEFAULT_BASELINE_FILE, update_baseline=False, regression_threshold=0.1, slowest_count=10):
+    """
+        Run the benchmark suite, returning True if no regressions were found.
+    """
+    available_backends = get_available_backends()
+    backends = [backend for backend in (backends or BACKENDS) if backend in available_backends]
+    if not backends:
+        print('None of the requested decompilers are available')
+        return False
+    corpus_files = build_corpus(output_folder)
+    print('Benchmarking {} files with {}, {} runs each\n'.format(len(corpus_files), ', '.join(backends), runs))
+    baseline = load_baseline(baseline_file)
+    regression_count = 0
+    for backend in backends:
+        file_results = benchmark_backend(output_folder, corpus_files, backend, runs=runs)
+        backend_baseline = baseline.setdefault(backend, {})
+        categories = {category: 0 for category in RESULT_CATEGORIES}
+        for file_result in file_results.values():
+            categories[file_result['category']] += 1
+        print('{}: {:0.3f} seconds'.format(backend, sum(file_result['time'] for file_result in file_results.values())))
+        print('\t' + ', '.join('{} {}'.format(category, count) for category, count in categories.items()))
+        print('slowest files:')
+        for relative_path, file_result in sorted(file_results.items(), key=lambda item: -item[1]['time'])[:slowest_count]:
+            peak_memory = '{:.0f} KB'.format(file_result['peak_memory'] / 1024) if file_result['peak_memory'] is not None else '-'
+            print('{:0.4f}\t{}\t{}\t{}'.format(file_result['time'], peak_memory, file_result['category'], relative_path))
+        for relative_path, file_result in file_results.items():
+            if relative_path in backend_baseline:
+                regressions = find_regressions(file_result, backend_baseline[relative_path], regression_threshold)
+                if regressions:
+                    regression_count += 1
+                    print('REGRESSION {}: {}'.format(relative_path, ', '.join(regressions)))
+            if update_baseline or relative_path not in backend_baseline:
+                backend_baseline[relative_path] = file_result
+        print()
+    if baseline_file:
+        with open(baseline_file, 'w', encoding='utf-8') as fp:
+            json.dump(baseline, fp, indent=2, sort_keys=True)
+    print('{} regressions found'.format(regression_count))
+    return regression_count == 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the decompiler backends over a fixed corpus.')
+    parser.add_argument('-o', metavar='FOLDER', default=DEFAULT_OUTPUT_FOLDER, dest='output_folder', help='folder to build the corpus and decompile into (default {})'.format(DEFAULT_OUTPUT_FOLDER))
+    parser.add_argument('-r', type=int, metavar='N', default=3, dest='runs', help='number of times each file is timed, the fastest is kept (default 3)')
+    parser.add_argument('-B', action='append', choices=BACKENDS, dest='backends', help='decompiler to benchmark, may be repeated (default all available)')
+    parser.add_argument('-b', metavar='FILENAME', default=DEFAULT_BASELINE_FILE, dest='baseline_file', help='baseline JSON file to compare against, created if missing (default {})'.format(DEFAULT_BASELINE_FILE))
+    parser.add_argument('-u', action='store_true', dest='update_baseline', help='store the results of this run in the baseline file')
+    parser.add_argument('-t', type=float, metavar='PERCENT', default=10.0, dest='threshold', help='flag files that are slower or use more memory than the baseline by more than PERCENT (default 10)')
+    args = parser.parse_args()
+    no_regressions = run_suite(args.output_folder, backends=args.backends, runs=args.runs, baseline_file=args.baseline_file, update_baseline=args.update_baseline, regression_threshold=args.threshold / 100)
+    exit(0 if no_regressions else 1)
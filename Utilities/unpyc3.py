@@ -43,12 +43,58 @@ def trace(*args):
         current_trace(*args)
 
 
+def is_tracing():
+    """
+    Return True if a trace function has been set.  Check this before
+    building anything expensive to pass to trace().
+    """
+    return current_trace is not _trace
+
+
 def _trace(*args):
     pass
 
 
 current_trace = _trace
 
+# Per opcode handler statistics collected while profiling, see start_profile()
+current_profile = None
+_profile_child_times = []
+
+
+def start_profile():
+    """
+    Start recording how many times each SuiteDecompiler opcode handler
+    runs and how long it takes.
+    """
+    global current_profile
+    current_profile = {}
+
+
+def stop_profile():
+    """
+    Stop profiling and return the statistics recorded since
+    start_profile(), a dict of handler name to
+    [calls, exclusive time, inclusive time].
+    """
+    global current_profile
+    profile, current_profile = current_profile, None
+    return profile or {}
+
+
+def profile_report(profile, limit=None):
+    """
+    Format the statistics returned by stop_profile() as a table, the
+    handlers taking the most exclusive time first.  Exclusive time leaves
+    out the time spent in handlers of nested SuiteDecompilers.
+    """
+    total = sum(stats[1] for stats in profile.values()) or 1
+    lines = ['{:<28}{:>10}{:>12}{:>12}{:>8}'.format('handler', 'calls', 'self (s)', 'total (s)', 'self %')]
+    rows = sorted(profile.items(), key=lambda item: -item[1][1])
+    for name, (calls, self_time, total_time) in rows[:limit]:
+        lines.append('{:<28}{:>10}{:>12.4f}{:>12.4f}{:>8.1f}'.format(name, calls, self_time, total_time, self_time / total * 100))
+    return '\n'.join(lines)
+
 # TODO:
 # - Support for keyword-only arguments
 # - Handle assert statements better
@@ -59,8 +105,10 @@ from array import array
 from opcode import opname, opmap, HAVE_ARGUMENT, cmp_op
 import inspect
 
+import io
 import struct
 import sys
+from time import perf_counter
 
 # Masks for code object's co_flag attribute
 VARARGS = 4
@@ -149,9 +197,21 @@ def dec_module(path):
     elif not path.endswith(".pyc") and not path.endswith(".pyo"):
         raise ValueError("path must point to a .py or .pyc file")
     with open(path, "rb") as stream:
-        code_obj = read_code(stream)
-        code = Code(code_obj)
-        return code.get_suite(include_declarations=False, look_for_docstring=True)
+        return dec_module_stream(stream)
+
+
+def dec_module_bytes(data):
+    """
+    Decompile a module from the contents of a .pyc file, for example a
+    member read straight out of a zip archive.
+    """
+    return dec_module_stream(io.BytesIO(data))
+
+
+def dec_module_stream(stream):
+    code_obj = read_code(stream)
+    code = Code(code_obj)
+    return code.get_suite(include_declarations=False, look_for_docstring=True)
 
 
 def decompile(obj):
@@ -218,6 +278,41 @@ class IndentString(Indent):
         return "\n".join(self.lines)
 
 
+class IndentStream(Indent):
+    """
+    Writes the lines straight to a stream instead of keeping them in
+    memory.  The text written between two calls to start() is the same as
+    str() of an IndentString the same lines were written to.
+    """
+    def __init__(self, stream, indent_level=0, indent_step=4, state=None):
+        Indent.__init__(self, indent_level, indent_step)
+        self.stream = stream
+        # [number of lines written since start(), whether the last line was empty]
+        # shared by all the indents derived from this one
+        self.state = [0, False] if state is None else state
+
+    def __add__(self, indent_increase):
+        return type(self)(self.stream, self.level + indent_increase, self.step, self.state)
+
+    def start(self):
+        self.state[0] = 0
+        self.state[1] = False
+
+    def sep(self):
+        if not self.state[0] or not self.state[1]:
+            self.write_line("")
+
+    def indent(self, string):
+        self.write_line(" " * self.step * self.level + string)
+
+    def write_line(self, line):
+        if self.state[0]:
+            self.stream.write("\n")
+        self.stream.write(line)
+        self.state[0] += 1
+        self.state[1] = not line
+
+
 class Stack:
     def __init__(self):
         self._stack = []
@@ -356,48 +451,60 @@ class Code:
         self.varnames = list(map(PyName, code_obj.co_varnames))
         self.instr_seq = list(code_walker(code_obj.co_code))
         self.instr_map = {addr: i for i, (addr, _) in enumerate(self.instr_seq)}
+        # One Address per instruction, created once and handed out by every
+        # lookup, so walking the code doesn't allocate and addresses can be
+        # compared by identity.
+        self.addresses = [Address(self, i) for i in range(len(self.instr_seq))]
+        for addr in self.addresses:
+            addr.find_jump()
         self.name = code_obj.co_name
         self.globals = []
         self.nonlocals = []
         self.jump_targets = []
         self.find_else()
         self.find_jumps()
-        trace('================================================')
-        trace(self.code_obj)
-        trace('================================================')
-        for addr in self:
-            trace(str(addr))
-            if addr.opcode in stmt_opcodes or addr.opcode in pop_jump_if_opcodes:
-                trace(' ')
-        trace('================================================')
+        if is_tracing():
+            trace('================================================')
+            trace(self.code_obj)
+            trace('================================================')
+            for addr in self:
+                trace(str(addr))
+                if addr.opcode in stmt_opcodes or addr.opcode in pop_jump_if_opcodes:
+                    trace(' ')
+            trace('================================================')
         self.flags: CodeFlags = CodeFlags(code_obj.co_flags)
 
     def __getitem__(self, instr_index):
-        if 0 <= instr_index < len(self.instr_seq):
-            return Address(self, instr_index)
+        if 0 <= instr_index < len(self.addresses):
+            return self.addresses[instr_index]
 
     def __iter__(self):
-        for i in range(len(self.instr_seq)):
-            yield Address(self, i)
+        return iter(self.addresses)
 
     def show(self):
         for addr in self:
             print(addr)
 
     def address(self, addr):
-        return self[self.instr_map[addr]]
+        return self.addresses[self.instr_map[addr]]
 
     def iscellvar(self, i):
         return i < len(self.code_obj.co_cellvars)
 
     def find_jumps(self):
+        # jump_target_indices holds the instruction index of every jump target,
+        # so checking whether an address is a jump target is a set lookup
+        # rather than a scan of jump_targets.
+        self.jump_target_indices = set()
         for addr in self:
             opcode, arg = addr
             jt = addr.jump()
             if jt:
                 self.jump_targets.append(jt)
+                self.jump_target_indices.add(jt.index)
 
     def find_else(self):
+        # Keyed by instruction index so lookups don't go through Address.__eq__
         jumps = {}
         last_jump = None
         for addr in self:
@@ -407,7 +514,7 @@ class Code:
                 if (jump_addr[-1].opcode in else_jump_opcodes
                         or jump_addr.opcode == FOR_ITER):
                     last_jump = addr
-                    jumps[jump_addr] = addr
+                    jumps[jump_addr.index] = addr
             elif opcode == JUMP_ABSOLUTE:
                 # This case is to deal with some nested ifs such as:
                 # if a:
@@ -416,17 +523,18 @@ class Code:
                 #     elif c:
                 #         g()
                 jump_addr = self.address(arg)
-                if jump_addr in jumps:
-                    jumps[addr] = jumps[jump_addr]
+                if jump_addr.index in jumps:
+                    jumps[addr.index] = jumps[jump_addr.index]
             elif opcode == JUMP_FORWARD:
                 jump_addr = addr[1] + arg
-                if jump_addr in jumps:
-                    jumps[addr] = jumps[jump_addr]
+                if jump_addr.index in jumps:
+                    jumps[addr.index] = jumps[jump_addr.index]
             elif opcode in stmt_opcodes and last_jump is not None:
                 # This opcode will generate a statement, so it means
                 # that the last POP_JUMP_IF_x was an else-jump
-                jumps[addr] = last_jump
+                jumps[addr.index] = last_jump
         self.else_jumps = set(jumps.values())
+        self.else_jump_indices = {addr.index for addr in self.else_jumps}
 
     def get_suite(self, include_declarations=True, look_for_docstring=False) -> Suite:
         dec = SuiteDecompiler(self[0])
@@ -483,21 +591,24 @@ class Code:
 
 
 class Address:
+    """
+    An instruction of a Code object.  Code creates exactly one Address per
+    instruction, so two addresses are equal only if they are the same object.
+    """
+    __slots__ = ('code', 'index', 'addr', 'opcode', 'arg', '_jump')
+
     def __init__(self, code, instr_index):
         self.code = code
         self.index = instr_index
         self.addr, (self.opcode, self.arg) = code.instr_seq[instr_index]
-
-    def __eq__(self, other):
-        return (isinstance(other, type(self))
-                and self.code == other.code and self.index == other.index)
+        self._jump = None
 
     def __lt__(self, other):
         return other is None or (isinstance(other, type(self))
                                  and self.code == other.code and self.index < other.index)
 
     def __str__(self):
-        mark = "* " if self in self.code.else_jumps else "  "
+        mark = "* " if self.is_else_jump() else "  "
         jump = self.jump()
         jt = '>>' if self.is_jump_target() else '  '
         arg = self.arg or "  "
@@ -533,30 +644,37 @@ class Address:
         return self.code.address(self.addr + delta)
 
     def __getitem__(self, index):
-        return self.code[self.index + index]
+        index += self.index
+        addresses = self.code.addresses
+        if 0 <= index < len(addresses):
+            return addresses[index]
 
     def __iter__(self):
         yield self.opcode
         yield self.arg
 
-    def __hash__(self):
-        return hash((self.code, self.index))
-
     def is_else_jump(self):
-        return self in self.code.else_jumps
+        return self.index in self.code.else_jump_indices
 
     def is_jump_target(self):
-        return self in self.code.jump_targets
+        return self.index in self.code.jump_target_indices
 
     def change_instr(self, opcode, arg=None):
         self.code.instr_seq[self.index] = (self.addr, (opcode, arg))
+        self.opcode, self.arg = opcode, arg
+        self.find_jump()
 
-    def jump(self) -> Address:
+    def find_jump(self):
         opcode = self.opcode
         if opcode in dis.hasjrel:
-            return self[1] + self.arg
+            self._jump = self[1] + self.arg
         elif opcode in dis.hasjabs:
-            return self.code.address(self.arg)
+            self._jump = self.code.address(self.arg)
+        else:
+            self._jump = None
+
+    def jump(self) -> Address:
+        return self._jump
 
     def seek(self, opcode: tuple, increment: int, end: Address = None) -> Address:
         if not isinstance(opcode, tuple):
@@ -1507,16 +1625,36 @@ class SuiteDecompiler:
         truthiness, addr, cond = self.popjump_stack.pop()
         return cond
 
+    @classmethod
+    def get_dispatch_table(cls):
+        """
+        Return a list mapping each opcode to its handler function (or None
+        if this class has no handler for it).  The table is built the first
+        time a class runs, handlers added to the class after that are not
+        picked up.
+        """
+        table = cls.__dict__.get('_dispatch_table')
+        if table is None:
+            table = [getattr(cls, name, None) for name in opname]
+            cls._dispatch_table = table
+        return table
+
     def run(self):
         addr, end_addr = self.start_addr, self.end_addr
+        dispatch_table = self.get_dispatch_table()
         while addr and addr < end_addr:
             try:
-                opcode, arg = addr
-                method = getattr(self, opname[opcode])
-                if opcode < HAVE_ARGUMENT:
-                    new_addr = method(addr)
+                opcode, arg = addr.opcode, addr.arg
+                method = dispatch_table[opcode]
+                if method is None:
+                    addr = addr[1]
+                    continue
+                if current_profile is not None:
+                    new_addr = self.run_profiled(method, opcode, addr, arg)
+                elif opcode < HAVE_ARGUMENT:
+                    new_addr = method(self, addr)
                 else:
-                    new_addr = method(addr, arg)
+                    new_addr = method(self, addr, arg)
                 if new_addr is self.END_NOW:
                     break
                 elif new_addr is None:
@@ -1527,6 +1665,25 @@ class SuiteDecompiler:
                 continue
         return addr
 
+    def run_profiled(self, method, opcode, addr, arg):
+        # _profile_child_times has an entry for each handler currently
+        # running, adding up the time spent in the handlers it ran in turn.
+        _profile_child_times.append(0.0)
+        start_time = perf_counter()
+        try:
+            if opcode < HAVE_ARGUMENT:
+                return method(self, addr)
+            return method(self, addr, arg)
+        finally:
+            elapsed = perf_counter() - start_time
+            child_time = _profile_child_times.pop()
+            if _profile_child_times:
+                _profile_child_times[-1] += elapsed
+            stats = current_profile.setdefault(opname[opcode], [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed - child_time
+            stats[2] += elapsed
+
     def write(self, template, *args):
         def fmt(x):
             if isinstance(x, int):
@@ -25,7 +25,9 @@ def py37dec():
     main(decompile_src, decompile_destination)
 
 
-if compiler_name == 'unpyc3':
-    unpyc3(include_ea_decompileile=include_ea_decompile, include_decompile_directory=include_decompile_dir)
-elif compiler_name == 'py37dec':
-    py37dec()
+# The decompiler spawns worker processes that import this module again, so only run when executed directly.
+if __name__ == '__main__':
+    if compiler_name == 'unpyc3':
+        unpyc3(include_ea_decompileile=include_ea_decompile, include_decompile_directory=include_decompile_dir)
+    elif compiler_name == 'py37dec':
+        py37dec()
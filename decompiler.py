@@ -30,8 +30,8 @@ else:
 # Will be created if not found.
 DEFAULT_PY_DEST_FOLDER = './ts4_scripts'
 
-# You may want to turn this down to 2 or 4 if you don't have a quad-core CPU
-DEFAULT_MAX_THREADS = 1
+# One decompile "thread" per CPU core, you may want to turn this down if you need the machine for other work
+DEFAULT_MAX_THREADS = os.cpu_count() or 1
 
 # Set to either 'unpyc3' or 'py37dec'
 DEFAULT_DECOMPILER = compiler_name
@@ -46,19 +46,22 @@ Requires:
      or unpyc3 (with 3.7.0 decompile support) module must be available for import
 
 usage: decompiler.py [-h] [-z ZIP_FOLDER] [-s SOURCE_FOLDER] [-d DEST_FOLDER]
-                     [-S] [-p] [-t N] [-r [FILENAME]] [-L [N]]
-                     [-c none|detail] [-U] [-P] [-T SEC]
+                     [-S] [-p] [-t N] [-r [FILENAME]] [-L [N]] [-W SEC]
+                     [--force] [--prune] [-c none|detail] [-U] [-P] [-T SEC]
 
 optional arguments:
   -h, --help        show this help message and exit
-  -z ZIP_FOLDER     location of installed game Zip files
+  -z ZIP_FOLDER     location of installed game Zip files (unpyc3 decompiles them in memory)
   -s SOURCE_FOLDER  get compiled scripts from folder instead of Zip files
   -d DEST_FOLDER    destination folder for decompilaed files
   -S                create subfolders of DEST_FOLDER by result
   -p                prefix output filenames with [RESULT]
   -t N              number of simultaneous decompile threads to use
   -r [FILENAME]     create CSV file containing results for decompiled files
-  -L [N]            code objects with >N bytes will not be analyzed
+  -L [N]            differing code objects with >N bytes will not be diffed
+  -W SEC            use persistent decompile workers, restarting any worker that takes more than SEC seconds on a file (0=no limit)
+  --force           decompile every file, even those unchanged since the previous run
+  --prune           remove manifest entries for files no longer in the source folder
   -c none|detail    prefix decompiled files with test results comment (default brief)
   -U                use unpyc3 for decompilation
   -P                use py37dec for decompilation
@@ -79,10 +82,13 @@ import inspect
 import difflib
 import re
 import multiprocessing
+import multiprocessing.connection
 import sys
 import argparse
 import shutil
 import zipfile
+import hashlib
+import json
 
 if DEFAULT_DECOMPILER != 'py37dec' and DEFAULT_DECOMPILER != 'unpyc3':
     print('Invalid setting for DEFAULT_DECOMPILER in source')
@@ -100,7 +106,12 @@ try:
     import unpyc3
     UNPYC3_AVAILABLE = True
 except:
-    pass
+    try:
+        # Otherwise use the copy of unpyc3 in the Utilities folder.
+        from Utilities import unpyc3
+        UNPYC3_AVAILABLE = True
+    except:
+        pass
 
 # Quick 'n' dirty stopwatch timer
 class Timer():
@@ -120,6 +131,7 @@ class DecompileResultData():
         self.decompile_time = -1
         self.analyze_time = -1
         self.result = -1
+        self.messages = []
 
 # Reads the code object from a compiled Python (.pyc) file
 def get_codeobj_from_pyc(filename):
@@ -127,6 +139,31 @@ def get_codeobj_from_pyc(filename):
         code_obj = marshal.loads(fp.read()[16:])
     return code_obj
 
+# Zip files opened by this "thread", so each one is opened once rather than once for every file read from it.
+open_archives = {}
+
+# Reads the contents of a compiled Python (.pyc) file straight out of a Zip file.
+def read_archive_member(archive_member):
+    (archive_path, member_name) = archive_member
+    archive = open_archives.get(archive_path)
+    if archive is None:
+        archive = zipfile.ZipFile(archive_path)
+        open_archives[archive_path] = archive
+    return archive.read(member_name)
+
+def close_archives():
+    for archive in open_archives.values():
+        archive.close()
+    open_archives.clear()
+
+# Returns the path shown and recorded for the .pyc file of a job, a path within the Zip file for files
+# decompiled straight out of a Zip file.
+def get_job_pyc_filename(job):
+    (srcFolder, _, subFolder, pycFile, _, _, _, _, _, _, archive_member) = job
+    if archive_member is not None:
+        return os.path.join(archive_member[0], *archive_member[1].split('/'))
+    return os.path.join(srcFolder, subFolder, pycFile)
+
 # Code object comparison routines based on code written by Andrew from Sims 4 Studio
 #
 # Handle formatting dis() output of a code object in order to run through a diff process.
@@ -153,12 +190,56 @@ def format_dis_lines(co):
                        filter(None,
                               dis.Bytecode(co).dis().split('\n')))))
 
+# Hash based structural comparison.  A code object is reduced to the parts that make up its behaviour:
+# the bytecode, flags, argument counts, names and constants, leaving out line numbers and file names.
+# Nested code objects are hashed recursively, so two code objects with the same digest compile to the
+# same bytecode all the way down and there is no need to diff their dis() output.
+def normalize_const(constant, digests):
+    if type(constant) is types.CodeType:
+        return ('code', codeobj_digest(constant, digests))
+    if type(constant) is tuple:
+        return ('tuple', tuple(normalize_const(c, digests) for c in constant))
+    if type(constant) is frozenset:
+        # The iteration order of a frozenset is not stable between processes
+        return ('frozenset', tuple(sorted(repr(normalize_const(c, digests)) for c in constant)))
+    return (type(constant).__name__, repr(constant))
+
+def codeobj_shallow_key(co, digests):
+    return (
+        co.co_name, co.co_code, co.co_flags, co.co_argcount, co.co_kwonlyargcount, co.co_nlocals,
+        co.co_names, co.co_varnames, co.co_cellvars, co.co_freevars,
+        tuple(('code', c.co_name) if type(c) is types.CodeType else normalize_const(c, digests) for c in co.co_consts)
+    )
+
+# Returns the digest of a code object including all of its nested code objects.  digests caches the
+# results by id() for the duration of one comparison.
+def codeobj_digest(co, digests):
+    digest = digests.get(id(co))
+    if digest is None:
+        key = (codeobj_shallow_key(co, digests), tuple(normalize_const(c, digests) for c in co.co_consts if type(c) is types.CodeType))
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        digests[id(co)] = digest
+    return digest
+
 # Perform the actual code object comparisons
-# Returns a string of errors found, or an empty string for a perfect comparison result
-def compare_codeobjs(pyc_co, py_co, large_codeobjects_threshold):
-    # Large code objects can take a significant time to process with diff(), so skipped by default
+# Returns a string of errors found, or an empty string for a perfect comparison result.
+# Code objects are compared by digest first, only those that differ are compared in detail.
+def compare_codeobjs(pyc_co, py_co, large_codeobjects_threshold, digests=None):
+    if digests is None:
+        digests = {}
+    if codeobj_digest(pyc_co, digests) == codeobj_digest(py_co, digests):
+        return ''
+    if codeobj_shallow_key(pyc_co, digests) == codeobj_shallow_key(py_co, digests):
+        # This code object is identical, the difference is in its nested code objects
+        err_str = ''
+        for constant, py_constant in zip(pyc_co.co_consts, py_co.co_consts):
+            if type(constant) is types.CodeType:
+                err_str += compare_codeobjs(constant, py_constant, large_codeobjects_threshold, digests)
+        return err_str
+    # Large code objects can take a significant time to process with diff(), so the detailed comparison is skipped.
+    # Their digests have already shown they differ.
     if large_codeobjects_threshold and len(py_co.co_code) > large_codeobjects_threshold:
-        return '{0}\nSKIPPING COMPARISON OF LARGE CODE OBJECT\n\t{1}\n{0}\n'.format('='*80, pyc_co.co_name)
+        return '{0}\nLARGE CODE OBJECT DIFFERS, SKIPPING DETAILED COMPARISON\n\t{1}\n{0}\n'.format('='*80, pyc_co.co_name)
     err_str = ''
     flags_err_str = ''
     names_err_str = ''
@@ -203,7 +284,7 @@ def compare_codeobjs(pyc_co, py_co, large_codeobjects_threshold):
                 consts_err_str +=  'Unable to compare constant {}. Does not exist in the decompiled version\n'.format(constant)
             elif type(constant) is types.CodeType:
                 if type(py_co.co_consts[idxc]) is types.CodeType:
-                    err_str += compare_codeobjs(constant, py_co.co_consts[idxc], large_codeobjects_threshold)
+                    err_str += compare_codeobjs(constant, py_co.co_consts[idxc], large_codeobjects_threshold, digests)
                 else:
                     consts_err_str += 'Constants mismatched: unable to compare code object {} to non-code object {}\n'.format(constant, py_co.co_consts[idxc])
             elif constant != py_co.co_consts[idxc]:
@@ -253,18 +334,25 @@ def compare_codeobjs(pyc_co, py_co, large_codeobjects_threshold):
     return err_str
 
 # Decompile a .pyc file producing a .py file
+# When pyc_data is given, it is the contents of the .pyc file read out of a Zip file and pycFullFilename is only
+# used to report the result.  Only unpyc3 can decompile from memory.
 # Returns a DecompileResultData encapsulation of the result information.
-def decompile(srcFolder, destFolder, subFolder, pycFile, pyFile, prefix_filenames, large_codeobjects_threshold, comment_style, decompiler, py37dec_timeout, split_result_folders):
-    decompile_results = DecompileResultData(os.path.realpath(os.path.join(srcFolder, subFolder, pycFile)))
+def decompile(srcFolder, destFolder, subFolder, pycFile, pyFile, prefix_filenames, large_codeobjects_threshold, comment_style, decompiler, py37dec_timeout, split_result_folders, remove_pyc=None, pyc_data=None, pycFullFilename=None):
+    if pycFullFilename is None:
+        pycFullFilename = os.path.join(srcFolder, subFolder, pycFile)
+    decompile_results = DecompileResultData(os.path.realpath(pycFullFilename))
     timer = Timer()
-    remove_pyc = True if srcFolder == destFolder else False
-    pycFullFilename = os.path.join(srcFolder, subFolder, pycFile)
+    if remove_pyc is None:
+        remove_pyc = True if srcFolder == destFolder and pyc_data is None else False
 
     try:
         if decompiler == 'unpyc3':
             # For unpyc3, just call the decompile() method from that module
             src_code = ''
-            lines = unpyc3.decompile(pycFullFilename)
+            if pyc_data is not None:
+                lines = unpyc3.dec_module_bytes(pyc_data)
+            else:
+                lines = unpyc3.decompile(pycFullFilename)
             for line in lines:
                 src_code += str(line) + '\n'
         else:
@@ -348,7 +436,10 @@ def decompile(srcFolder, destFolder, subFolder, pycFile, pyFile, prefix_filename
         py_codeobj = compile(src_code, pyFile, 'exec')
 
         # Get the code object from the .pyc file
-        pyc_codeobj = get_codeobj_from_pyc(decompile_results.pycFilename)
+        if pyc_data is not None:
+            pyc_codeobj = marshal.loads(pyc_data[16:])
+        else:
+            pyc_codeobj = get_codeobj_from_pyc(decompile_results.pycFilename)
         
         # Compare the code objects recursively
         issues = compare_codeobjs(pyc_codeobj, py_codeobj, large_codeobjects_threshold)
@@ -467,71 +558,348 @@ def is_success(result) -> bool:
     else:
         return False
 
-# Unzips the script files (.pyc) from the TS4 game executable folders into the destination folder.
-def unzip_script_files(zip_folder, dest_folder):
-    print('Extracting Zip files from game, please wait.')
-    for file in ['base.zip', 'core.zip', 'simulation.zip']:
-        zip = zipfile.ZipFile(os.path.join(zip_folder, file))
-        zip.extractall(os.path.join(dest_folder, os.path.splitext(file)[0]))
+# Returns the game's script Zip files (base.zip, core.zip, simulation.zip and generated.zip) as
+# (zip path, destination subfolder name) pairs.  unpyc3 decompiles these straight out of the Zip files.
+def get_script_zip_files(zip_folder):
+    script_zip_files = [(os.path.join(zip_folder, file), os.path.splitext(file)[0]) for file in ['base.zip', 'core.zip', 'simulation.zip']]
     if os.name == 'posix':
         # Mac location for generated.zip
         generated_folder = os.path.realpath(os.path.join(zip_folder, '../../../Python'))
     else:
         # Windows location for generated.zip
         generated_folder = os.path.realpath(os.path.join(zip_folder, '../../../Game/Bin/Python'))
-    zip = zipfile.ZipFile(os.path.join(generated_folder, 'generated.zip'))
-    zip.extractall(os.path.join(dest_folder, 'generated'))
+    script_zip_files.append((os.path.join(generated_folder, 'generated.zip'), 'generated'))
+    return script_zip_files
 
+# Unzips the script files (.pyc) from the TS4 game executable folders into the destination folder.
+# Only py37dec needs this, it is an external executable that can only read .pyc files from disk.
+def unzip_script_files(zip_folder, dest_folder):
+    print('Extracting Zip files from game, please wait.')
+    for (zip_file, sub_folder) in get_script_zip_files(zip_folder):
+        zip = zipfile.ZipFile(zip_file)
+        zip.extractall(os.path.join(dest_folder, sub_folder))
+
+# Decompile a single .pyc file, falling back to the unpyc3 decompiler from the Utilities folder if the
+# selected decompiler does not produce a usable result.  This runs inside of a pool "thread", so any
+# messages are collected on the result and printed by the main "thread" to keep the output readable.
+def decompile_with_fallback(job):
+    from Utilities.compiler import decompile_file as unpyc3_decompile, write_decompiled
+    from Utilities.unpyc3 import dec_module_bytes
+    (srcFolder, destFolder, subFolder, pycFile, prefix_filenames, large_codeobjects_threshold, comment_style, decompiler, py37dec_timeout, split_result_folders, archive_member) = job
+    pyFile = os.path.splitext(pycFile)[0] + '.py'
+    pycFullFilename = get_job_pyc_filename(job)
+    pyc_data = None
+    if archive_member is not None:
+        # Files read out of a Zip file have no .pyc file next to them, the fallback writes straight to the destination folder.
+        pyc_data = read_archive_member(archive_member)
+        pyFullFilename = os.path.join(destFolder, subFolder, pyFile)
+    else:
+        pyFullFilename = os.path.join(srcFolder, subFolder, pyFile)
+    # The .pyc file is only removed once we know the fallback will not need it, so no backup copy is needed.
+    remove_pyc = srcFolder == destFolder and archive_member is None
+    result = decompile(srcFolder, destFolder, subFolder, pycFile, pyFile, prefix_filenames, large_codeobjects_threshold, comment_style, decompiler, py37dec_timeout, split_result_folders, remove_pyc=False, pyc_data=pyc_data, pycFullFilename=pycFullFilename)
+    if not is_success(result):
+        result.messages.append('Failed to decompile file, attempting to use alternative decompiler.')
+        if os.path.isfile(pyFullFilename):
+            os.remove(pyFullFilename)
+        try:
+            if pyc_data is not None:
+                os.makedirs(os.path.dirname(pyFullFilename), exist_ok=True)
+                fallback_success = write_decompiled(dec_module_bytes(pyc_data), pyFullFilename, throw_on_error=False)
+            else:
+                fallback_success = unpyc3_decompile(pycFullFilename, throw_on_error=False)
+        except:
+            fallback_success = False
+        if not fallback_success:
+            result.messages.append('Failed to decompile, even with alternative decompiler')
+        else:
+            result.messages.append('Success! File decompiled successfully via alternative method.')
+            if archive_member is None:
+                os.remove(pycFullFilename)
+            fallback_result = DecompileResultData(os.path.realpath(pycFullFilename))
+            fallback_result.pyFilename = os.path.realpath(pyFullFilename)
+            fallback_result.result = 1
+            fallback_result.messages = result.messages
+            result = fallback_result
+    elif remove_pyc:
+        os.remove(pycFullFilename)
+    return result
+
+# Worker mode keeps a set of long lived decompile "threads", each fed one file at a time over a pipe.
+# Unlike the pool, a file that takes longer than the timeout only costs us its worker: the worker is
+# stopped, the file is recorded as a timeout and a fresh worker takes its place.
+def decompile_worker(connection):
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        try:
+            connection.send((True, decompile_with_fallback(job)))
+        except Exception as ex:
+            connection.send((False, ex))
+
+# Builds the result for a file whose worker had to be stopped, writing a placeholder .py file the same
+# way decompile() does when py37dec times out or crashes.
+def stopped_worker_result(job, result_code, reason, elapsed):
+    (srcFolder, destFolder, subFolder, pycFile, prefix_filenames, _, comment_style, decompiler, _, split_result_folders, _) = job
+    pyFile = os.path.splitext(pycFile)[0] + '.py'
+    result = DecompileResultData(os.path.realpath(get_job_pyc_filename(job)))
+    result.decompile_time = elapsed
+    result.result = result_code
+    if prefix_filenames:
+        pyFile = ('[TIMEOUT] ' if result_code == 4 else '[FAILED] ') + pyFile
+    if split_result_folders:
+        pyFolder = os.path.join(destFolder, 'timeout' if result_code == 4 else 'decompile_failure', subFolder)
+    else:
+        pyFolder = os.path.join(destFolder, subFolder)
+    os.makedirs(pyFolder, exist_ok=True)
+    result.pyFilename = os.path.realpath(os.path.join(pyFolder, pyFile))
+    with open(result.pyFilename, 'w', encoding='UTF-8') as fp:
+        if comment_style == 1:
+            fp.write('# {}: {}\n'.format(decompiler, reason))
+        elif comment_style == 2:
+            fp.write('"""\n{}: {}\n"""\n'.format(decompiler, reason))
+    result.messages.append('{}, worker restarted.'.format(reason))
+    return result
+
+class DecompileWorkers():
+    def __init__(self, worker_count, timeout=None):
+        self.timeout = timeout
+        self.workers = [self.start_worker() for _ in range(worker_count)]
+
+    def start_worker(self):
+        connection, worker_connection = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=decompile_worker, args=(worker_connection,), daemon=True)
+        process.start()
+        worker_connection.close()
+        # [process, connection, index of the job being run, Timer started when the job was sent]
+        return [process, connection, None, None]
+
+    def stop_worker(self, worker):
+        worker[1].close()
+        worker[0].terminate()
+        worker[0].join()
+
+    # Decompile all jobs, returning the results in the same order as the jobs
+    def imap(self, jobs):
+        results = {}
+        next_job = 0
+        next_result = 0
+        while next_result < len(jobs):
+            for worker in self.workers:
+                if worker[2] is None and next_job < len(jobs):
+                    worker[1].send(jobs[next_job])
+                    worker[2] = next_job
+                    worker[3] = Timer()
+                    next_job += 1
+            busy_workers = [worker for worker in self.workers if worker[2] is not None]
+            wait_timeout = None
+            if self.timeout is not None:
+                wait_timeout = max(0, min([self.timeout - worker[3].elapsed_time() for worker in busy_workers]))
+            ready_connections = multiprocessing.connection.wait([worker[1] for worker in busy_workers], wait_timeout)
+            for index, worker in enumerate(self.workers):
+                if worker[2] is None:
+                    continue
+                job_index = worker[2]
+                if worker[1] in ready_connections:
+                    try:
+                        success, result = worker[1].recv()
+                    except EOFError:
+                        results[job_index] = stopped_worker_result(jobs[job_index], 3, 'Decompile worker crashed', worker[3].elapsed_time())
+                        self.stop_worker(worker)
+                        self.workers[index] = self.start_worker()
+                        continue
+                    if not success:
+                        raise result
+                    results[job_index] = result
+                    worker[2] = None
+                elif self.timeout is not None and worker[3].elapsed_time() >= self.timeout:
+                    results[job_index] = stopped_worker_result(jobs[job_index], 4, 'Timeout of {} seconds exceeded'.format(self.timeout), worker[3].elapsed_time())
+                    self.stop_worker(worker)
+                    self.workers[index] = self.start_worker()
+            while next_result in results:
+                yield results.pop(next_result)
+                next_result += 1
+
+    def close(self):
+        for worker in self.workers:
+            if worker[2] is None:
+                try:
+                    worker[1].send(None)
+                except OSError:
+                    pass
+            else:
+                worker[0].terminate()
+        for worker in self.workers:
+            worker[0].join()
+            worker[1].close()
+
+# The manifest lives in the destination folder and remembers, for every .pyc file, the hash of its contents,
+# the decompiler, its version and options used and the result.  A later run can then skip files that have
+# not changed since they were last decompiled, which after a game patch is most of them.
+MANIFEST_FILENAME = 'decompile_manifest.json'
+MANIFEST_VERSION = 2
+
+def load_manifest(dest_folder):
+    manifest_path = os.path.join(dest_folder, MANIFEST_FILENAME)
+    try:
+        with open(manifest_path, 'r', encoding='UTF-8') as fp:
+            manifest = json.load(fp)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest['files']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
+
+def save_manifest(dest_folder, manifest_files):
+    os.makedirs(dest_folder, exist_ok=True)
+    manifest_path = os.path.join(dest_folder, MANIFEST_FILENAME)
+    # Write to a temporary file first, an interrupted run should never leave a half written manifest.
+    with open(manifest_path + '.tmp', 'w', encoding='UTF-8') as fp:
+        json.dump({'version': MANIFEST_VERSION, 'files': manifest_files}, fp, indent=1, sort_keys=True)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+def hash_file(filename):
+    with open(filename, 'rb') as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+# Returns a hash of the decompiler and of the unpyc3 fallback from the Utilities folder, so that
+# updating either one means the previous results are not reused.
+def get_decompiler_version(decompiler):
+    from Utilities import unpyc3 as fallback_unpyc3
+    decompiler_location = unpyc3.__file__ if decompiler == 'unpyc3' else PY37DEC_LOCATION
+    return hashlib.sha256((hash_file(decompiler_location) + hash_file(fallback_unpyc3.__file__)).encode('utf-8')).hexdigest()
+
+# Returns the previous DecompileResultData of a file if the manifest shows it can be reused, otherwise None.
+# Failures and timeouts are never reused, a crashed or overloaded run should not stick to a file.
+def get_reusable_result(manifest_entry, pyc_hash, decompiler, decompiler_version, options, pycFullFilename, destFolder):
+    if manifest_entry is None or manifest_entry.get('hash') != pyc_hash or manifest_entry.get('decompiler') != decompiler or manifest_entry.get('decompiler_version') != decompiler_version or manifest_entry.get('options') != options:
+        return None
+    if manifest_entry['result'] not in (0, 1, 2):
+        return None
+    pyFilename = os.path.realpath(os.path.join(destFolder, manifest_entry['py']))
+    if not os.path.isfile(pyFilename):
+        return None
+    result = DecompileResultData(os.path.realpath(pycFullFilename))
+    result.pyFilename = pyFilename
+    result.result = manifest_entry['result']
+    result.decompile_time = manifest_entry['decompile_time']
+    result.analyze_time = manifest_entry['analyze_time']
+    return result
 
 # Launch "threads" and summarize results
-def main(src_folder, dest_folder, prefix_filenames=False, max_threads=DEFAULT_MAX_THREADS, results_file=None, test_large_codeobjects=False, large_codeobjects_threshold=10000, comment_style=0, py37dec_timeout=5, split_result_folders=False):
+# When archive_files, a list of (zip path, destination subfolder name) pairs, is given the .pyc files are read straight out
+# of those Zip files instead of being searched for in src_folder, which is then only used to report the results.
+def main(src_folder, dest_folder, prefix_filenames=False, max_threads=DEFAULT_MAX_THREADS, results_file=None, test_large_codeobjects=False, large_codeobjects_threshold=10000, comment_style=0, py37dec_timeout=5, split_result_folders=False, decompiler=None, force=False, prune_manifest=False, worker_timeout=None, archive_files=None):
     global total, DEFAULT_DECOMPILER
-    from shutil import copyfile
-    from Utilities.compiler import decompile_file as unpyc3_decompile
+    # The pool "threads" do not share our globals, so the decompiler to use is passed along with each file.
+    decompiler = decompiler or DECOMPILER or DEFAULT_DECOMPILER
 
     timer = Timer()
     if py37dec_timeout == 0:
         py37dec_timeout = None
 
-    # Create our "thread" pool
-    results = []
-    #pool = multiprocessing.Pool(processes=max_threads)
-
-    print('Decompiling all files in {} using {}, please wait'.format(src_folder, DEFAULT_DECOMPILER))
+    if archive_files is not None:
+        print('Decompiling all files in {} using {}, please wait'.format(', '.join([archive_path for (archive_path, _) in archive_files]), decompiler))
+    else:
+        print('Decompiling all files in {} using {}, please wait'.format(src_folder, decompiler))
 
-    # Search the source folder for all .pyc files and add a call to decompile()
-    # to the "thread" pool.
+    # Search the source folder for all .pyc files.  Folders and files are walked in sorted order so
+    # the results (and the CSV results file) come out in the same order on every run.
     srcFolder = os.path.realpath(src_folder)
     destFolder = os.path.realpath(dest_folder)
-    for root, subFolders, files in os.walk(src_folder):
-        files = [f for f in files if os.path.splitext(f)[1].lower() == '.pyc']
-        for pycFile in files:
-            total += 1
-            subFolder = os.path.relpath(root, srcFolder)
-            file_name = os.path.splitext(pycFile)[0]
-            pyFile = file_name + '.py'
-            pyFullFilename = os.path.join(srcFolder, subFolder, pyFile)
-            copiedFilePath = os.path.join(srcFolder, subFolder, pycFile + '_copied')
-            pycFullFilename = os.path.join(srcFolder, subFolder, pycFile)
-            copyfile(pycFullFilename, copiedFilePath)
-            sys.stdout.write(os.path.join(src_folder, subFolder, pycFile) + '\n')
-            result = decompile(srcFolder, destFolder, subFolder, pycFile, pyFile, prefix_filenames, large_codeobjects_threshold, comment_style, DECOMPILER, py37dec_timeout, split_result_folders)
-            if not is_success(result):
-                print('Failed to decompile file, attempting to use alternative decompiler.')
-                os.remove(pyFullFilename)
-                copyfile(copiedFilePath, pycFullFilename)
-                os.remove(copiedFilePath)
-                if not unpyc3_decompile(pycFullFilename, throw_on_error=False):
-                    print('Failed to decompile, even with alternative decompiler')
-                else:
-                    print('Success! File decompiled successfully via alternative method.')
+    remove_pyc = srcFolder == destFolder
+    # Any option that changes the contents of the decompiled files means the previous results cannot be reused.
+    options = [prefix_filenames, large_codeobjects_threshold, comment_style, split_result_folders, py37dec_timeout]
+    decompiler_version = get_decompiler_version(decompiler)
+    manifest = {} if force else load_manifest(destFolder)
+    jobs = []
+    if archive_files is not None:
+        # Each Zip file is decompiled into its own subfolder, laid out the same as if it had been extracted there.
+        for (archive_path, archive_folder) in archive_files:
+            archive_path = os.path.realpath(archive_path)
+            with zipfile.ZipFile(archive_path) as archive:
+                members = sorted([member for member in archive.infolist() if not member.is_dir() and os.path.splitext(member.filename)[1].lower() == '.pyc'], key=lambda member: member.filename)
+                for member in members:
+                    (memberFolder, pycFile) = os.path.split(member.filename)
+                    subFolder = os.path.normpath(os.path.join(archive_folder, memberFolder))
+                    manifest_key = os.path.normpath(os.path.join(subFolder, pycFile)).replace('\\', '/')
+                    pyc_hash = hashlib.sha256(archive.read(member)).hexdigest()
+                    job = (srcFolder, destFolder, subFolder, pycFile, prefix_filenames, large_codeobjects_threshold, comment_style, decompiler, py37dec_timeout, split_result_folders, (archive_path, member.filename))
+                    reusable_result = get_reusable_result(manifest.get(manifest_key), pyc_hash, decompiler, decompiler_version, options, get_job_pyc_filename(job), destFolder)
+                    jobs.append((manifest_key, pyc_hash, reusable_result, job))
+    else:
+        for root, subFolders, files in os.walk(src_folder):
+            subFolders.sort()
+            files = sorted([f for f in files if os.path.splitext(f)[1].lower() == '.pyc'])
+            for pycFile in files:
+                subFolder = os.path.relpath(root, srcFolder)
+                pycFullFilename = os.path.join(srcFolder, subFolder, pycFile)
+                manifest_key = os.path.normpath(os.path.join(subFolder, pycFile)).replace('\\', '/')
+                pyc_hash = hash_file(pycFullFilename)
+                reusable_result = get_reusable_result(manifest.get(manifest_key), pyc_hash, decompiler, decompiler_version, options, pycFullFilename, destFolder)
+                if reusable_result is not None and remove_pyc:
+                    # A fresh decompile would have removed the .pyc file as well.
                     os.remove(pycFullFilename)
-                    result = DecompileResultData(os.path.realpath(pycFullFilename))
-                    result.result = 1
+                jobs.append((manifest_key, pyc_hash, reusable_result, (srcFolder, destFolder, subFolder, pycFile, prefix_filenames, large_codeobjects_threshold, comment_style, decompiler, py37dec_timeout, split_result_folders, None)))
+    total = len(jobs)
+    if prune_manifest and total > 0:
+        # Forget about any file that no longer exists in the source folder.
+        found_keys = set([job[0] for job in jobs])
+        pruned_keys = [manifest_key for manifest_key in manifest if manifest_key not in found_keys]
+        for manifest_key in pruned_keys:
+            del manifest[manifest_key]
+        print('Pruned {} stale manifest entries'.format(len(pruned_keys)))
+
+    # Create our "thread" pool and add a call to decompile() for every file that cannot reuse a previous
+    # result.  imap() hands the results back in the order the files were found, and completed_callback()
+    # is only ever called from here in the main "thread", so the result buckets need no locking.
+    decompile_jobs = [job[3] for job in jobs if job[2] is None]
+    results = []
+    reused = 0
+    pool = None
+    workers = None
+    if worker_timeout is not None and decompile_jobs:
+        # A worker_timeout of 0 means no limit
+        workers = DecompileWorkers(min(max_threads, len(decompile_jobs)), worker_timeout or None)
+        decompiled_results = workers.imap(decompile_jobs)
+    elif max_threads > 1 and len(decompile_jobs) > 1:
+        pool = multiprocessing.Pool(processes=min(max_threads, len(decompile_jobs)))
+        decompiled_results = pool.imap(decompile_with_fallback, decompile_jobs, chunksize=1)
+    else:
+        decompiled_results = map(decompile_with_fallback, decompile_jobs)
+    try:
+        for (manifest_key, pyc_hash, result, job) in jobs:
+            sys.stdout.write(get_job_pyc_filename(job) + '\n')
+            if result is not None:
+                reused += 1
             else:
-                os.remove(copiedFilePath)
+                result = next(decompiled_results)
+                for message in result.messages:
+                    print(message)
+                manifest[manifest_key] = {
+                    'hash': pyc_hash,
+                    'decompiler': decompiler,
+                    'decompiler_version': decompiler_version,
+                    'options': options,
+                    'result': result.result,
+                    'py': os.path.relpath(result.pyFilename, destFolder) if result.pyFilename else '',
+                    'decompile_time': result.decompile_time,
+                    'analyze_time': result.analyze_time
+                }
             completed_callback(result)
             results.append(result)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if workers is not None:
+            workers.close()
+        close_archives()
+        save_manifest(destFolder, manifest)
 
     # Print results summary and CSV results file if requested
     sys.stdout.write('\b\b\b\b\b\b')
@@ -546,6 +914,8 @@ def main(src_folder, dest_folder, prefix_filenames=False, max_threads=DEFAULT_MA
     print('failure\t= {} ({:0.1f}%)'.format(len(failed), len(failed)/total*100))
     if len(timeout) > 0:
         print('timeout\t= {} ({:0.1f}%)'.format(len(timeout), len(timeout)/total*100))
+    if reused > 0:
+        print('reused\t= {} unchanged files from the previous run'.format(reused))
     print('{:0.2f} seconds'.format(timer.elapsed_time()))
 
     if results_file:
@@ -595,7 +965,10 @@ if __name__ == '__main__':
     parser.add_argument('-p', action='store_true', dest='prefix_filenames', help='prefix output filenames with [RESULT]')
     parser.add_argument('-t', nargs=1, type=int, metavar='N', default=[DEFAULT_MAX_THREADS], dest='max_threads', help='number of simultaneous decompile threads to use')
     parser.add_argument('-r', nargs='?', metavar='FILENAME', default=argparse.SUPPRESS, dest='results_file', help='create CSV file containing results for decompiled files')
-    parser.add_argument('-L', nargs='?', type=int, metavar='N', default=argparse.SUPPRESS, dest='large_codeobjects_threshold', help='code objects with >N bytes will not be analyzed')
+    parser.add_argument('-L', nargs='?', type=int, metavar='N', default=argparse.SUPPRESS, dest='large_codeobjects_threshold', help='differing code objects with >N bytes will not be diffed')
+    parser.add_argument('-W', nargs=1, type=int, metavar='SEC', default=[None], dest='worker_timeout', help='use persistent decompile workers, restarting any worker that takes more than SEC seconds on a file (0=no limit)')
+    parser.add_argument('--force', action='store_true', dest='force', help='decompile every file, even those unchanged since the previous run')
+    parser.add_argument('--prune', action='store_true', dest='prune_manifest', help='remove manifest entries for files no longer in the source folder')
     parser.add_argument('-c', nargs=1, metavar='none|detail', choices=['none', 'detail'], default=argparse.SUPPRESS, dest='comment_style', help='prefix decompiled files with test results comment (default brief)')
     if UNPYC3_AVAILABLE:
         parser.add_argument('-U', action='store_true', dest='use_unpyc3', help='use unpyc3 for decompilation')
@@ -630,7 +1003,13 @@ if __name__ == '__main__':
             comment_style = 2
     if not hasattr(args, 'py37dec_timeout'):
         args.py37dec_timeout = [0]
+    archive_files = None
     if args.src_folder[0] is None:
-        unzip_script_files(args.zip_folder[0], args.dest_folder[0])
-        args.src_folder[0] = args.dest_folder[0]
-    main(args.src_folder[0], args.dest_folder[0], prefix_filenames=args.prefix_filenames, max_threads=args.max_threads[0], results_file=args.results_file, large_codeobjects_threshold=args.large_codeobjects_threshold, comment_style=comment_style, py37dec_timeout=args.py37dec_timeout[0], split_result_folders=args.split_result_folders)
+        if DECOMPILER == 'unpyc3':
+            # unpyc3 reads the .pyc files straight out of the game's Zip files, so nothing is extracted.
+            archive_files = get_script_zip_files(args.zip_folder[0])
+            args.src_folder[0] = args.zip_folder[0]
+        else:
+            unzip_script_files(args.zip_folder[0], args.dest_folder[0])
+            args.src_folder[0] = args.dest_folder[0]
+    main(args.src_folder[0], args.dest_folder[0], prefix_filenames=args.prefix_filenames, max_threads=args.max_threads[0], results_file=args.results_file, large_codeobjects_threshold=args.large_codeobjects_threshold, comment_style=comment_style, py37dec_timeout=args.py37dec_timeout[0], split_result_folders=args.split_result_folders, decompiler=DECOMPILER, force=args.force, prune_manifest=args.prune_manifest, worker_timeout=args.worker_timeout[0], archive_files=archive_files)